@@ -0,0 +1,97 @@
+"""
+Fixtures for benchmarking startreusableapp.py itself.
+
+Everything runs offline: Bootstrap comes from a locally built dist archive
+loaded into a throwaway asset cache, ``pip`` is replaced by the stub package
+in stubs/pip, and the startapp path uses the stub project in stubs/project.
+"""
+import os
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARKS_DIR)
+SCRIPT = os.path.join(REPO_DIR, 'startreusableapp.py')
+STUBS_DIR = os.path.join(BENCHMARKS_DIR, 'stubs')
+STUB_PROJECT_DIR = os.path.join(STUBS_DIR, 'project')
+
+sys.path.insert(0, REPO_DIR)
+
+# Flags shared by every scaffold benchmark
+COMMON_FLAGS = ['--no-input', '--no-color']
+
+# The flag combinations the end-to-end benchmarks cover
+FLAG_COMBINATIONS = {
+    'minimal': [
+        '--builtin-skeleton', '--no-views', '--no-drf', '--no-tests', '--no-precommit',
+        '--no-ci', '--no-management-commands', '--no-install',
+    ],
+    'minimal-startapp': [
+        '--no-views', '--no-drf', '--no-tests', '--no-precommit',
+        '--no-ci', '--no-management-commands', '--no-install',
+    ],
+    'drf': [
+        '--builtin-skeleton', '--no-views', '--with-drf', '--no-oauth', '--no-tests', '--no-precommit',
+        '--no-ci', '--no-management-commands', '--no-install',
+    ],
+    'full': [
+        '--builtin-skeleton', '--with-views', '--with-bootstrap', '--with-drf', '--with-oauth',
+        '--with-tests', '--with-precommit', '--with-ci', '--with-management-commands', '--install',
+    ],
+}
+
+
+@pytest.fixture(scope='session')
+def bootstrap_archive(tmp_path_factory):
+    """A small stand-in for Bootstrap's release zip."""
+    path = tmp_path_factory.mktemp('bootstrap') / 'bootstrap-dist.zip'
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name in ('css/bootstrap.css', 'css/bootstrap.min.css',
+                     'js/bootstrap.bundle.js', 'js/bootstrap.bundle.min.js'):
+            archive.writestr(f'bootstrap-dist/{name}', f'/* {name} */\n' * 2000)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def scaffold_env(tmp_path_factory, bootstrap_archive):
+    """Environment and extra flags that keep a scaffold run offline."""
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(filter(None, [STUBS_DIR, os.environ.get('PYTHONPATH')])),
+        GIT_AUTHOR_NAME='Benchmark', GIT_AUTHOR_EMAIL='benchmark@example.com',
+        GIT_COMMITTER_NAME='Benchmark', GIT_COMMITTER_EMAIL='benchmark@example.com',
+    )
+    flags = [
+        '--asset-cache', str(tmp_path_factory.mktemp('asset-cache')),
+        '--bootstrap-archive', bootstrap_archive,
+    ]
+    return env, flags
+
+
+@pytest.fixture
+def run_scaffold(scaffold_env):
+    """Run startreusableapp.py with ``arguments``, failing the benchmark if it fails."""
+    env, offline_flags = scaffold_env
+
+    def run(arguments):
+        subprocess.run(
+            [sys.executable, SCRIPT, *arguments, *COMMON_FLAGS, *offline_flags],
+            cwd=STUB_PROJECT_DIR, env=env, check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+
+    return run
+
+
+def tree_size(path):
+    """(file count, total bytes) of everything under ``path`` except .git."""
+    files = size = 0
+    for directory, dirnames, filenames in os.walk(path):
+        dirnames[:] = [name for name in dirnames if name != '.git']
+        for filename in filenames:
+            files += 1
+            size += os.path.getsize(os.path.join(directory, filename))
+    return files, size
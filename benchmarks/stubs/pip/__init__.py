@@ -0,0 +1 @@
+"""Stand-in for pip so benchmarks of ``--install`` never touch the network."""
@@ -0,0 +1,9 @@
+import os
+import sys
+
+print('pip (benchmark stub)', *sys.argv[1:])
+
+# Tests count pip runs in this file
+if os.environ.get('PIP_STUB_LOG'):
+    with open(os.environ['PIP_STUB_LOG'], 'a') as log:
+        log.write(' '.join(sys.argv[1:]) + '\n')
@@ -0,0 +1,31 @@
+"""Stand-in for a Django project's manage.py that only knows `startapp`.
+
+It writes the same files Django's app template would, so the startapp code
+path can be benchmarked without Django or a real project.
+"""
+import os
+import sys
+
+if sys.argv[1:2] != ['startapp']:
+    sys.exit(f'manage.py (benchmark stub): unsupported command {sys.argv[1:]}')
+name, target = sys.argv[2], sys.argv[3]
+camel_case_name = ''.join(x for x in name.title() if x != '_')
+files = {
+    '__init__.py': '',
+    'admin.py': 'from django.contrib import admin\n\n# Register your models here.\n',
+    'apps.py': (
+        'from django.apps import AppConfig\n\n\n'
+        f'class {camel_case_name}Config(AppConfig):\n'
+        "    default_auto_field = 'django.db.models.BigAutoField'\n"
+        f"    name = '{name}'\n"
+    ),
+    'migrations/__init__.py': '',
+    'models.py': 'from django.db import models\n\n# Create your models here.\n',
+    'tests.py': 'from django.test import TestCase\n\n# Create your tests here.\n',
+    'views.py': 'from django.shortcuts import render\n\n# Create your views here.\n',
+}
+for path, content in files.items():
+    path = os.path.join(target, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write(content)
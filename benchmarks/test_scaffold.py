@@ -0,0 +1,54 @@
+"""
+End-to-end benchmarks: how long it takes to create an app (or a batch of them).
+"""
+import itertools
+import json
+import os
+
+import pytest
+
+from conftest import FLAG_COMBINATIONS, tree_size
+
+pytest.importorskip('pytest_benchmark')
+
+ROUNDS = 5
+BATCH_SIZE = 10
+
+counter = itertools.count()
+
+
+@pytest.mark.parametrize('combination', sorted(FLAG_COMBINATIONS))
+def test_scaffold(benchmark, run_scaffold, tmp_path, combination):
+    """Create one app with each flag combination."""
+    def setup():
+        app_name = f'bench{next(counter)}'
+        return ([app_name, str(tmp_path), *FLAG_COMBINATIONS[combination]],), {}
+
+    benchmark.pedantic(run_scaffold, setup=setup, rounds=ROUNDS)
+
+    files, size = tree_size(os.path.join(tmp_path, os.listdir(tmp_path)[0]))
+    benchmark.extra_info.update(files=files, bytes=size)
+
+
+def test_scaffold_batch(benchmark, run_scaffold, tmp_path):
+    """Create BATCH_SIZE apps with every feature from one manifest."""
+    def setup():
+        parent_dir = tmp_path / f'batch{next(counter)}'
+        manifest = tmp_path / f'{parent_dir.name}.json'
+        manifest.write_text(json.dumps({
+            'defaults': {
+                'parent_dir': str(parent_dir),
+                'builtin_skeleton': True,
+                'with_drf': True,
+                'with_oauth': True,
+                'with_tests': True,
+                'with_ci': True,
+                'with_views': False,
+                'install_now': False,
+            },
+            'apps': [{'app_name': f'app{number}'} for number in range(BATCH_SIZE)],
+        }))
+        return (['--manifest', str(manifest), '--workers', '4'],), {}
+
+    benchmark.pedantic(run_scaffold, setup=setup, rounds=ROUNDS)
+    benchmark.extra_info['apps'] = BATCH_SIZE
@@ -0,0 +1,39 @@
+"""
+Startup benchmarks: how long the command takes to start, from a checkout and from a zipapp.
+"""
+import subprocess
+import sys
+
+import pytest
+
+import startreusableapp
+from conftest import SCRIPT
+
+pytest.importorskip('pytest_benchmark')
+
+ROUNDS = 20
+
+
+@pytest.fixture(scope='session')
+def zipapp(tmp_path_factory):
+    """startreusableapp.py and its templates, built with --build-zipapp."""
+    path = tmp_path_factory.mktemp('zipapp') / 'startreusableapp.pyz'
+    subprocess.run([sys.executable, SCRIPT, '--build-zipapp', str(path)], check=True, stdout=subprocess.DEVNULL)
+    return str(path)
+
+
+@pytest.mark.parametrize('distribution', ['script', 'zipapp'])
+def test_startup(benchmark, zipapp, distribution):
+    """Start a fresh interpreter and print the --help text."""
+    command = [sys.executable, SCRIPT if distribution == 'script' else zipapp, '--help']
+    benchmark.pedantic(subprocess.run, (command,), {'check': True, 'stdout': subprocess.DEVNULL}, rounds=ROUNDS)
+
+
+def test_load_bundle(benchmark):
+    """Unpack a compressed template bundle and compile it, as a zipapp does."""
+    sources = startreusableapp.read_template_directory(startreusableapp.template_registry().directory)
+    bundle = startreusableapp.pack_template_bundle(sources)
+
+    registry = benchmark(lambda: startreusableapp.TemplateRegistry(None, startreusableapp.unpack_template_bundle(bundle)))
+    assert registry.templates.keys() == startreusableapp.template_registry().templates.keys()
+    benchmark.extra_info.update(templates=len(registry.templates), bytes=len(bundle))
@@ -0,0 +1,39 @@
+"""
+Template benchmarks: loading the registry and rendering from memory.
+"""
+import argparse
+
+import pytest
+
+import startreusableapp
+
+pytest.importorskip('pytest_benchmark')
+
+
+def substitutions():
+    args = argparse.Namespace(app_name='benchmark-app', package_prefix='django-')
+    return startreusableapp.template_substitutions(args) | {
+        'install_requires': "        'django-compressor',",
+        'bootstrap_css': 'bootstrap.css',
+        'bootstrap_js': 'bootstrap.bundle.js',
+        'example_index_name': 'benchmark_a_user_id_85b872_idx',
+        'batch_model': "'benchmark_app.ExampleModel'",
+    }
+
+
+def test_load_registry(benchmark):
+    """Read and compile every file under template_files/."""
+    registry = benchmark(startreusableapp.TemplateRegistry, startreusableapp.template_registry().directory)
+    benchmark.extra_info['templates'] = len(registry.templates)
+
+
+def test_render_all_templates(benchmark):
+    """Render every template once; extra_info has the output size."""
+    registry = startreusableapp.template_registry()
+    values = substitutions()
+
+    def render_all():
+        return sum(len(registry.render(name, values)) for name in registry.templates)
+
+    rendered_bytes = benchmark(render_all)
+    benchmark.extra_info.update(templates=len(registry.templates), bytes=rendered_bytes)
@@ -1,78 +1,179 @@
 import sys
 import os
 import errno
-import argparse
 import subprocess
-import fileinput
+import functools
+import json
+import shlex
+import shutil
+import tempfile
+import time
+import threading
+import hashlib
+import itertools
+import struct
+import contextlib
+import dataclasses
+import types
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from string import Template
 
 
 description = 'This creates a reusable Django app'
 
-# Parse script arguments
-parser = argparse.ArgumentParser(description=description)
-parser.add_argument('app_name', help='Name of the Django app to create')
-parser.add_argument('parent_dir', help='Parent directory where the app will be created')
-parser.add_argument('--no-input', dest='no_input', default=False, action='store_true',
-                    help='Run without interactive prompts (use with other flags to specify options)')
-parser.add_argument('--no-color', dest='no_color', default=False, action='store_true',
-                    help='Disable colored output')
-parser.add_argument('--prefix', dest='add_prefix', default=False, action='store_true',
-                    help='Prefix package name with "django-"')
-parser.add_argument('--editor', dest='editor', default='nano',
-                    help='Editor to use for file editing (default: nano)')
-parser.add_argument('--with-bootstrap', dest='with_bootstrap', default=None, action='store_true',
-                    help='Include Bootstrap, django-compressor, and django-bootstrap5')
-parser.add_argument('--no-bootstrap', dest='with_bootstrap', action='store_false',
-                    help='Skip Bootstrap setup')
-parser.add_argument('--with-drf', dest='with_drf', default=None, action='store_true',
-                    help='Include Django REST Framework scaffold')
-parser.add_argument('--no-drf', dest='with_drf', action='store_false',
-                    help='Skip DRF setup')
-parser.add_argument('--with-oauth', dest='with_oauth', default=None, action='store_true',
-                    help='Include OAuth2 authentication setup (requires --with-drf)')
-parser.add_argument('--no-oauth', dest='with_oauth', action='store_false',
-                    help='Skip OAuth setup')
-parser.add_argument('--with-tests', dest='with_tests', default=None, action='store_true',
-                    help='Include pytest testing scaffold with sample tests')
-parser.add_argument('--no-tests', dest='with_tests', action='store_false',
-                    help='Skip testing scaffold')
-parser.add_argument('--with-management-commands', dest='with_mgmt_commands', default=None, action='store_true',
-                    help='Include management commands scaffold')
-parser.add_argument('--no-management-commands', dest='with_mgmt_commands', action='store_false',
-                    help='Skip management commands scaffold')
-parser.add_argument('--with-precommit', dest='with_precommit', default=None, action='store_true',
-                    help='Include pre-commit hooks and pyproject.toml')
-parser.add_argument('--no-precommit', dest='with_precommit', action='store_false',
-                    help='Skip pre-commit configuration')
-parser.add_argument('--with-ci', dest='with_ci', default=None, action='store_true',
-                    help='Include GitHub Actions CI/CD workflow')
-parser.add_argument('--no-ci', dest='with_ci', action='store_false',
-                    help='Skip CI/CD configuration')
-parser.add_argument('--with-views', dest='with_views', default=None, action='store_true',
-                    help='Add templates, static, and IndexView scaffold')
-parser.add_argument('--no-views', dest='with_views', action='store_false',
-                    help='Skip view scaffold')
-parser.add_argument('--install', dest='install_now', default=None, action='store_true',
-                    help='Install with pip immediately after creation')
-parser.add_argument('--no-install', dest='install_now', action='store_false',
-                    help='Skip pip installation')
-args = parser.parse_args()
+
+def build_parser():
+    """The command-line parser. Only main() needs it, so importing this module doesn't build it."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('app_name', nargs='?', help='Name of the Django app to create')
+    parser.add_argument('parent_dir', nargs='?', help='Parent directory where the app will be created')
+    parser.add_argument('--build-zipapp', dest='build_zipapp', default=None, metavar='FILE',
+                        help='Pack this script and its templates into one executable .pyz file, then exit')
+    parser.add_argument('--manifest', dest='manifest', default=None,
+                        help='Create every app listed in a TOML or JSON manifest file (batch mode)')
+    parser.add_argument('--workers', dest='workers', type=int, default=4,
+                        help='Number of apps to create at the same time in batch mode (default: 4)')
+    parser.add_argument('--no-input', dest='no_input', default=False, action='store_true',
+                        help='Run without interactive prompts (use with other flags to specify options)')
+    parser.add_argument('--no-color', dest='no_color', default=False, action='store_true',
+                        help='Disable colored output')
+    parser.add_argument('--quiet', dest='quiet', default=False, action='store_true',
+                        help="Only print errors (and the output of failing commands)")
+    parser.add_argument('--prefix', dest='add_prefix', default=False, action='store_true',
+                        help='Prefix package name with "django-"')
+    parser.add_argument('--editor', dest='editor', default='nano',
+                        help='Editor to use for file editing (default: nano)')
+    parser.add_argument('--builtin-skeleton', dest='builtin_skeleton', default=False, action='store_true',
+                        help="Create the app skeleton from bundled templates instead of running "
+                             "`manage.py startapp` (no Django project needed)")
+    parser.add_argument('--git-backend', dest='git_backend', default='fast-import', choices=['fast-import', 'porcelain'],
+                        help="How to create the initial commits: one `git fast-import` process (default) "
+                             "or separate git init/add/commit/checkout commands")
+    parser.add_argument('--project-dir', dest='project_dir', default='.',
+                        help="Django project whose manage.py runs startapp (default: the current directory)")
+    parser.add_argument('--dry-run', dest='dry_run', default=False, action='store_true',
+                        help="Print the files that would be created, without writing anything")
+    parser.add_argument('--with-bootstrap', dest='with_bootstrap', default=None, action='store_true',
+                        help='Include Bootstrap, django-compressor, and django-bootstrap5')
+    parser.add_argument('--no-bootstrap', dest='with_bootstrap', action='store_false',
+                        help='Skip Bootstrap setup')
+    parser.add_argument('--bootstrap-version', dest='bootstrap_version', default='5.3.3',
+                        help='Bootstrap release to use (default: 5.3.3)')
+    parser.add_argument('--bootstrap-minified', dest='bootstrap_minified', default=False, action='store_true',
+                        help='Only add the minified Bootstrap files')
+    parser.add_argument('--bootstrap-archive', dest='bootstrap_archive', default=None,
+                        help='Fill the asset cache from a Bootstrap dist .zip/.tar.gz instead of the network')
+    parser.add_argument('--asset-cache', dest='asset_cache', default=default_asset_cache(),
+                        help='Directory for cached assets (default: ~/.cache/startreusableapp)')
+    parser.add_argument('--with-drf', dest='with_drf', default=None, action='store_true',
+                        help='Include Django REST Framework scaffold')
+    parser.add_argument('--no-drf', dest='with_drf', action='store_false',
+                        help='Skip DRF setup')
+    parser.add_argument('--with-oauth', dest='with_oauth', default=None, action='store_true',
+                        help='Include OAuth2 authentication setup (requires --with-drf)')
+    parser.add_argument('--no-oauth', dest='with_oauth', action='store_false',
+                        help='Skip OAuth setup')
+    parser.add_argument('--with-bulk-api', dest='with_bulk_api', default=None, action='store_true',
+                        help='Include bulk create/update/delete endpoints (requires --with-oauth)')
+    parser.add_argument('--no-bulk-api', dest='with_bulk_api', action='store_false',
+                        help='Skip bulk endpoints')
+    parser.add_argument('--with-caching', dest='with_caching', default=None, action='store_true',
+                        help='Add ETag/Last-Modified conditional GETs and a per-user cache (requires --with-oauth)')
+    parser.add_argument('--no-caching', dest='with_caching', action='store_false',
+                        help='Skip caching')
+    parser.add_argument('--with-benchmarks', dest='with_benchmarks', default=None, action='store_true',
+                        help='Add pytest-benchmark microbenchmarks and a load test (requires --with-oauth and --with-tests)')
+    parser.add_argument('--no-benchmarks', dest='with_benchmarks', action='store_false',
+                        help='Skip benchmarks')
+    parser.add_argument('--with-async', dest='with_async', default=None, action='store_true',
+                        help='Add async (ASGI) views using the async ORM (requires --with-oauth)')
+    parser.add_argument('--no-async', dest='with_async', action='store_false',
+                        help='Skip async views')
+    parser.add_argument('--with-instrumentation', dest='with_instrumentation', default=None, action='store_true',
+                        help='Add middleware that reports per-request SQL count and latency')
+    parser.add_argument('--no-instrumentation', dest='with_instrumentation', action='store_false',
+                        help='Skip instrumentation middleware')
+    parser.add_argument('--with-tests', dest='with_tests', default=None, action='store_true',
+                        help='Include pytest testing scaffold with sample tests')
+    parser.add_argument('--no-tests', dest='with_tests', action='store_false',
+                        help='Skip testing scaffold')
+    parser.add_argument('--with-management-commands', dest='with_mgmt_commands', default=None, action='store_true',
+                        help='Include management commands scaffold')
+    parser.add_argument('--no-management-commands', dest='with_mgmt_commands', action='store_false',
+                        help='Skip management commands scaffold')
+    parser.add_argument('--with-precommit', dest='with_precommit', default=None, action='store_true',
+                        help='Include pre-commit hooks and pyproject.toml')
+    parser.add_argument('--no-precommit', dest='with_precommit', action='store_false',
+                        help='Skip pre-commit configuration')
+    parser.add_argument('--with-ci', dest='with_ci', default=None, action='store_true',
+                        help='Include GitHub Actions CI/CD workflow')
+    parser.add_argument('--no-ci', dest='with_ci', action='store_false',
+                        help='Skip CI/CD configuration')
+    parser.add_argument('--with-views', dest='with_views', default=None, action='store_true',
+                        help='Add templates, static, and IndexView scaffold')
+    parser.add_argument('--no-views', dest='with_views', action='store_false',
+                        help='Skip view scaffold')
+    parser.add_argument('--timings', dest='timings', default=False, action='store_true',
+                        help='Print how long each phase, template and command took')
+    parser.add_argument('--timings-json', dest='timings_json', default=None,
+                        help='Write the timings of every app to this JSON file')
+    parser.add_argument('--profile', dest='profile', default=None,
+                        help='Write a cProfile dump of the whole run to this file')
+    parser.add_argument('--install', dest='install_now', default=None, action='store_true',
+                        help='Install with pip immediately after creation')
+    parser.add_argument('--no-install', dest='install_now', action='store_false',
+                        help='Skip pip installation')
+    parser.add_argument('--find-links', dest='find_links', default=None,
+                        help='Install dependencies from this wheelhouse directory (or URL) too')
+    parser.add_argument('--no-index', dest='no_index', default=False, action='store_true',
+                        help="Install without PyPI, from --find-links only (offline)")
+    parser.add_argument('--no-build-isolation', dest='no_build_isolation', default=False, action='store_true',
+                        help='Build the apps with the current environment instead of a fresh one per install')
+    return parser
+
 
 # Important directories
 this_script_dir = os.path.dirname(os.path.realpath(__file__))
-initial_cwd = os.getcwd()
-repo_dir = ''
-parent_dir = ''
-project_dir = ''
-templates_dir = ''
-static_dir = ''
-
-# More user config
-editor = 'nano'
-package_prefix = ''
-
-# Fancy text
+
+# The templates' file in a zipapp (see build_zipapp()), and its first bytes
+TEMPLATE_BUNDLE = 'template_files.bundle'
+TEMPLATE_BUNDLE_MAGIC = b'SRATPL1\n'
+
+# A zipapp's entry point: startreusableapp.py is packed next to it as a module
+ZIPAPP_MAIN = """import sys
+
+from startreusableapp import main
+
+sys.exit(main())
+"""
+
+# Config options that can't be set per app in a manifest
+BATCH_ONLY_OPTIONS = {'no_color'}
+
+# The features `verify` combines: {name: (Config field, features it needs)}.
+# Bootstrap, pre-commit and CI only add assets and config, so they stay off.
+VERIFY_FEATURES = {
+    'views': ('with_views', ()),
+    'drf': ('with_drf', ()),
+    'oauth': ('with_oauth', ('drf',)),
+    'bulk-api': ('with_bulk_api', ('oauth',)),
+    'caching': ('with_caching', ('oauth',)),
+    'async': ('with_async', ('oauth',)),
+    'instrumentation': ('with_instrumentation', ()),
+    'management-commands': ('with_mgmt_commands', ()),
+    'benchmarks': ('with_benchmarks', ('oauth',)),
+}
+
+# Every app `verify` creates has this name; each gets its own directory and test process
+VERIFY_APP_NAME = 'verifyapp'
+
+# Fancy text (see text_styles())
 fancy_text = {
     'purple': '\033[95m',
     'cyan': '\033[96m',
@@ -81,65 +182,262 @@ fancy_text = {
     'b': '\033[1m',
     'end': '\033[0m',
 }
-if args.no_color:
-    fancy_text = { key:'' for (key, value) in fancy_text.items() }
 
 
-def main():
-    global editor, package_prefix
-    if not os.path.isfile('manage.py'):
-        print("{red}Run this baby from a Django project's root directory.{end}".format(**fancy_text))
-        sys.exit()
+class ScaffoldError(Exception):
+    """Raised when an app can't be created."""
+
+
+class CommandError(ScaffoldError):
+    """Raised when a command can't be started or exits with a non-zero status."""
+
+
+def default_asset_cache():
+    return os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'startreusableapp')
+
+
+@dataclasses.dataclass
+class Config:
+    """Everything needed to create one app. Field names match the command-line options' ``dest``.
+
+    Unlike the command line, ``no_input`` defaults to True: a library caller
+    can't answer prompts, so unset ``with_*`` options take the prompts'
+    defaults. ``install_now`` is the exception: it defaults to False, so
+    generate() only runs pip when asked to (None asks, which without input
+    means yes). ``project_dir`` is where ``manage.py startapp`` runs; relative
+    paths are resolved against the current working directory. With ``quiet``,
+    nothing but errors is printed.
+    """
+    app_name: str
+    parent_dir: str
+    project_dir: str = '.'
+    no_input: bool = True
+    no_color: bool = False
+    quiet: bool = False
+    add_prefix: bool = False
+    editor: str = 'nano'
+    builtin_skeleton: bool = False
+    git_backend: str = 'fast-import'
+    dry_run: bool = False
+    with_bootstrap: bool | None = None
+    bootstrap_version: str = '5.3.3'
+    bootstrap_minified: bool = False
+    bootstrap_archive: str | None = None
+    asset_cache: str = dataclasses.field(default_factory=default_asset_cache)
+    with_drf: bool | None = None
+    with_oauth: bool | None = None
+    with_bulk_api: bool | None = None
+    with_caching: bool | None = None
+    with_async: bool | None = None
+    with_benchmarks: bool | None = None
+    with_instrumentation: bool | None = None
+    with_tests: bool | None = None
+    with_mgmt_commands: bool | None = None
+    with_precommit: bool | None = None
+    with_ci: bool | None = None
+    with_views: bool | None = None
+    timings: bool = False
+    install_now: bool | None = False
+    find_links: str | None = None
+    no_index: bool = False
+    no_build_isolation: bool = False
+
+
+CONFIG_FIELDS = {field.name for field in dataclasses.fields(Config)}
+
+
+@dataclasses.dataclass
+class Result:
+    """What generate() did for one Config.
+
+    ``error`` is the exception that stopped the app (None on success),
+    ``files`` the repo-relative paths of the planned files, ``commands`` the
+    (command, exit status, seconds) of every command that ran, and
+    ``timings`` the Timings report. ``install`` describes the `pip install`
+    run that installed the app (shared by every app in a batch): its
+    ``apps``, ``command``, ``returncode`` and ``seconds``.
+    """
+    config: Config
+    repo_dir: str | None = None
+    files: list = dataclasses.field(default_factory=list)
+    commands: list = dataclasses.field(default_factory=list)
+    timings: dict | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+    install: dict | None = None
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+
+def generate(config):
+    """Create the app described by ``config`` and return a Result.
+
+    Safe to call from several threads at once: every call works on its own
+    copy of ``config`` and never changes the working directory or any module
+    state. Failures are returned in ``Result.error`` instead of raised.
+    """
+    args = types.SimpleNamespace(**dataclasses.asdict(config))
+    args.fancy_text = text_styles(config.no_color)
+    result = Result(config)
+    started = time.monotonic()
+    try:
+        create_app(args)
+    except Exception as exc:
+        result.error = exc
+    finally:
+        result.elapsed = time.monotonic() - started
+        result.repo_dir = getattr(args, 'repo_dir', None)
+        if hasattr(args, 'plan'):
+            result.files = sorted(args.plan.files)
+        if hasattr(args, 'runner'):
+            result.commands = list(args.runner.results)
+        if hasattr(args, 'timings_report'):
+            result.timings = args.timings_report.report()
+        result.install = getattr(args, 'install', None)
+    return result
+
+
+def generate_many(configs, workers=4):
+    """generate() every Config in ``configs``, ``workers`` at a time, returning Results in order.
+
+    Apps that would be installed (see installs_now()) aren't installed one
+    by one: once they're all created, install_apps() installs them together.
+    """
+    deferred = [dataclasses.replace(config, install_now=False) if installs_now(config) else config
+                for config in configs]
+    if workers <= 1:
+        results = [generate(config) for config in deferred]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(generate, deferred))
+    for result, config in zip(results, configs):
+        result.config = config
+    install_apps(results)
+    return results
+
+
+def installs_now(config):
+    """Whether generate() would install the app: ``install_now`` None asks, and without input that's yes."""
+    if config.install_now is None:
+        return config.no_input
+    return config.install_now
+
+
+def pip_install_command(repo_dirs, find_links=None, no_index=False, no_build_isolation=False, python=sys.executable):
+    """One `pip install` of every app in ``repo_dirs`` (editable), resolved together."""
+    command = [python, '-m', 'pip', 'install']
+    if find_links:
+        command += ['--find-links', find_links]
+    if no_index:
+        command.append('--no-index')
+    if no_build_isolation:
+        command.append('--no-build-isolation')
+    for repo_dir in repo_dirs:
+        command += ['-e', repo_dir]
+    return command
+
+
+def install_apps(results):
+    """Install the created apps in ``results`` whose Config installs_now().
+
+    Apps that share pip options are installed by a single `pip install`, so
+    dependencies are resolved (and the index is hit) once, not once per app.
+    If that fails, every app in it gets the error.
+    """
+    groups = {}
+    for result in results:
+        config = result.config
+        if result.succeeded and installs_now(config) and not config.dry_run:
+            key = (config.find_links, config.no_index, config.no_build_isolation)
+            groups.setdefault(key, []).append(result)
+
+    for (find_links, no_index, no_build_isolation), group in groups.items():
+        runner = CommandRunner(Timings('install'), text_styles(group[0].config.no_color),
+                               quiet=all(result.config.quiet for result in group))
+        command = pip_install_command([result.repo_dir for result in group], find_links, no_index, no_build_isolation)
+        error = None
+        try:
+            runner.run(command)
+        except CommandError as exc:
+            error = exc
+        returncode, seconds = runner.results[-1][1:] if runner.results else (None, 0.0)
+        install = {'apps': [result.config.app_name for result in group], 'command': shlex.join(command),
+                   'returncode': returncode, 'seconds': seconds}
+        for result in group:
+            result.install = install
+            result.commands.extend(runner.results)
+            if error is not None:
+                result.error = error
+
+
+def text_styles(no_color=False):
+    """The ``fancy_text`` escape codes to format output with (all blank for ``no_color``)."""
+    if no_color:
+        return {key: '' for key in fancy_text}
+    return fancy_text
+
+
+def create_app(args):
+    """Create one reusable app as described by ``args``, generate()'s private copy of a Config.
+
+    All per-app state lives on ``args`` (the repo directory, package prefix,
+    editor and render plan are added to it here) and every path is built from
+    ``repo_dir`` and ``project_dir`` instead of changing the working
+    directory, so several apps can be created at the same time.
+
+    Nothing is written while the questions are asked: the whole app is built
+    as a RenderPlan in memory first, then flushed to disk in one pass.
+
+    If the app already exists with a lock file, it is upgraded instead: the
+    features it was created with are kept, and only files whose rendered
+    content changed are written and committed (see upgrade_repo()).
+    """
+    timings = args.timings_report = Timings(args.app_name)
+    timings.phase('plan')
+    lock = args.lock = find_lock(args)
+    args.previous_features = lock['features'] if lock else {}
+    args.features = {}
+    if (not lock and not args.builtin_skeleton and not args.dry_run
+            and not os.path.isfile(os.path.join(args.project_dir, 'manage.py'))):
+        raise ScaffoldError(f"No manage.py in {args.project_dir}: run this baby from a Django project's "
+                            "root directory (or use --project-dir or --builtin-skeleton).")
 
     # Set editor from args or ask user
-    if args.editor != 'nano':
-        editor = args.editor
-    elif not args.no_input:
-        user_input = input("{purple}What command should we use to edit files?{end} [nano] ".format(**fancy_text))
+    if args.editor == 'nano' and not args.no_input:
+        user_input = input("{purple}What command should we use to edit files?{end} [nano] ".format(**args.fancy_text))
         if user_input != '':
-            editor = user_input
+            args.editor = user_input
 
     # Set package prefix from args or ask user
-    if args.add_prefix:
-        package_prefix = 'django-'
-    elif user_yesno("Prefix the new package name with \"django-\"?", default='n'):
-        package_prefix = 'django-'
+    args.package_prefix = ''
+    if lock:
+        args.package_prefix = lock['package_prefix']
+        apply_locked_options(args, lock)
+    elif args.add_prefix:
+        args.package_prefix = 'django-'
+    elif user_yesno(args, "Prefix the new package name with \"django-\"?", default='n'):
+        args.package_prefix = 'django-'
 
     module_name = args.app_name.replace('-', '_')
-    package_dirname = package_prefix + args.app_name
-    repo_dir = os.path.join(args.parent_dir, package_dirname)
-    app_root_dir = os.path.join(repo_dir, module_name)
-    project_dir = os.path.join(repo_dir, "Project")
+    package_dirname = args.package_prefix + args.app_name
+    repo_dir = args.repo_dir = os.path.join(args.parent_dir, package_dirname)
+    if not lock and os.path.isdir(repo_dir) and os.listdir(repo_dir):
+        raise ScaffoldError(f"{repo_dir} already exists and isn't empty (and has no {LOCK_FILE} to upgrade it from)")
+    plan = args.plan = RenderPlan(module_name)
+    args.runner = CommandRunner(timings, args.fancy_text, quiet=args.quiet)
 
-    print("\n\n\n\n{b}{yellow}ANNNNNNND AWAY!!{end}\n\n\n\n".format(**fancy_text))
+    echo(args, "\n\n\n\n{b}{yellow}ANNNNNNND AWAY!!{end}\n\n\n\n")
 
-    startapp_command = f'python manage.py startapp {module_name} {app_root_dir}'
-    if not os.path.isdir(app_root_dir):
-        try:
-            print_cyan(f"mkdir -p {repo_dir}")
-            mkdir_p(app_root_dir)
-        except OSError:
-            print("{red}Couldn't create directory: {repo_dir}{end}".format(repo_dir=repo_dir, **fancy_text))
-            sys.exit()
-        try:
-            print_cyan("mkdir {}".format(project_dir))
-            os.mkdir(project_dir)
-        except OSError:
-            print("{red}Couldn't create directory: {project_dir}{end}".format(project_dir=project_dir, **fancy_text))
-            sys.exit()
+    mkdirs(args, [module_name, 'Project'])
+    if args.builtin_skeleton:
+        add_app_skeleton(args)
 
-    call(startapp_command)
+    copy_template_file(args, '.gitignore')
+    plan.commit('Initial commit!\n\nCreate an app scaffold with "python manage.py startapp"')
 
-    print_cyan(f'cd {repo_dir}')
-    os.chdir(repo_dir)
-
-    copy_template_file('.gitignore')
-    call('git init && git add .')
-    call("git commit -m 'Initial commit!\n\nCreate an app scaffold with \"python manage.py startapp\"'")
-    call('git checkout -b dev')
-
-    mkdirs(['docs'])
-    call('touch docs/.gitignore')
+    plan.add_file('docs/.gitignore', '')
 
     template_files = [
         'README.md',
@@ -147,35 +445,39 @@ def main():
         'MANIFEST.in',
     ]
     for file in template_files:
-        copy_template_file(file)
+        copy_template_file(args, file)
 
-    if user_yesno("Commit now, with message: 'Package the app for reusability'?"):
-        call("git add . && git commit -m 'Package the app for reusability'")
+    if not lock and user_yesno(args, "Commit now, with message: 'Package the app for reusability'?"):
+        plan.commit('Package the app for reusability')
 
     # Determine if we should add views/templates/static
-    add_views = args.with_views if args.with_views is not None else user_yesno("Add templates/, static/, and urls.py?")
+    add_views = choose_feature(args, 'with_views', "Add templates/, static/, and urls.py?")
 
+    templates_dir = ''
+    static_dir = ''
     if add_views:
         templates_dir = os.path.join(module_name, 'templates', module_name)
         static_dir = os.path.join(module_name, 'static', module_name)
-        mkdirs([templates_dir, static_dir])
-        copy_template_file('urls.py', module_name)
+        mkdirs(args, [templates_dir, static_dir])
+        copy_template_file(args, 'urls.py', module_name)
 
-    if add_views and templates_dir and user_yesno("Add a scaffold IndexView, template, and entry in `urls.py`?"):
+    if add_views and templates_dir and choose_feature(args, 'with_index_view', "Add a scaffold IndexView, template, and entry in `urls.py`?"):
         copy_template_file(
+            args,
             'views.py',
             destination_subdirectory=module_name
         )
         copy_template_file(
+            args,
             'urls-with-view.py',
             destination_subdirectory=module_name,
             destination_filename='urls.py'
         )
 
         # Determine if we should add Bootstrap
-        add_bootstrap = args.with_bootstrap if args.with_bootstrap is not None else user_yesno(f"""How 'bout all this?
+        add_bootstrap = choose_feature(args, 'with_bootstrap', f"""How 'bout all this?
 
- - Get the latest Bootstrap (bundle)
+ - Get Bootstrap {args.bootstrap_version} (bundle)
  - require django-compressor
  - require django-bootstrap5
  - add templates/{module_name}/base.html
@@ -187,248 +489,1444 @@ def main():
         if templates_dir and static_dir and add_bootstrap:
             css_dir = os.path.join(static_dir, 'css')
             js_dir = os.path.join(static_dir, 'js')
-            call(f"wget https://raw.githubusercontent.com/twbs/bootstrap/main/dist/css/bootstrap.css -P {css_dir}")
-            call(f"wget https://raw.githubusercontent.com/twbs/bootstrap/main/dist/js/bootstrap.bundle.js -P {js_dir}")
+            mkdirs(args, [css_dir, js_dir])
+            with timings.measure('step', 'bootstrap assets'):
+                bootstrap_files = add_bootstrap_assets(args, css_dir, js_dir)
             install_requires = ['django-compressor', 'django-bootstrap5']
             install_requires_string = ''
             for package in install_requires:
                 install_requires_string += f"        '{package}',\n"
             install_requires_string = install_requires_string.rstrip()
             copy_template_file(
+                args,
                 'index-bootstrap.html',
                 destination_subdirectory=templates_dir,
                 destination_filename='index.html',
             )
             copy_template_file(
+                args,
                 'base.html',
                 destination_subdirectory=templates_dir,
+                substitutions=bootstrap_files,
             )
             copy_template_file(
+                args,
                 'setup-with-requirements.py',
                 substitutions={'install_requires': install_requires_string},
                 destination_filename='setup.py',
             )
             copy_template_file(
+                args,
                 'app_name.css',
                 destination_subdirectory=css_dir,
                 destination_filename=f'{module_name}.css'
             )
             copy_template_file(
+                args,
                 'app_name.js',
                 destination_subdirectory=js_dir,
                 destination_filename=f'{module_name}.js'
             )
         else:
             copy_template_file(
+                args,
                 'index-barebones.html',
                 destination_subdirectory=templates_dir,
                 destination_filename='index.html'
             )
 
     # Optionally add DRF scaffold
-    add_drf = args.with_drf if args.with_drf is not None else user_yesno("Would you like to include Django REST Framework (DRF) support?")
+    add_drf = choose_feature(args, 'with_drf', "Would you like to include Django REST Framework (DRF) support?")
 
+    add_oauth = False
+    add_bulk_api = False
+    add_caching = False
+    add_async = False
     if add_drf:
         # Check if we should add OAuth support
-        add_oauth = args.with_oauth if args.with_oauth is not None else user_yesno("Include OAuth2 authentication setup with user-scoped models?")
+        add_oauth = choose_feature(args, 'with_oauth', "Include OAuth2 authentication setup with user-scoped models?")
 
         if add_oauth:
             # OAuth-ready templates (includes models, serializers, views with user scoping)
-            copy_template_file('models_oauth.py', destination_subdirectory=module_name, destination_filename='models.py')
-            copy_template_file('serializers_oauth.py', destination_subdirectory=module_name, destination_filename='serializers.py')
-            copy_template_file('api_views_oauth.py', destination_subdirectory=module_name, destination_filename='api_views.py')
-            copy_template_file('urls-with-oauth.py', destination_subdirectory=module_name, destination_filename='urls.py')
-            update_setup_py_for_oauth()
+            copy_template_file(args, 'models_oauth.py', destination_subdirectory=module_name, destination_filename='models.py')
+            copy_template_file(args, 'serializers_oauth.py', destination_subdirectory=module_name, destination_filename='serializers.py')
+            copy_template_file(args, 'api_views_oauth.py', destination_subdirectory=module_name, destination_filename='api_views.py')
+            copy_template_file(args, 'admin_oauth.py', destination_subdirectory=module_name, destination_filename='admin.py')
+            copy_template_file(args, 'urls-with-oauth.py', destination_subdirectory=module_name, destination_filename='urls.py')
+            copy_template_file(
+                args,
+                '0001_initial_oauth.py',
+                destination_subdirectory=os.path.join(module_name, 'migrations'),
+                destination_filename='0001_initial.py',
+                substitutions={'example_index_name': django_index_name(f'{module_name}_examplemodel', 'user_id', '-created_at')},
+            )
+            update_setup_py_for_oauth(args)
+
+            add_bulk_api = choose_feature(args, 'with_bulk_api', "Add bulk create/update/delete endpoints?", default='n')
+            if add_bulk_api:
+                copy_template_file(args, 'bulk_api_oauth.py', destination_subdirectory=module_name, destination_filename='bulk_api.py')
+                update_api_views_for_bulk_api(args)
+
+            add_caching = choose_feature(args, 'with_caching', "Add conditional GETs (ETag/Last-Modified) and a per-user cache?", default='n')
+            if add_caching:
+                copy_template_file(args, 'caching_oauth.py', destination_subdirectory=module_name, destination_filename='caching.py')
+                copy_template_file(args, 'apps-with-signals.py', destination_subdirectory=module_name, destination_filename='apps.py')
+                update_api_views_for_caching(args)
+
+            add_async = choose_feature(args, 'with_async', "Add async (ASGI) views?", default='n')
+            if add_async:
+                copy_template_file(args, 'async_views_oauth.py', destination_subdirectory=module_name, destination_filename='async_views.py')
+                update_urls_for_async(args)
         else:
             # Standard DRF templates
-            copy_template_file('serializers.py', destination_subdirectory=module_name)
-            copy_template_file('api_views.py', destination_subdirectory=module_name)
-            copy_template_file('urls-with-drf.py', destination_subdirectory=module_name, destination_filename='urls.py')
-            update_setup_py_for_drf()
+            copy_template_file(args, 'serializers.py', destination_subdirectory=module_name)
+            copy_template_file(args, 'api_views.py', destination_subdirectory=module_name)
+            copy_template_file(args, 'urls-with-drf.py', destination_subdirectory=module_name, destination_filename='urls.py')
+            # Command to prebuild the cached OpenAPI schema at deploy time
+            commands_dir = os.path.join(module_name, 'management', 'commands')
+            plan.add_file(os.path.join(module_name, 'management', '__init__.py'), '')
+            plan.add_file(os.path.join(commands_dir, '__init__.py'), '')
+            copy_template_file(
+                args,
+                'build_schema_command.py',
+                destination_subdirectory=commands_dir,
+                destination_filename=f'build_{module_name}_schema.py',
+            )
+            update_setup_py_for_drf(args)
+
+    # Optionally add query/latency instrumentation middleware
+    add_instrumentation = choose_feature(args, 'with_instrumentation', "Add query-count and latency instrumentation middleware?", default='n')
+
+    if add_instrumentation:
+        copy_template_file(args, 'middleware.py', destination_subdirectory=module_name)
 
     # Optionally add pre-commit hooks and pyproject.toml
-    add_precommit = args.with_precommit if args.with_precommit is not None else user_yesno("Would you like to include pre-commit hooks and pyproject.toml?")
+    add_precommit = choose_feature(args, 'with_precommit', "Would you like to include pre-commit hooks and pyproject.toml?")
 
     if add_precommit:
-        copy_template_file('.pre-commit-config.yaml')
-        copy_template_file('pyproject.toml')
+        copy_template_file(args, '.pre-commit-config.yaml')
+        copy_template_file(args, 'pyproject.toml')
 
     # Optionally add GitHub Actions CI/CD
-    add_ci = args.with_ci if args.with_ci is not None else user_yesno("Would you like to include GitHub Actions CI/CD workflow?")
+    add_ci = choose_feature(args, 'with_ci', "Would you like to include GitHub Actions CI/CD workflow?")
 
     if add_ci:
-        github_workflows_dir = os.path.join(repo_dir, '.github', 'workflows')
-        mkdirs([github_workflows_dir])
-        copy_template_file('ci.yml', destination_subdirectory='.github/workflows')
+        mkdirs(args, [os.path.join('.github', 'workflows')])
+        copy_template_file(args, 'ci.yml', destination_subdirectory='.github/workflows')
 
     # Optionally add management commands scaffold
-    add_mgmt_commands = args.with_mgmt_commands if args.with_mgmt_commands is not None else user_yesno("Would you like to include management commands scaffold?")
+    add_mgmt_commands = choose_feature(args, 'with_mgmt_commands', "Would you like to include management commands scaffold?")
 
     if add_mgmt_commands:
         mgmt_commands_dir = os.path.join(module_name, 'management', 'commands')
-        mkdirs([mgmt_commands_dir])
+        mkdirs(args, [mgmt_commands_dir])
 
         # Create __init__.py files
-        with open(os.path.join(module_name, 'management', '__init__.py'), 'w') as f:
-            f.write('')
-        with open(os.path.join(mgmt_commands_dir, '__init__.py'), 'w') as f:
-            f.write('')
+        plan.add_file(os.path.join(module_name, 'management', '__init__.py'), '')
+        plan.add_file(os.path.join(mgmt_commands_dir, '__init__.py'), '')
 
-        # Copy example command
-        copy_template_file('example_command.py', destination_subdirectory=mgmt_commands_dir)
+        # Copy example command, batch-processing ExampleModel when there is one
+        copy_template_file(
+            args, 'example_command.py', destination_subdirectory=mgmt_commands_dir,
+            substitutions={'batch_model': repr(f'{module_name}.ExampleModel') if add_oauth else 'None'},
+        )
 
     # Optionally add testing scaffold
-    add_tests = args.with_tests if args.with_tests is not None else user_yesno("Would you like to include pytest testing scaffold?")
+    add_tests = choose_feature(args, 'with_tests', "Would you like to include pytest testing scaffold?")
 
     if add_tests:
-        tests_dir = os.path.join(repo_dir, 'tests')
-        mkdirs([tests_dir])
+        mkdirs(args, ['tests'])
 
         # Copy test configuration and fixtures
-        copy_template_file('pytest.ini')
-        copy_template_file('conftest.py', destination_subdirectory='tests')
-        copy_template_file('test_settings.py', destination_subdirectory='tests', destination_filename='settings.py')
+        copy_template_file(args, 'pytest.ini')
+        if add_drf:
+            copy_template_file(args, 'conftest-with-drf.py', destination_subdirectory='tests', destination_filename='conftest.py')
+            copy_template_file(args, 'test_settings-with-drf.py', destination_subdirectory='tests', destination_filename='settings.py')
+        else:
+            copy_template_file(args, 'conftest.py', destination_subdirectory='tests')
+            copy_template_file(args, 'test_settings.py', destination_subdirectory='tests', destination_filename='settings.py')
+        copy_template_file(args, 'test_app.py', destination_subdirectory='tests')
+
+        if add_drf and not add_oauth:
+            copy_template_file(args, 'test_api_drf.py', destination_subdirectory='tests', destination_filename='test_api.py')
 
         # Copy test files (only if OAuth/DRF models exist)
         if add_drf and add_oauth:
-            copy_template_file('test_models.py', destination_subdirectory='tests')
-            copy_template_file('test_api.py', destination_subdirectory='tests')
+            copy_template_file(args, 'test_models.py', destination_subdirectory='tests')
+            copy_template_file(args, 'test_api.py', destination_subdirectory='tests')
+            copy_template_file(args, 'test_admin.py', destination_subdirectory='tests')
+            copy_template_file(args, 'test_urls.py', destination_subdirectory='tests', destination_filename='urls.py')
+            update_test_settings_for_admin(args)
+            if add_bulk_api:
+                copy_template_file(args, 'test_bulk_api.py', destination_subdirectory='tests')
+            if add_caching:
+                copy_template_file(args, 'test_caching.py', destination_subdirectory='tests')
+            if add_mgmt_commands:
+                copy_template_file(args, 'test_commands.py', destination_subdirectory='tests')
+            if add_instrumentation:
+                copy_template_file(args, 'test_instrumentation.py', destination_subdirectory='tests')
+            if add_async:
+                copy_template_file(args, 'test_async_views.py', destination_subdirectory='tests')
+                copy_template_file(args, 'test_settings_asgi.py', destination_subdirectory='tests', destination_filename='settings_asgi.py')
+                copy_template_file(args, 'test_asgi.py', destination_subdirectory='tests', destination_filename='asgi.py')
+                if add_instrumentation:
+                    copy_template_file(args, 'test_async_instrumentation.py', destination_subdirectory='tests')
+
+        if add_instrumentation:
+            update_test_settings_for_instrumentation(args)
 
         # Create __init__.py for tests package
-        with open(os.path.join(tests_dir, '__init__.py'), 'w') as f:
-            f.write('')
+        plan.add_file(os.path.join('tests', '__init__.py'), '')
 
-        update_setup_py_for_tests()
+        # Optionally add benchmarks, which use the test settings and the OAuth API
+        add_benchmarks = False
+        if add_drf and add_oauth:
+            add_benchmarks = choose_feature(args, 'with_benchmarks', "Add benchmarks and a load test?", default='n')
+        if add_benchmarks:
+            mkdirs(args, ['benchmarks'])
+            plan.add_file(os.path.join('benchmarks', '__init__.py'), '')
+            for name in ('conftest.py', 'seed.py', 'test_serializers.py', 'test_querysets.py', 'loadtest.py', 'README.md'):
+                copy_template_file(args, f'benchmarks_{name}', destination_subdirectory='benchmarks', destination_filename=name)
+            update_pytest_ini_for_benchmarks(args)
+            if add_ci:
+                update_ci_for_benchmarks(args)
+
+        update_setup_py_for_tests(
+            args,
+            extra_requires=['pytest-asyncio>=0.23'] if add_async else [],
+            extra_groups={'benchmark': ['pytest-benchmark>=4.0']} if add_benchmarks else None,
+        )
+
+    if lock:
+        timings.phase('flush')
+        if not upgrade_repo(args, plan, lock) or args.dry_run:
+            timings.finish()
+            if args.timings:
+                print_timings(args, timings)
+            return
+    else:
+        plan.add_file(LOCK_FILE, lock_file_content(args, plan))
 
-    # Bring the user back to where we started
-    print_cyan(f'cd {initial_cwd}')
-    os.chdir(initial_cwd)
+        if args.dry_run:
+            print_plan(args, plan)
+            timings.finish()
+            if args.timings:
+                print_timings(args, timings)
+            return
+
+        timings.phase('flush')
+        flush_plan(args, plan)
 
     # Determine if we should install now
-    install = args.install_now if args.install_now is not None else user_yesno(f"Install {module_name} with pip now?")
+    timings.phase('install')
+    install = args.install_now if args.install_now is not None else user_yesno(args, f"Install {module_name} with pip now?")
 
+    command = pip_install_command([repo_dir], args.find_links, args.no_index, args.no_build_isolation)
     if install:
-        call(f'pip install -e {repo_dir}')
+        try:
+            args.runner.run(command)
+        finally:
+            if args.runner.results and args.runner.results[-1][0] == command:
+                returncode, seconds = args.runner.results[-1][1:]
+                args.install = {'apps': [args.app_name], 'command': shlex.join(command),
+                                'returncode': returncode, 'seconds': seconds}
     else:
-        print("You can install it later with:")
-        print(f'pip install -e {repo_dir}')
+        echo(args, "You can install it later with:")
+        echo(args, '{command}', command=shlex.join(['pip', *command[3:]]))
+
+    timings.finish()
+    if args.timings:
+        print_timings(args, timings)
+
+    echo(args, '\n{yellow}{b}**** DUNZO! :D ****{end}\n')
 
-    print('\n{yellow}{b}**** DUNZO! :D ****{end}\n'.format(**fancy_text))
+    if user_yesno(args, "Display the README now?"):
+        echo(args, '{readme}\n\n', readme=plan.read('README.md'))
 
-    if user_yesno("Display the README now?"):
-        readme_file = os.path.join(repo_dir, "README.md")
-        call(f"cat {readme_file}")
-        print("\n\n")
 
+def batch_main(configs, workers, styles):
+    """Create every app in ``configs`` with a bounded worker pool and print a summary."""
+    print("{b}Creating {count} apps with {workers} workers{end}".format(
+        count=len(configs), workers=workers, **styles))
+    results = generate_many(configs, workers)
 
-def mkdirs(directories):
+    print("\n{b}Batch summary{end}".format(**styles))
+    for result in results:
+        if result.succeeded:
+            print("  {cyan}OK{end}      {app_name} ({elapsed:.1f}s)".format(
+                app_name=result.config.app_name, elapsed=result.elapsed, **styles))
+        else:
+            print("  {red}FAILED{end}  {app_name} ({elapsed:.1f}s): {error}".format(
+                app_name=result.config.app_name, elapsed=result.elapsed, error=result.error, **styles))
+    failures = sum(1 for result in results if not result.succeeded)
+    print(f"\n{len(results) - failures} succeeded, {failures} failed")
+    for install in {id(result.install): result.install for result in results if result.install}.values():
+        if install['returncode'] == 0:
+            print(f"Installed {len(install['apps'])} app(s) with one pip run in {install['seconds']:.1f}s")
+        else:
+            print("{red}Installing {count} app(s) failed{end}: {command}".format(
+                count=len(install['apps']), command=install['command'], **styles))
+    return results
+
+
+def load_manifest(path, defaults=None):
+    """Read a manifest file and return one Config per app.
+
+    A manifest is TOML (or JSON, by file extension) with an optional
+    ``defaults`` table and an ``apps`` list. Keys are Config field names, e.g.::
+
+        [defaults]
+        parent_dir = "/path/to/apps"
+        with_drf = true
+
+        [[apps]]
+        app_name = "blog"
+        with_oauth = true
+
+    ``defaults`` (here, the command-line options) apply underneath the
+    manifest's own defaults. Batch runs never prompt, so ``no_input`` is
+    always on.
+    """
+    try:
+        with open(path, 'rb') as file:
+            if path.endswith('.json'):
+                manifest = json.load(file)
+            else:
+                import tomllib
+                manifest = tomllib.load(file)
+    except (OSError, ValueError) as exc:
+        raise ScaffoldError(f"Couldn't read manifest {path}: {exc}")
+
+    known_options = CONFIG_FIELDS - BATCH_ONLY_OPTIONS
+    manifest_defaults = manifest.get('defaults', {})
+    configs = []
+    for entry in manifest.get('apps', []):
+        options = manifest_defaults | entry
+        unknown = set(options) - known_options
+        if unknown:
+            raise ScaffoldError(f"Unknown manifest option(s): {', '.join(sorted(unknown))}")
+        options = (defaults or {}) | options | {'no_input': True}
+        if not options.get('app_name') or not options.get('parent_dir'):
+            raise ScaffoldError(f"Manifest entry needs app_name and parent_dir: {entry}")
+        configs.append(Config(**options))
+    if not configs:
+        raise ScaffoldError(f"No apps listed in manifest {path}")
+    return configs
+
+
+def mkdirs(args, directories):
     for directory in directories:
-        print_cyan(f'mkdir -p {directory}')
-        mkdir_p(directory)
+        args.plan.add_directory(directory)
+
+
+class RenderPlan:
+    """Everything a new app's repo will contain, built in memory.
+
+    ``files`` maps paths relative to the repo root to their bytes, so later
+    steps (like the ``update_setup_py_for_*`` helpers) edit the in-memory copy
+    instead of re-reading what an earlier step wrote. ``commit()`` records a
+    snapshot of the files that goes into a git commit. ``sources`` records
+    which template each rendered file came from, for the lock file.
+    """
+
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.uses_startapp = True
+        self.files = {}
+        self.sources = {}
+        self.directories = set()
+        self.commits = []
+        self.uncached_assets = []
+        self.edit_after = []
+
+    def add_directory(self, path):
+        path = os.path.normpath(path)
+        while path and path != '.':
+            self.directories.add(path)
+            path = os.path.dirname(path)
+
+    def add_file(self, path, content, source=None):
+        path = os.path.normpath(path)
+        if isinstance(content, str):
+            content = content.encode()
+        self.files[path] = content
+        if source:
+            self.sources[path] = source
+        self.add_directory(os.path.dirname(path))
+
+    def read(self, path):
+        return self.files[os.path.normpath(path)].decode()
+
+    def commit(self, message):
+        self.commits.append((message, dict(self.files)))
+
+
+def print_plan(args, plan):
+    """Print the tree a plan would create (``--dry-run``)."""
+    if args.quiet:
+        return
+    print("{b}Dry run for {repo_dir}: nothing was written{end}\n".format(repo_dir=args.repo_dir, **args.fancy_text))
+    if plan.uses_startapp:
+        print(f"  {plan.module_name}/  (app skeleton from `python manage.py startapp`)")
+    entries = {path: len(content) for path, content in plan.files.items()}
+    entries |= {directory + '/': None for directory in plan.directories
+                if not any(path.startswith(directory + os.sep) for path in plan.files)}
+    for path in sorted(entries):
+        size = entries[path]
+        print(f"  {path}" + ('' if size is None else f"  ({size} bytes)"))
+    for path in plan.uncached_assets:
+        print(f"  {path}  (not in the asset cache yet)")
+    print(f"\n{len(plan.files)} files, {sum(entries[path] or 0 for path in entries)} bytes, "
+          f"{len(plan.commits)} commit(s)")
+
+
+def write_files(root, files):
+    """Write ``files`` (relative path -> bytes) under ``root`` in parallel."""
+    def write(item):
+        path, content = item
+        with open(os.path.join(root, path), 'wb') as file:
+            file.write(content)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, files.items()))
+
+
+def write_history_porcelain(runner, project_dir, staging_dir, plan):
+    """Write the plan's files, running git init/add/commit/checkout for each commit."""
+    # startapp, `git init` and writing the first commit's files don't
+    # depend on each other
+    written = dict(plan.commits[0][1]) if plan.commits else {}
+    tasks = [
+        lambda: runner.run(['git', 'init'], cwd=staging_dir),
+        lambda: write_files(staging_dir, written),
+    ]
+    if plan.uses_startapp:
+        tasks.append(lambda: run_startapp(runner, project_dir, staging_dir, plan))
+    runner.run_parallel(*tasks)
+
+    for number, (message, snapshot) in enumerate(plan.commits):
+        changed = {path: content for path, content in snapshot.items() if written.get(path) != content}
+        write_files(staging_dir, changed)
+        written |= changed
+        runner.run(['git', 'add', '.'], cwd=staging_dir)
+        runner.run(['git', 'commit', '-m', message], cwd=staging_dir)
+        if number == 0:
+            runner.run(['git', 'checkout', '-b', 'dev'], cwd=staging_dir)
+
+    write_files(staging_dir, {path: content for path, content in plan.files.items() if written.get(path) != content})
+
+
+def write_history_fast_import(runner, project_dir, staging_dir, plan):
+    """Write the plan's files and all of its commits with a single `git fast-import`.
+
+    This produces the same history as write_history_porcelain(): the first
+    commit on the default branch, and ``dev`` checked out with any later
+    commits on it. Instead of a `git add`/`git commit` per commit, it takes
+    `git init`, `git fast-import` and `git reset` to build the index.
+    """
+    first_snapshot = plan.commits[0][1]
+    tasks = [
+        lambda: runner.run(['git', 'init', '--quiet', '--initial-branch=dev'], cwd=staging_dir),
+        lambda: write_files(staging_dir, first_snapshot),
+    ]
+    if plan.uses_startapp:
+        tasks.append(lambda: run_startapp(runner, project_dir, staging_dir, plan))
+    runner.run_parallel(*tasks)
+
+    # The first commit is whatever is on disk now, including startapp's files
+    on_disk = read_tree(staging_dir)
+    trees = [on_disk]
+    for message, snapshot in plan.commits[1:]:
+        trees.append(trees[-1] | snapshot)
+    write_files(staging_dir, {path: content for path, content in plan.files.items() if on_disk.get(path) != content})
+
+    stream = fast_import_stream(
+        [(message, commit_tree) for (message, snapshot), commit_tree in zip(plan.commits, trees)],
+        git_identity(),
+    )
+    runner.run(['git', 'fast-import', '--quiet'], cwd=staging_dir, input=stream)
+    # Index HEAD's tree, with the stat data of the files that match it
+    runner.run(['git', 'reset', '--quiet'], cwd=staging_dir)
+
+
+def run_startapp(runner, project_dir, staging_dir, plan):
+    runner.run([sys.executable, 'manage.py', 'startapp', plan.module_name,
+                os.path.abspath(os.path.join(staging_dir, plan.module_name))], cwd=project_dir)
+
+
+def read_tree(root):
+    """Every file under ``root`` (except .git), as relative path -> bytes."""
+    files = {}
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name != '.git']
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            with open(path, 'rb') as file:
+                files[os.path.relpath(path, root)] = file.read()
+    return files
+
+
+@functools.cache
+def git_identity():
+    """Author/committer identity and default branch name, looked up once per process."""
+    output = subprocess.run(['git', 'var', '-l'], capture_output=True, text=True)
+    if output.returncode != 0:
+        raise CommandError(f"`git var -l` failed: {output.stderr.strip()}")
+    values = dict(line.split('=', 1) for line in output.stdout.splitlines() if '=' in line)
+    return {
+        'author': values['GIT_AUTHOR_IDENT'].rsplit(' ', 2)[0],
+        'committer': values['GIT_COMMITTER_IDENT'].rsplit(' ', 2)[0],
+        'timezone': values['GIT_COMMITTER_IDENT'].rsplit(' ', 1)[1],
+        'default_branch': values.get('init.defaultbranch', 'master'),
+    }
 
 
-def copy_template_file(filename, destination_subdirectory='', substitutions=None, destination_filename=False, ask_to_edit=False):
-    global editor, package_prefix
-    template_file = os.path.join(this_script_dir, "template_files", filename)
-    if not destination_filename:
-        destination_filename = filename
-    destination_file = os.path.join(repo_dir, destination_subdirectory, destination_filename)
-    print_cyan(f'Creating {destination_filename}')
-    # Open the template version
-    with open(template_file, 'r') as file:
-        filedata = file.read()
-    # Replace the template variables
-    filedata = Template(filedata)
-    _substitutions = {
+def fast_import_stream(commits, identity):
+    """A `git fast-import` stream for ``commits`` (message, tree) on the default branch and ``dev``."""
+    blobs = {}
+    chunks = []
+
+    def data(content):
+        chunks.append(b'data %d\n' % len(content))
+        chunks.append(content)
+        chunks.append(b'\n')
+
+    for message, tree in commits:
+        for content in tree.values():
+            if content not in blobs:
+                blobs[content] = len(blobs) + 1
+                chunks.append(b'blob\nmark :%d\n' % blobs[content])
+                data(content)
+
+    timestamp = int(time.time())
+    mark = len(blobs)
+    for number, (message, tree) in enumerate(commits):
+        mark += 1
+        branch = identity['default_branch'] if number == 0 else 'dev'
+        chunks.append(f"commit refs/heads/{branch}\nmark :{mark}\n".encode())
+        chunks.append(f"author {identity['author']} {timestamp} {identity['timezone']}\n".encode())
+        chunks.append(f"committer {identity['committer']} {timestamp} {identity['timezone']}\n".encode())
+        data(message.encode() + b'\n')
+        if number == 1:
+            chunks.append(b'from :%d\n' % (mark - 1))
+        for path in sorted(tree):
+            chunks.append(b'M 100644 :%d %s\n' % (blobs[tree[path]], git_path(path)))
+        chunks.append(b'\n')
+    if len(commits) == 1:
+        chunks.append(b'reset refs/heads/dev\nfrom :%d\n\n' % mark)
+    return b''.join(chunks)
+
+
+def git_path(path):
+    """``path`` quoted as `git fast-import` expects it."""
+    path = path.replace(os.sep, '/').encode()
+    if path.startswith(b'"') or b'\n' in path:
+        path = b'"' + path.replace(b'\\', b'\\\\').replace(b'"', b'\\"').replace(b'\n', b'\\n') + b'"'
+    return path
+
+
+def flush_plan(args, plan):
+    """Create the app described by ``plan`` at ``args.repo_dir``.
+
+    Everything happens in a temporary sibling directory which is renamed into
+    place at the end, so a failure never leaves a half-generated app behind.
+    """
+    runner = args.runner
+    mkdir_p(args.parent_dir)
+    staging_dir = tempfile.mkdtemp(prefix=f'.{os.path.basename(args.repo_dir)}-', dir=args.parent_dir)
+    try:
+        for directory in sorted(plan.directories):
+            os.makedirs(os.path.join(staging_dir, directory), exist_ok=True)
+
+        with runner.timings.measure('step', f'files and git history ({args.git_backend})'):
+            if args.git_backend == 'fast-import':
+                write_history_fast_import(runner, args.project_dir, staging_dir, plan)
+            else:
+                write_history_porcelain(runner, args.project_dir, staging_dir, plan)
+        if plan.uses_startapp:
+            lock_startapp_files(args, plan, staging_dir)
+
+        print_cyan(args, f'mv {staging_dir} {args.repo_dir}')
+        os.rename(staging_dir, args.repo_dir)
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    for path in plan.edit_after:
+        if user_yesno(args, f"Edit {path} with {args.editor} now?"):
+            runner.run([*shlex.split(args.editor), os.path.join(args.repo_dir, path)])
+
+
+# Written into every app: what it was created with, and a hash of every generated file
+LOCK_FILE = '.startreusableapp.lock'
+LOCK_VERSION = 1
+# Options besides the features that change generated files, kept in the lock file
+LOCKED_OPTIONS = ('bootstrap_version', 'bootstrap_minified')
+
+
+def find_lock(args):
+    """The lock file of an existing app called ``args.app_name`` in ``parent_dir``, or None."""
+    for prefix in (('django-', '') if args.add_prefix else ('', 'django-')):
+        path = os.path.join(args.parent_dir, prefix + args.app_name, LOCK_FILE)
+        try:
+            with open(path) as file:
+                lock = json.load(file)
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError) as exc:
+            raise ScaffoldError(f"Couldn't read {path}: {exc}")
+        if lock.get('version') != LOCK_VERSION:
+            raise ScaffoldError(f"{path} has an unsupported version: {lock.get('version')}")
+        return lock
+    return None
+
+
+def apply_locked_options(args, lock):
+    """Use the locked value of every LOCKED_OPTIONS option that wasn't changed from its default."""
+    defaults = {field.name: field.default for field in dataclasses.fields(Config)}
+    for option in LOCKED_OPTIONS:
+        if option in lock['options'] and getattr(args, option) == defaults[option]:
+            setattr(args, option, lock['options'][option])
+
+
+def lock_entries(plan):
+    """Lock file entries for the plan's files: their template, its hash and the output's hash."""
+    registry = template_registry()
+    entries = {}
+    for path, content in plan.files.items():
+        source = plan.sources.get(path)
+        entries[path.replace(os.sep, '/')] = {
+            'template': source,
+            'template_sha256': registry.template_hash(source) if source else None,
+            'sha256': hashlib.sha256(content).hexdigest(),
+        }
+    entries.pop(LOCK_FILE, None)
+    return entries
+
+
+def lock_file_content(args, plan, features=None, entries=None):
+    return json.dumps({
+        'version': LOCK_VERSION,
+        'app_name': args.app_name,
+        'package_prefix': args.package_prefix,
+        'features': args.features if features is None else features,
+        'options': {option: getattr(args, option) for option in LOCKED_OPTIONS},
+        'files': lock_entries(plan) if entries is None else entries,
+    }, indent=2, sort_keys=True) + '\n'
+
+
+def lock_startapp_files(args, plan, staging_dir):
+    """Add the files `manage.py startapp` wrote to the lock file in ``staging_dir``.
+
+    They aren't in the plan, so without an entry an upgrade that replaces
+    one (like models.py) would take it for a file changed by hand.
+    """
+    module_dir = os.path.join(staging_dir, plan.module_name)
+    entries = lock_entries(plan)
+    for path, content in read_tree(module_dir).items():
+        path = os.path.join(plan.module_name, path)
+        if path not in plan.files:
+            entries[path.replace(os.sep, '/')] = {
+                'template': None,
+                'template_sha256': None,
+                'sha256': hashlib.sha256(content).hexdigest(),
+            }
+    plan.add_file(LOCK_FILE, lock_file_content(args, plan, entries=entries))
+    write_files(staging_dir, {LOCK_FILE: plan.files[LOCK_FILE]})
+
+
+def read_file(path):
+    """The bytes of ``path``, or None if it doesn't exist."""
+    try:
+        with open(path, 'rb') as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
+def upgrade_repo(args, plan, lock):
+    """Bring the existing app at ``args.repo_dir`` up to date with ``plan``.
+
+    A planned file is written if it's new, or if its rendered content changed
+    and the copy on disk is still the one the lock file recorded. Files
+    edited by hand since then are left alone and reported. The written files
+    and the updated lock file go into one commit, so running the same
+    upgrade twice changes nothing. Returns whether anything was committed.
+    """
+    recorded = lock['files']
+    entries = lock_entries(plan)
+    changed = {}
+    for path, content in plan.files.items():
+        key = path.replace(os.sep, '/')
+        previous = recorded.get(key, {}).get('sha256')
+        if previous == entries[key]['sha256']:
+            continue
+        on_disk = read_file(os.path.join(args.repo_dir, path))
+        on_disk_hash = None if on_disk is None else hashlib.sha256(on_disk).hexdigest()
+        if on_disk is None or on_disk_hash == previous:
+            changed[path] = content
+        elif on_disk_hash != entries[key]['sha256']:
+            echo(args, "{yellow}Skipped {path}: changed by hand since it was generated, so update it yourself{end}", path=path)
+            if key in recorded:
+                entries[key] = recorded[key]
+            else:
+                del entries[key]
+
+    features = args.previous_features | args.features
+    content = lock_file_content(args, plan, features, recorded | entries).encode()
+    if not changed and content == read_file(os.path.join(args.repo_dir, LOCK_FILE)):
+        echo(args, "{b}{repo_dir} is up to date{end}", repo_dir=args.repo_dir)
+        return False
+
+    added = [name.removeprefix('with_').replace('_', ' ') for name, value in sorted(features.items())
+             if value and not args.previous_features.get(name)]
+    subject = f"Add {', '.join(added)}" if added else 'Update generated files'
+    for path in sorted(changed):
+        print_cyan(args, f"{'Would write' if args.dry_run else 'Writing'} {path}")
+    if args.dry_run:
+        echo(args, "{b}Dry run: would commit {count} file(s) as '{subject}'{end}", count=len(changed) + 1, subject=subject)
+        return False
+
+    for directory in sorted(plan.directories):
+        os.makedirs(os.path.join(args.repo_dir, directory), exist_ok=True)
+    write_files(args.repo_dir, changed | {LOCK_FILE: content})
+    paths = [LOCK_FILE, *sorted(changed)]
+    args.runner.run(['git', 'add', '--', *paths], cwd=args.repo_dir)
+    args.runner.run(['git', 'commit', '-m', f'{subject}\n\nUpgraded with startreusableapp.py.', '--', *paths],
+                    cwd=args.repo_dir)
+    return True
+
+
+# Placeholders every template may use
+SUBSTITUTION_KEYS = {
+    'app_name',
+    'module_name',
+    'camel_case_app_name',
+    'app_name_capitalized',
+    'app_name_lowercase',
+    'package_prefix',
+    'app_header_line',
+}
+# Extra placeholders that callers must pass in ``substitutions``, by template
+EXTRA_SUBSTITUTION_KEYS = {
+    'setup-with-requirements.py': {'install_requires'},
+    'base.html': {'bootstrap_css', 'bootstrap_js'},
+    '0001_initial_oauth.py': {'example_index_name'},
+    'example_command.py': {'batch_model'},
+}
+
+
+def django_index_name(table, *columns):
+    """The name makemigrations gives an unnamed ``models.Index`` on ``columns`` ('-' for descending).
+
+    Shipped migrations must use the same name, or makemigrations would
+    want to rename the index in every generated app.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    for part in (table, *columns, 'idx'):
+        digest.update(part.encode())
+    return f"{table[:11]}_{columns[0].lstrip('-')[:7]}_{digest.hexdigest()[:6]}_idx"
+
+
+# Bootstrap dist files, relative to the dist/ directory, by kind
+BOOTSTRAP_FILES = {
+    'css': 'css/bootstrap.css',
+    'js': 'js/bootstrap.bundle.js',
+}
+BOOTSTRAP_MINIFIED_FILES = {
+    'css': 'css/bootstrap.min.css',
+    'js': 'js/bootstrap.bundle.min.js',
+}
+BOOTSTRAP_URL = 'https://raw.githubusercontent.com/twbs/bootstrap/v{version}/dist/{name}'
+
+
+class AssetCache:
+    """A content-addressed store for downloaded assets.
+
+    Files live under ``objects/`` named by their SHA-256, and
+    ``bootstrap/<version>.json`` maps each Bootstrap dist file to its hash.
+    Once a version has been fetched (or loaded from a vendored archive),
+    creating an app needs no network access at all.
+    """
+
+    lock = threading.Lock()
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def object_path(self, digest):
+        return os.path.join(self.directory, 'objects', digest[:2], digest)
+
+    def index_path(self, version):
+        return os.path.join(self.directory, 'bootstrap', f'{version}.json')
+
+    def read_index(self, version):
+        try:
+            with open(self.index_path(version)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def write_index(self, version, index):
+        path = self.index_path(version)
+        mkdir_p(os.path.dirname(path))
+        with open(path + '.tmp', 'w') as file:
+            json.dump(index, file, indent=2, sort_keys=True)
+        os.replace(path + '.tmp', path)
+
+    def store(self, content):
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.object_path(digest)
+        # Rewrite a corrupt copy too, or load() would keep rejecting it
+        if self.load(digest) is None:
+            mkdir_p(os.path.dirname(path))
+            with open(path + '.tmp', 'wb') as file:
+                file.write(content)
+            os.replace(path + '.tmp', path)
+        return digest
+
+    def load(self, digest):
+        """The stored bytes for ``digest``, or None if missing or corrupt."""
+        try:
+            with open(self.object_path(digest), 'rb') as file:
+                content = file.read()
+        except OSError:
+            return None
+        return content if hashlib.sha256(content).hexdigest() == digest else None
+
+    def has_bootstrap_file(self, version, name):
+        digest = self.read_index(version).get(name)
+        return digest is not None and os.path.isfile(self.object_path(digest))
+
+    def bootstrap_file(self, version, name, archive=None):
+        """The bytes of Bootstrap ``version``'s dist/``name``, fetching it only if it isn't cached."""
+        with self.lock:
+            index = self.read_index(version)
+            content = self.load(index[name]) if name in index else None
+            if content is None:
+                if archive:
+                    index |= {key: self.store(value) for key, value in read_bootstrap_archive(archive).items()}
+                else:
+                    index[name] = self.store(download(BOOTSTRAP_URL.format(version=version, name=name)))
+                self.write_index(version, index)
+                if name not in index:
+                    raise ScaffoldError(f"{archive} doesn't contain dist/{name}")
+                content = self.load(index[name])
+            return content
+
+
+def read_bootstrap_archive(archive):
+    """Read the Bootstrap dist files out of a release .zip or .tar(.gz) archive."""
+    import tarfile
+    import zipfile
+
+    wanted = set(BOOTSTRAP_FILES.values()) | set(BOOTSTRAP_MINIFIED_FILES.values())
+    found = {}
+    try:
+        if zipfile.is_zipfile(archive):
+            with zipfile.ZipFile(archive) as bundle:
+                for member in bundle.namelist():
+                    for name in wanted:
+                        if member.endswith('/' + name) or member == name:
+                            found[name] = bundle.read(member)
+        else:
+            with tarfile.open(archive) as bundle:
+                for member in bundle.getmembers():
+                    for name in wanted:
+                        if member.isfile() and (member.name.endswith('/' + name) or member.name == name):
+                            found[name] = bundle.extractfile(member).read()
+    except (OSError, tarfile.TarError, zipfile.BadZipFile) as exc:
+        raise ScaffoldError(f"Couldn't read Bootstrap archive {archive}: {exc}")
+    return found
+
+
+def download(url):
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            return response.read()
+    except OSError as exc:
+        raise ScaffoldError(f"Couldn't download {url}: {exc} (use --bootstrap-archive on offline machines)")
+
+
+def add_bootstrap_assets(args, css_dir, js_dir):
+    """Add Bootstrap's css/js to the plan from the asset cache.
+
+    Returns the ``bootstrap_css`` and ``bootstrap_js`` substitutions base.html needs.
+    """
+    files = BOOTSTRAP_MINIFIED_FILES if args.bootstrap_minified else BOOTSTRAP_FILES
+    cache = AssetCache(args.asset_cache)
+    substitutions = {}
+    for kind, directory in (('css', css_dir), ('js', js_dir)):
+        name = files[kind]
+        path = os.path.join(directory, os.path.basename(name))
+        cached = cache.has_bootstrap_file(args.bootstrap_version, name)
+        if args.dry_run and not cached:
+            args.plan.uncached_assets.append(path)
+        else:
+            if not cached:
+                print_cyan(args, f'Fetching Bootstrap {args.bootstrap_version} dist/{name}'
+                                 + (f' from {args.bootstrap_archive}' if args.bootstrap_archive else ''))
+            args.plan.add_file(path, cache.bootstrap_file(args.bootstrap_version, name, args.bootstrap_archive))
+        substitutions[f'bootstrap_{kind}'] = os.path.basename(name)
+    return substitutions
+
+
+def read_template_directory(directory):
+    """{name: source} of every file under ``directory``, named by their '/'-separated relative path."""
+    sources = {}
+    for root, dirnames, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            name = os.path.relpath(path, directory).replace(os.sep, '/')
+            with open(path, 'r') as file:
+                sources[name] = file.read()
+    return sources
+
+
+def pack_template_bundle(sources, compress=True):
+    """Pack ``sources`` ({name: source}) into one template bundle.
+
+    A bundle is TEMPLATE_BUNDLE_MAGIC, the length of a JSON index, the index
+    ({"compression": ..., "files": {name: [offset, size]}}) and then every
+    template's UTF-8 source back to back, zlib-compressed as one stream when
+    ``compress`` is set.
+    """
+    import zlib
+
+    files, chunks, offset = {}, [], 0
+    for name in sorted(sources):
+        chunk = sources[name].encode()
+        files[name] = [offset, len(chunk)]
+        chunks.append(chunk)
+        offset += len(chunk)
+    data = b''.join(chunks)
+    index = json.dumps({'compression': 'zlib' if compress else None, 'files': files}).encode()
+    return (TEMPLATE_BUNDLE_MAGIC + struct.pack('>I', len(index)) + index
+            + (zlib.compress(data, 9) if compress else data))
+
+
+def unpack_template_bundle(bundle):
+    """{name: source} of a bundle made by pack_template_bundle()."""
+    header_size = len(TEMPLATE_BUNDLE_MAGIC) + 4
+    if not bundle.startswith(TEMPLATE_BUNDLE_MAGIC):
+        raise ScaffoldError("Not a template bundle (rebuild the zipapp)")
+    (index_size,) = struct.unpack_from('>I', bundle, len(TEMPLATE_BUNDLE_MAGIC))
+    index = json.loads(bundle[header_size:header_size + index_size])
+    data = memoryview(bundle)[header_size + index_size:]
+    if index['compression'] == 'zlib':
+        import zlib
+        data = memoryview(zlib.decompress(data))
+    return {name: str(data[offset:offset + size], 'utf-8') for name, (offset, size) in index['files'].items()}
+
+
+class TemplateRegistry:
+    """Every template, read and compiled once.
+
+    Templates come from the template_files/ directory, or from ``sources``
+    ({name: source}, e.g. a zipapp's template bundle) when given.
+    Placeholders are checked against the known substitution keys when the
+    registry loads, so a broken template fails up front instead of halfway
+    through creating an app. Rendering only touches memory.
+    """
+
+    def __init__(self, directory, sources=None):
+        self.directory = directory
+        if sources is None:
+            sources = read_template_directory(directory)
+        self.templates = {name: self.compile(name, source) for name, source in sources.items()}
+
+    @staticmethod
+    def compile(name, source):
+        template = Template(source)
+        if not template.is_valid():
+            raise ScaffoldError(f"Invalid placeholder in template {name} (escape a literal $ as $$)")
+        unknown = set(template.get_identifiers()) - SUBSTITUTION_KEYS - EXTRA_SUBSTITUTION_KEYS.get(name, set())
+        if unknown:
+            raise ScaffoldError(f"Unknown placeholder(s) in template {name}: {', '.join(sorted(unknown))}")
+        return template
+
+    def template_hash(self, name):
+        return hashlib.sha256(self.templates[name].template.encode()).hexdigest()
+
+    def render(self, name, substitutions):
+        try:
+            template = self.templates[name]
+        except KeyError:
+            raise ScaffoldError(f"No such template: {name}")
+        try:
+            return template.substitute(substitutions)
+        except KeyError as exc:
+            raise ScaffoldError(f"No value for placeholder {exc} in template {name}")
+
+
+@functools.cache
+def template_registry():
+    """The process-wide TemplateRegistry for template_files/.
+
+    When running from a zipapp (see build_zipapp()), there is no
+    template_files/ directory: the templates are read from the bundle packed
+    next to this module instead, in one read.
+    """
+    directory = os.path.join(this_script_dir, "template_files")
+    if os.path.isdir(directory):
+        return TemplateRegistry(directory)
+    bundle = __loader__.get_data(os.path.join(os.path.dirname(__file__), TEMPLATE_BUNDLE))
+    return TemplateRegistry(None, unpack_template_bundle(bundle))
+
+
+def build_zipapp(target, compress=True):
+    """Pack this script and every template into one executable zipapp at ``target``.
+
+    The archive holds this module's source, its bytecode (so starting the
+    zipapp doesn't recompile it; other Python versions fall back to the
+    source) and the templates as one bundle (see pack_template_bundle()).
+    """
+    import py_compile
+    import zipfile
+
+    directory = os.path.join(this_script_dir, "template_files")
+    if not os.path.isdir(directory):
+        raise ScaffoldError("Building a zipapp needs template_files/; run it from a checkout, not a zipapp")
+    source_path = os.path.realpath(__file__)
+    with tempfile.TemporaryDirectory() as build_dir:
+        bytecode_path = py_compile.compile(
+            source_path, cfile=os.path.join(build_dir, 'startreusableapp.pyc'), doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+        with open(target, 'wb') as file:
+            file.write(b'#!/usr/bin/env python3\n')
+            with zipfile.ZipFile(file, 'w', zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr('__main__.py', ZIPAPP_MAIN)
+                archive.write(source_path, 'startreusableapp.py')
+                archive.write(bytecode_path, 'startreusableapp.pyc')
+                archive.writestr(
+                    TEMPLATE_BUNDLE,
+                    pack_template_bundle(read_template_directory(directory), compress),
+                    # Compressed already (or left uncompressed on purpose)
+                    compress_type=zipfile.ZIP_STORED,
+                )
+    os.chmod(target, os.stat(target).st_mode | 0o111)
+
+
+def template_substitutions(args):
+    """Substitutions every template can use, for the app described by ``args``."""
+    module_name = args.app_name.replace('-', '_')
+    return {
         'app_name': args.app_name,
+        'module_name': module_name,
+        'camel_case_app_name': ''.join(x for x in module_name.title() if x != '_'),
         'app_name_capitalized': args.app_name.capitalize(),
         'app_name_lowercase': args.app_name.lower(),
-        'package_prefix': package_prefix,
+        'package_prefix': args.package_prefix,
         'app_header_line': '='*len(args.app_name),
     }
+
+
+def add_app_skeleton(args):
+    """Add the files `manage.py startapp` would create, from template_files/startapp/."""
+    module_name = args.plan.module_name
+    args.plan.uses_startapp = False
+    for name in sorted(template_registry().templates):
+        if name.startswith('startapp/'):
+            copy_template_file(
+                args,
+                name,
+                destination_subdirectory=module_name,
+                destination_filename=name.removeprefix('startapp/'),
+            )
+
+
+def copy_template_file(args, filename, destination_subdirectory='', substitutions=None, destination_filename=False, ask_to_edit=False):
+    if not destination_filename:
+        destination_filename = filename
+    destination_file = os.path.join(destination_subdirectory, destination_filename)
+    print_cyan(args, f'Creating {destination_filename}')
+    # Replace the template variables
+    _substitutions = template_substitutions(args)
     if substitutions:
         _substitutions |= substitutions
-    filedata = filedata.substitute(**_substitutions)
-    # Write the modified version to the new app's dir
-    with open(destination_file, 'w') as file:
-        file.write(filedata)
-    if ask_to_edit and user_yesno(f"Edit {filename} with {editor} now?"):
-        call(f'{editor} {destination_file}')
+    with args.timings_report.measure('template', destination_file):
+        filedata = template_registry().render(filename, _substitutions)
+    # Add the rendered version to the new app's plan
+    args.plan.add_file(destination_file, filedata, source=filename)
+    if ask_to_edit:
+        args.plan.edit_after.append(destination_file)
+
+
+def replace_anchor(path, content, anchor, replacement):
+    """``content`` of the planned file ``path`` with ``anchor`` replaced once.
 
+    The update_* helpers patch rendered templates at these anchors, so a
+    template edited without its helper fails here instead of silently losing
+    a feature's settings or dependencies.
+    """
+    if anchor not in content:
+        raise ScaffoldError(f"Can't update {path}: it no longer contains {anchor!r}")
+    return content.replace(anchor, replacement, 1)
 
-def update_setup_py_for_drf():
+
+def update_setup_py_for_drf(args):
     """Update setup.py to include DRF and drf-spectacular as requirements."""
-    setup_file = os.path.join(repo_dir, 'setup.py')
-    with open(setup_file, 'r') as file:
-        content = file.read()
+    path = 'setup.py'
+    content = args.plan.read(path)
 
     install_requires_str = "        'djangorestframework',\n        'drf-spectacular',"
 
     if "install_requires" in content:
-        content = content.replace("install_requires=[", f"install_requires=[\n{install_requires_str}")
+        content = replace_anchor(path, content, "install_requires=[", f"install_requires=[\n{install_requires_str}")
     else:
-        content = content.replace("setup(", f"setup(\n    install_requires=[\n{install_requires_str}\n    ],")
+        content = replace_anchor(path, content, "setup(", f"setup(\n    install_requires=[\n{install_requires_str}\n    ],")
 
-    with open(setup_file, 'w') as file:
-        file.write(content)
+    args.plan.add_file(path, content)
 
 
-def update_setup_py_for_oauth():
+def update_setup_py_for_oauth(args):
     """Update setup.py to include DRF, drf-spectacular, and django-oauth-toolkit."""
-    setup_file = os.path.join(repo_dir, 'setup.py')
-    with open(setup_file, 'r') as file:
-        content = file.read()
+    path = 'setup.py'
+    content = args.plan.read(path)
 
     install_requires_str = "        'djangorestframework',\n        'drf-spectacular',\n        'django-oauth-toolkit',"
 
     if "install_requires" in content:
-        content = content.replace("install_requires=[", f"install_requires=[\n{install_requires_str}")
+        content = replace_anchor(path, content, "install_requires=[", f"install_requires=[\n{install_requires_str}")
     else:
-        content = content.replace("setup(", f"setup(\n    install_requires=[\n{install_requires_str}\n    ],")
+        content = replace_anchor(path, content, "setup(", f"setup(\n    install_requires=[\n{install_requires_str}\n    ],")
+
+    args.plan.add_file(path, content)
+
+
+def update_api_views_for_bulk_api(args):
+    """Add the bulk endpoints' mixin to ExampleModelViewSet."""
+    path = os.path.join(args.plan.module_name, 'api_views.py')
+    content = args.plan.read(path)
 
-    with open(setup_file, 'w') as file:
-        file.write(content)
+    content = replace_anchor(path, content, "from .models import ExampleModel\n", "from .bulk_api import ExampleModelBulkMixin\nfrom .models import ExampleModel\n")
+    content = replace_anchor(path, content, "class ExampleModelViewSet(viewsets.ModelViewSet):", "class ExampleModelViewSet(ExampleModelBulkMixin, viewsets.ModelViewSet):")
 
+    args.plan.add_file(path, content)
 
-def update_setup_py_for_tests():
+
+def update_api_views_for_caching(args):
+    """Add conditional GETs and the per-user page cache to ExampleModelViewSet."""
+    path = os.path.join(args.plan.module_name, 'api_views.py')
+    content = args.plan.read(path)
+
+    content = replace_anchor(path, content, "from .models import ExampleModel\n", "from .caching import ExampleModelCacheMixin\nfrom .models import ExampleModel\n")
+    content = replace_anchor(path, content, "class ExampleModelViewSet(", "class ExampleModelViewSet(ExampleModelCacheMixin, ")
+
+    args.plan.add_file(path, content)
+
+
+def update_urls_for_async(args):
+    """Route the async views in urls.py."""
+    path = os.path.join(args.plan.module_name, 'urls.py')
+    content = args.plan.read(path)
+
+    content = replace_anchor(path, content, "from .api_views import", "from .async_views import ExampleModelAsyncView, example_count_view\nfrom .api_views import")
+    content = content.rstrip() + """
+
+# Async (ASGI) endpoints
+urlpatterns += [
+    path('api/async/examples/', ExampleModelAsyncView.as_view(), name='async-examples'),
+    path('api/async/examples/count/', example_count_view, name='async-examples-count'),
+]
+"""
+
+    args.plan.add_file(path, content)
+
+
+def update_test_settings_for_admin(args):
+    """Install the admin, and the template settings it renders with, in the test settings."""
+    path = os.path.join('tests', 'settings.py')
+    content = args.plan.read(path)
+    content = replace_anchor(path, content, "INSTALLED_APPS = [\n", "INSTALLED_APPS = [\n    'django.contrib.admin',\n")
+    content = replace_anchor(path, content, "    'django.contrib.sessions',\n", "    'django.contrib.sessions',\n    'django.contrib.messages',\n")
+    content = replace_anchor(path, content, "ROOT_URLCONF", """TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+ROOT_URLCONF""")
+    args.plan.add_file(path, content)
+
+
+def update_test_settings_for_instrumentation(args):
+    """Run the tests through the instrumentation middleware, with a query budget."""
+    path = os.path.join('tests', 'settings.py')
+    content = args.plan.read(path)
+
+    content = replace_anchor(path, content, "MIDDLEWARE = [\n", f"MIDDLEWARE = [\n    '{args.plan.module_name}.middleware.QueryInstrumentationMiddleware',\n")
+    content = content.rstrip() + """
+
+# Most SQL queries one request may run before it's logged as a warning
+QUERY_BUDGET = 5
+"""
+
+    args.plan.add_file(path, content)
+
+
+def update_pytest_ini_for_benchmarks(args):
+    """Keep benchmarks out of plain `pytest` runs; `pytest benchmarks` runs them."""
+    path = 'pytest.ini'
+    content = args.plan.read(path)
+    content = replace_anchor(path, content, 'DJANGO_SETTINGS_MODULE', f'testpaths = tests {args.plan.module_name}\nDJANGO_SETTINGS_MODULE')
+    args.plan.add_file(path, content)
+
+    path = 'pyproject.toml'
+    if path in args.plan.files:
+        content = args.plan.read(path)
+        content = replace_anchor(path, content, '    "pytest-xdist>=3.5",\n]', '    "pytest-xdist>=3.5",\n]\nbenchmark = [\n    "pytest-benchmark>=4.0",\n]')
+        args.plan.add_file(path, content)
+
+
+def update_ci_for_benchmarks(args):
+    """Add a CI job that compares benchmarks against the latest run on main."""
+    path = os.path.join('.github', 'workflows', 'ci.yml')
+    content = args.plan.read(path)
+
+    content = replace_anchor(path, content, '\n  lint:\n', """
+  benchmarks:
+    runs-on: ubuntu-latest
+
+    steps:
+    - uses: actions/checkout@v4
+
+    - name: Set up Python
+      uses: actions/setup-python@v5
+      with:
+        python-version: '3.11'
+
+    - name: Install dependencies
+      run: |
+        python -m pip install --upgrade pip
+        pip install -e .[test,benchmark]
+
+    # Runs on main are saved as the baseline for later pull requests
+    - name: Restore benchmark baseline
+      uses: actions/cache/restore@v4
+      with:
+        path: .benchmarks
+        key: benchmarks-${{ github.sha }}
+        restore-keys: benchmarks-
+
+    - name: Run benchmarks
+      run: |
+        if [ -d .benchmarks ]; then
+          pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:25% --benchmark-autosave
+        else
+          pytest benchmarks --benchmark-autosave
+        fi
+
+    - name: Save benchmark baseline
+      if: github.ref == 'refs/heads/main'
+      uses: actions/cache/save@v4
+      with:
+        path: .benchmarks
+        key: benchmarks-${{ github.sha }}
+
+  lint:
+""")
+
+    args.plan.add_file(path, content)
+
+
+def update_setup_py_for_tests(args, extra_requires=(), extra_groups=None):
     """Update setup.py to include test dependencies."""
-    setup_file = os.path.join(repo_dir, 'setup.py')
-    with open(setup_file, 'r') as file:
-        content = file.read()
+    path = 'setup.py'
+    content = args.plan.read(path)
 
     # Add extras_require for tests if not present
-    tests_require_str = """    extras_require={
+    extra_requires_str = ''.join(f"\n            '{package}'," for package in extra_requires)
+    extra_groups_str = ''.join(
+        f"\n        '{group}': [" + ''.join(f"\n            '{package}'," for package in packages) + "\n        ],"
+        for group, packages in (extra_groups or {}).items()
+    )
+    tests_require_str = f"""    extras_require={{
         'test': [
             'pytest>=7.0',
             'pytest-django>=4.5',
             'pytest-cov>=4.0',
-        ],
-    },"""
+            'pytest-xdist>=3.5',{extra_requires_str}
+        ],{extra_groups_str}
+    }},"""
 
     if "extras_require" not in content:
         # Find the closing parenthesis of setup()
-        content = content.replace("\n)", f"\n{tests_require_str}\n)")
+        content = replace_anchor(path, content, "\n)", f"\n{tests_require_str}\n)")
+
+    args.plan.add_file(path, content)
 
-    with open(setup_file, 'w') as file:
-        file.write(content)
 
+def choose_feature(args, name, question, default='y'):
+    """Whether to add the feature ``name`` (a Config field like ``with_drf``).
 
-def user_yesno(question, default='y'):
+    An explicit option wins, then what the app was created with (when
+    upgrading it), then the user's answer. The choice is kept in
+    ``args.features`` for the lock file.
+    """
+    value = getattr(args, name, None)
+    if value is None:
+        value = args.previous_features.get(name)
+    if value is None:
+        value = user_yesno(args, question, default=default)
+    args.features[name] = value
+    return value
+
+
+def user_yesno(args, question, default='y'):
     if args.no_input:
         user_input = default
     else:
-        user_input = input("\n{purple}{question}{end} [y]/n ".format(question=question, **fancy_text))
+        user_input = input("\n{purple}{question}{end} [y]/n ".format(question=question, **args.fancy_text))
     return user_input.lower() == 'y' or user_input.lower() == 'yes' or user_input == ''
 
 
-def call(command, print_it=True):
-    if print_it:
-        print("\n{cyan}{command}{end}".format(command=command, **fancy_text))
-    os.system(command)
+class Timings:
+    """Wall time for the phases, templates and commands of one app.
+
+    ``phase()`` ends the current phase of main() and starts the next one;
+    ``measure()`` times a single step inside a phase. Peak RSS is only
+    known per process (``ru_maxrss`` is a lifetime high-water mark), so the
+    report has one peak for this process and one for its largest command,
+    not one per step.
+    """
+
+    def __init__(self, app_name):
+        self.app_name = app_name
+        self.entries = []
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.current_phase = None
 
+    def record(self, kind, label, seconds):
+        with self.lock:
+            self.entries.append({'kind': kind, 'label': label, 'seconds': seconds})
 
-def print_cyan(s):
-    print("\n{cyan}{s}{end}".format(s=s, **fancy_text))
+    @contextlib.contextmanager
+    def measure(self, kind, label):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(kind, label, time.perf_counter() - started)
+
+    def phase(self, label):
+        self.finish()
+        self.current_phase = (label, time.perf_counter())
+
+    def finish(self):
+        if self.current_phase:
+            label, started = self.current_phase
+            self.record('phase', label, time.perf_counter() - started)
+            self.current_phase = None
+
+    def report(self):
+        return {
+            'app': self.app_name,
+            'total_seconds': time.perf_counter() - self.started,
+            # So far in this process, so in a batch they cover earlier apps too
+            'peak_rss_kb': peak_rss_kb(),
+            'commands_peak_rss_kb': peak_rss_kb(children=True),
+            'entries': sorted(self.entries, key=lambda entry: entry['seconds'], reverse=True),
+        }
+
+
+def peak_rss_kb(children=False):
+    """Peak resident set size in KB of this process (or its largest child) so far, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def print_timings(args, timings):
+    if args.quiet:
+        return
+    report = timings.report()
+    print("\n{b}Timings for {app} ({total:.3f}s){end}".format(
+        app=report['app'], total=report['total_seconds'], **args.fancy_text))
+    if report['peak_rss_kb'] is not None:
+        print(f"  Peak RSS so far: {report['peak_rss_kb'] / 1024:.1f} MB in this process, "
+              f"{report['commands_peak_rss_kb'] / 1024:.1f} MB in its largest command")
+    print(f"  {'kind':<9} {'seconds':>8}  label")
+    for entry in report['entries']:
+        print(f"  {entry['kind']:<9} {entry['seconds']:>8.3f}  {entry['label']}")
+
+
+def write_timings_json(path, results):
+    reports = [result.timings for result in results if result.timings is not None]
+    installs = list({id(result.install): result.install for result in results if result.install}.values())
+    with open(path, 'w') as file:
+        json.dump({'apps': reports, 'installs': installs}, file, indent=2)
+
+
+class CommandRunner:
+    """Runs commands (argument lists, no shell) for one app.
+
+    Every command's exit code and wall time is kept in ``results`` (and in
+    ``timings``), and a failing command raises CommandError straight away.
+    With ``quiet``, commands aren't echoed and their output is captured
+    instead of shown; a failing command's stderr goes into the CommandError.
+    """
+
+    def __init__(self, timings, styles=fancy_text, quiet=False):
+        self.results = []
+        self.timings = timings
+        self.styles = styles
+        self.quiet = quiet
+        self.lock = threading.Lock()
+
+    def run(self, command, cwd=None, print_it=True, check=True, input=None):
+        if print_it and not self.quiet:
+            print("\n{cyan}{command}{end}".format(command=shlex.join(command), **self.styles))
+        output = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE} if self.quiet else {}
+        started = time.monotonic()
+        try:
+            with self.timings.measure('command', shlex.join(command)):
+                completed = subprocess.run(command, cwd=cwd, input=input, **output)
+        except OSError as exc:
+            raise CommandError(f"Couldn't run `{shlex.join(command)}`: {exc}")
+        returncode = completed.returncode
+        elapsed = time.monotonic() - started
+        with self.lock:
+            self.results.append((command, returncode, elapsed))
+        if check and returncode != 0:
+            stderr = completed.stderr.decode(errors='replace').strip() if completed.stderr else ''
+            raise CommandError(f"`{shlex.join(command)}` failed with exit status {returncode} after {elapsed:.1f}s"
+                               + (f":\n{stderr}" if stderr else ''))
+        return returncode
+
+    def run_parallel(self, *tasks):
+        """Call independent ``tasks`` at the same time, re-raising the first failure."""
+        with ThreadPoolExecutor(max_workers=max(1, len(tasks))) as pool:
+            futures = [pool.submit(task) for task in tasks]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    pool.shutdown(cancel_futures=True)
+                    raise future.exception()
+        return [future.result() for future in futures]
+
+
+def echo(args, message, **values):
+    """Print ``message`` formatted with ``values`` and the app's text styles, unless ``quiet``."""
+    if not args.quiet:
+        print(message.format(**values, **args.fancy_text))
+
+
+def print_cyan(args, s):
+    echo(args, "\n{cyan}{s}{end}", s=s)
 
 
 def mkdir_p(path):
@@ -440,4 +1938,265 @@ def mkdir_p(path):
         else:
             raise
 
-main()
+
+def verify_combinations():
+    """{name: features} of every combination of VERIFY_FEATURES that can be created, fewest features first.
+
+    Features are only combined with the features they need (otherwise their
+    prompt is never asked), so no two combinations create the same app.
+    """
+    combinations = {}
+    for enabled in itertools.product((False, True), repeat=len(VERIFY_FEATURES)):
+        features = [name for name, on in zip(VERIFY_FEATURES, enabled) if on]
+        if all(needed in features for name in features for needed in VERIFY_FEATURES[name][1]):
+            combinations['+'.join(features) or 'minimal'] = features
+    return dict(sorted(combinations.items(), key=lambda item: len(item[1])))
+
+
+def verify_config(features, parent_dir):
+    """The Config of the app with ``features`` (and tests) that `verify` creates in ``parent_dir``."""
+    return Config(
+        app_name=VERIFY_APP_NAME,
+        parent_dir=parent_dir,
+        quiet=True,
+        no_color=True,
+        builtin_skeleton=True,
+        with_tests=True,
+        with_bootstrap=False,
+        with_precommit=False,
+        with_ci=False,
+        install_now=False,
+        **{field: name in features for name, (field, needed) in VERIFY_FEATURES.items()},
+    )
+
+
+@dataclasses.dataclass
+class VerifyResult:
+    """How one `verify` combination did.
+
+    ``returncode`` is pytest's exit status, or None if the app couldn't be
+    created; ``summary`` is pytest's last line (or the error) and ``output``
+    everything pytest printed.
+    """
+    name: str
+    repo_dir: str | None = None
+    returncode: int | None = None
+    summary: str = ''
+    output: str = ''
+    generate_seconds: float = 0.0
+    test_seconds: float = 0.0
+
+    @property
+    def passed(self):
+        return self.returncode == 0
+
+
+def verify_combination(name, features, work_dir, python):
+    """Create the app for one combination in ``work_dir``/``name`` and run its tests with ``python``.
+
+    Runs in a `verify` worker process. The app isn't installed: its
+    directory goes on PYTHONPATH, so every combination can share ``python``.
+    """
+    parent_dir = os.path.join(work_dir, name)
+    shutil.rmtree(parent_dir, ignore_errors=True)
+    created = generate(verify_config(features, parent_dir))
+    result = VerifyResult(name, created.repo_dir, generate_seconds=created.elapsed)
+    if not created.succeeded:
+        result.summary = f"Couldn't create the app: {created.error}"
+        return result
+
+    pytest = [python, '-m', 'pytest', '-q', '-p', 'no:cacheprovider']
+    # The benchmarks seed their own database, so (as in CI) they run separately, once each, as tests
+    commands = [pytest, pytest + ['benchmarks', '--benchmark-disable']] if 'benchmarks' in features else [pytest]
+    env = {key: value for key, value in os.environ.items() if key != 'DJANGO_SETTINGS_MODULE'}
+    env['PYTHONPATH'] = created.repo_dir
+    started = time.monotonic()
+    outputs, summaries = [], []
+    for command in commands:
+        completed = subprocess.run(command, cwd=created.repo_dir, env=env, text=True,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        lines = completed.stdout.strip().splitlines()
+        outputs.append(completed.stdout)
+        summaries.append(lines[-1].strip('= ') if lines else f'pytest exited with status {completed.returncode}')
+        if completed.returncode != 0:
+            break
+    result.test_seconds = time.monotonic() - started
+    result.returncode = completed.returncode
+    result.output = '\n'.join(outputs)
+    result.summary = '; '.join(summaries)
+    return result
+
+
+def prepare_verify_venv(venv_dir, work_dir, runner, find_links=None, no_index=False):
+    """The Python of ``venv_dir``, a virtualenv with the dependencies of every `verify` combination.
+
+    The dependencies are those of the app with every feature, installed by
+    one pip run (the app itself is uninstalled again). An existing venv is
+    reused as long as that app's setup.py hasn't changed.
+    """
+    everything = generate(verify_config(list(VERIFY_FEATURES), os.path.join(work_dir, 'requirements')))
+    if not everything.succeeded:
+        raise ScaffoldError(f"Couldn't create the app to take the requirements from: {everything.error}")
+    requirements = hashlib.sha256(read_file(os.path.join(everything.repo_dir, 'setup.py'))).hexdigest().encode()
+    python = os.path.join(venv_dir, 'Scripts' if os.name == 'nt' else 'bin', 'python')
+    marker = os.path.join(venv_dir, '.startreusableapp-requirements')
+    if os.path.exists(python) and read_file(marker) == requirements:
+        return python
+
+    runner.run([sys.executable, '-m', 'venv', venv_dir])
+    runner.run(pip_install_command([f'{everything.repo_dir}[test,benchmark]'], find_links, no_index, python=python))
+    runner.run([python, '-m', 'pip', 'uninstall', '--yes', VERIFY_APP_NAME])
+    with open(marker, 'wb') as file:
+        file.write(requirements)
+    return python
+
+
+def build_verify_parser():
+    """The parser for `startreusableapp verify`."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='startreusableapp verify',
+        description="Create an app for every combination of features and run each one's tests",
+    )
+    parser.add_argument('combinations', nargs='*', metavar='COMBINATION',
+                        help='Combinations to verify, as named by --list (default: all)')
+    parser.add_argument('--with', dest='required', action='append', default=[], choices=VERIFY_FEATURES,
+                        metavar='FEATURE', help='Only verify combinations with FEATURE (repeatable)')
+    parser.add_argument('--without', dest='excluded', action='append', default=[], choices=VERIFY_FEATURES,
+                        metavar='FEATURE', help='Only verify combinations without FEATURE (repeatable)')
+    parser.add_argument('--list', dest='list', default=False, action='store_true',
+                        help='List the selected combinations and exit')
+    parser.add_argument('--workers', dest='workers', type=int, default=os.cpu_count() or 1,
+                        help='Test suites to run at the same time (default: one per CPU)')
+    parser.add_argument('--venv', dest='venv', default=os.path.join(default_asset_cache(), 'verify-venv'),
+                        help='Virtualenv to run the suites in, created or updated as needed '
+                             '(default: ~/.cache/startreusableapp/verify-venv)')
+    parser.add_argument('--python', dest='python', default=None,
+                        help='Run the suites with this Python as it is, instead of the virtualenv')
+    parser.add_argument('--find-links', dest='find_links', default=None,
+                        help='Also look for packages here when preparing the virtualenv')
+    parser.add_argument('--no-index', dest='no_index', default=False, action='store_true',
+                        help='Prepare the virtualenv from --find-links only, without PyPI')
+    parser.add_argument('--work-dir', dest='work_dir', default=None,
+                        help='Create the apps here and keep them (default: a temporary directory, removed afterwards)')
+    parser.add_argument('--no-color', dest='no_color', default=False, action='store_true',
+                        help='Disable colored output')
+    return parser
+
+
+def verify_main(argv):
+    """`startreusableapp verify`: test the apps every chosen feature combination creates, in parallel."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    parser = build_verify_parser()
+    options = parser.parse_args(argv)
+    styles = text_styles(options.no_color)
+    combinations = verify_combinations()
+    unknown = [name for name in options.combinations if name not in combinations]
+    if unknown:
+        parser.error(f"unknown combination(s): {', '.join(unknown)} (see --list)")
+    selected = {
+        name: features for name, features in combinations.items()
+        if (not options.combinations or name in options.combinations)
+        and all(feature in features for feature in options.required)
+        and not any(feature in features for feature in options.excluded)
+    }
+    if options.list:
+        print('\n'.join(selected))
+        return 0
+    if not selected:
+        parser.error('no combination matches --with/--without')
+
+    work_dir = options.work_dir or tempfile.mkdtemp(prefix='startreusableapp-verify-')
+    os.makedirs(work_dir, exist_ok=True)
+    started = time.monotonic()
+    results = {}
+    try:
+        python = options.python
+        if python is None:
+            print("{b}Preparing {venv}{end}".format(venv=options.venv, **styles))
+            runner = CommandRunner(Timings('verify'), styles, quiet=True)
+            python = prepare_verify_venv(options.venv, work_dir, runner, options.find_links, options.no_index)
+
+        workers = max(1, min(options.workers, len(selected)))
+        print("{b}Verifying {count} combination(s) with {workers} workers{end}".format(
+            count=len(selected), workers=workers, **styles))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(verify_combination, name, features, work_dir, python)
+                       for name, features in selected.items()]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.name] = result
+                print("  {status}  {name} ({summary}; created in {generate:.1f}s, tested in {test:.1f}s)".format(
+                    status="{cyan}PASS{end}".format(**styles) if result.passed else "{red}FAIL{end}".format(**styles),
+                    name=result.name, summary=result.summary,
+                    generate=result.generate_seconds, test=result.test_seconds, **styles))
+    except ScaffoldError as exc:
+        print("{red}{error}{end}".format(error=exc, **styles))
+        return 1
+    finally:
+        if not options.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    failures = [results[name] for name in selected if not results[name].passed]
+    for result in failures:
+        print("\n{b}{name}{end}".format(name=result.name, **styles))
+        print('\n'.join(result.output.strip().splitlines()[-40:]) or result.summary)
+    print(f"\n{len(selected) - len(failures)} passed, {len(failures)} failed in {time.monotonic() - started:.1f}s")
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    """The command line: create the app(s) described by ``argv`` and return the exit status.
+
+    ``startreusableapp verify ...`` runs verify_main() instead.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['verify']:
+        return verify_main(argv[1:])
+    parser = build_parser()
+    options = parser.parse_args(argv)
+    styles = text_styles(options.no_color)
+    if options.build_zipapp:
+        try:
+            build_zipapp(options.build_zipapp)
+        except (ScaffoldError, OSError) as exc:
+            print("{red}{error}{end}".format(error=exc, **styles))
+            return 1
+        print(f"Wrote {options.build_zipapp}")
+        return 0
+    if not options.manifest and not (options.app_name and options.parent_dir):
+        parser.error('app_name and parent_dir are required unless --manifest or --build-zipapp is given')
+    config_options = {key: value for key, value in vars(options).items() if key in CONFIG_FIELDS}
+
+    profiler = None
+    if options.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    results = []
+    try:
+        template_registry()
+        if options.manifest:
+            configs = load_manifest(options.manifest, config_options)
+            # cProfile only sees the main thread, so profile the apps one at a time
+            results = batch_main(configs, 1 if options.profile else max(1, options.workers), styles)
+        else:
+            results = [generate(Config(**config_options))]
+            if results[0].error is not None:
+                raise results[0].error
+    except ScaffoldError as exc:
+        print("{red}{error}{end}".format(error=exc, **styles))
+        return 1
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(options.profile)
+        if options.timings_json:
+            write_timings_json(options.timings_json, results)
+    return 0 if all(result.succeeded for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
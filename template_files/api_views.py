@@ -1,14 +1,18 @@
+import json
+import os
+import threading
+
+from django.conf import settings
+from django.utils.translation import get_language
 from rest_framework import generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from drf_spectacular.views import SpectacularAPIView
-from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.generators import EndpointEnumerator, SchemaGenerator
+from drf_spectacular.renderers import OpenApiJsonRenderer
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.plumbing import (
-    normalize_result_object, sanitize_result_object,
-)
 
 from .serializers import ${app_name_capitalized}Serializer
 
@@ -18,16 +22,78 @@ class ${app_name_capitalized}ListCreateView(generics.ListCreateAPIView):
     serializer_class = ${app_name_capitalized}Serializer
 
 
+# Only endpoints whose path contains this go into the schema
+SCHEMA_PATH_FRAGMENT = '/$app_name_lowercase/'
+
+# Public schemas built by this process, by (API version, language)
+_schemas = {}
+_schemas_lock = threading.Lock()
+
+
+class AppEndpointEnumerator(EndpointEnumerator):
+    def get_api_endpoints(self, patterns=None, prefix=''):
+        """ Just the $app_name endpoints, so no view or operation is built for other apps. """
+        return [
+            endpoint for endpoint in super().get_api_endpoints(patterns, prefix)
+            if SCHEMA_PATH_FRAGMENT in endpoint[0]
+        ]
+
+
+def schema_file(version=None, language=None):
+    """ Where the schema is persisted, if the API_SCHEMA_CACHE_DIR setting is set.
+
+    Point it at a directory that belongs to one deploy (e.g. inside the
+    release directory), so a new deploy never serves an old schema.
+    """
+    directory = getattr(settings, 'API_SCHEMA_CACHE_DIR', None)
+    if not directory:
+        return None
+    filename = f'${module_name}-{version or "default"}-{language or "default"}.json'
+    return os.path.join(directory, filename)
+
+
+def save_schema(schema, version=None, language=None):
+    path = schema_file(version, language)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # The renderer the schema view uses, so lazy strings, decimals etc. come out the same
+    with open(path + '.tmp', 'wb') as file:
+        file.write(OpenApiJsonRenderer().render(schema, renderer_context={}))
+    os.replace(path + '.tmp', path)
+    return path
+
+
 class FilteredSchemaGenerator(SchemaGenerator):
+    endpoint_inspector_cls = AppEndpointEnumerator
+
+    def build_schema(self, request=None, public=False):
+        """ Generate an OpenAPI schema for just the $app_name app, without any caching. """
+        return super().get_schema(request, public)
+
     def get_schema(self, request=None, public=False):
-        """ Generate an OpenAPI schema for just the $app_name app. """
-        result = super().get_schema(request, public)
-        filtered_paths = {}
-        for path, path_data in result['paths'].items():
-            if '/$app_name_lowercase/' in path:
-                filtered_paths[path] = path_data
-        result['paths'] = filtered_paths
-        return sanitize_result_object(normalize_result_object(result))
+        """ The $app_name schema, built once per process (or deploy, with API_SCHEMA_CACHE_DIR).
+
+        Non-public schemas depend on the requesting user's permissions, so
+        they are never cached.
+        """
+        if not public:
+            return self.build_schema(request, public)
+        version = self.api_version or getattr(request, 'version', None)
+        key = (version, get_language())
+        with _schemas_lock:
+            if key not in _schemas:
+                _schemas[key] = self.load_schema(*key) or self.build_schema(request, public)
+            return _schemas[key]
+
+    @staticmethod
+    def load_schema(version, language):
+        path = schema_file(version, language)
+        if path is None:
+            return None
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
 
 
 @extend_schema(exclude=True)
@@ -5,13 +5,19 @@ All views require authentication and automatically scope data to the requesting
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import json
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator
 
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
 from .models import ExampleModel
 from .serializers import ExampleModelSerializer
@@ -20,19 +26,41 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
 
+class ExampleModelCursorPagination(CursorPagination):
+    """
+    Cursor pagination over the (user, -created_at) index.
+
+    Each page is one indexed range query, however deep the client pages,
+    and there is no COUNT(*) over the user's rows.
+    """
+    ordering = '-created_at'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
 class ExampleModelViewSet(viewsets.ModelViewSet):
     """
     ViewSet for ExampleModel with automatic user scoping.
 
     Only returns objects owned by the authenticated user.
     Automatically assigns the current user when creating new objects.
+    Lists are cursor-paginated and load only the serialized columns.
     """
     serializer_class = ExampleModelSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = ExampleModelCursorPagination
 
     def get_queryset(self) -> QuerySet[ExampleModel]:
         """Filter queryset to only include objects owned by the current user."""
-        return ExampleModel.objects.filter(user=self.request.user)
+        # `user` is serialized as its primary key, which DRF reads from
+        # `user_id`, so no select_related('user') join is needed. Add one
+        # (and `user__<field>` to only()) if the serializer shows user fields.
+        return (
+            ExampleModel.objects
+            .filter(user=self.request.user)
+            .only(*ExampleModelSerializer.Meta.fields)
+        )
 
     def perform_create(self, serializer: ExampleModelSerializer) -> None:
         """Automatically assign the current user when creating objects."""
@@ -45,11 +73,78 @@ def example_api_view(request: Request) -> Response:
     """
     Example function-based API view with authentication.
 
-    Returns user-scoped data for the authenticated user.
+    Returns user-scoped data for the authenticated user. The count comes
+    from the rows already fetched, so this is a single query.
     """
     examples = ExampleModel.objects.filter(user=request.user)
-    serializer = ExampleModelSerializer(examples, many=True)
+    results = ExampleModelSerializer(examples, many=True).data
     return Response({
-        'count': examples.count(),
-        'results': serializer.data
+        'count': len(results),
+        'results': results
     })
+
+
+# Rows fetched per database round trip (and per chunk written) when streaming
+STREAM_CHUNK_SIZE = 2000
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Newline-delimited JSON: one object per line."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        # Only used for non-streamed responses, like authentication errors
+        return json.dumps(data, cls=JSONEncoder).encode() + b'\n'
+
+
+def batched(iterable: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def stream_examples(queryset: QuerySet[ExampleModel], ndjson: bool) -> Iterator[str]:
+    """
+    Serialize ``queryset`` chunk by chunk, as NDJSON or as one JSON array.
+
+    Rows come from ``iterator()`` (a server-side cursor where the database
+    supports one), so memory stays flat however many rows there are.
+    """
+    serializer = ExampleModelSerializer()
+    rows = (
+        json.dumps(serializer.to_representation(example), cls=JSONEncoder)
+        for example in queryset.iterator(chunk_size=STREAM_CHUNK_SIZE)
+    )
+    if ndjson:
+        for chunk in batched(rows, STREAM_CHUNK_SIZE):
+            yield '\n'.join(chunk) + '\n'
+    else:
+        yield '['
+        for number, chunk in enumerate(batched(rows, STREAM_CHUNK_SIZE)):
+            yield (',' if number else '') + ','.join(chunk)
+        yield ']'
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@renderer_classes([JSONRenderer, NDJSONRenderer])
+def example_stream_view(request: Request) -> StreamingHttpResponse:
+    """
+    Stream every example the authenticated user owns, in a single query.
+
+    Responds with a JSON array by default, or NDJSON for
+    ``Accept: application/x-ndjson`` or ``?format=ndjson``. There is no
+    count: clients that need one can count the rows as they arrive.
+    """
+    renderer = request.accepted_renderer
+    examples = (
+        ExampleModel.objects
+        .filter(user=request.user)
+        .only(*ExampleModelSerializer.Meta.fields)
+    )
+    return StreamingHttpResponse(
+        stream_examples(examples, ndjson=renderer.format == 'ndjson'),
+        content_type=renderer.media_type,
+    )
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ${camel_case_app_name}Config(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = '${module_name}'
+
+    def ready(self):
+        # Connect the cache invalidation signal receivers
+        from . import caching  # noqa: F401
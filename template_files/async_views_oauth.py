@@ -0,0 +1,107 @@
+"""
+Async views for ${app_name}'s ExampleModel, for ASGI servers (uvicorn, daphne, hypercorn).
+
+Under ASGI these run on the event loop and use Django's async ORM, so a
+request doesn't hop to a thread pool. They are plain Django views because
+DRF's views are synchronous. The user comes from AuthenticationMiddleware
+(sessions, or django-oauth-toolkit's OAuth2TokenMiddleware for bearer
+tokens), and data is scoped to them just like in api_views.py. As with
+DRF's SessionAuthentication, only session-authenticated writes need a CSRF
+token.
+"""
+from __future__ import annotations
+
+import json
+
+from django.contrib.auth import SESSION_KEY
+from django.contrib.auth.base_user import AbstractBaseUser
+from django.http import HttpRequest, JsonResponse
+from django.middleware.csrf import CsrfViewMiddleware
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+
+from .models import ExampleModel
+from .serializers import ExampleModelSerializer
+
+
+# Examples returned by one list request, by default and at most
+ASYNC_PAGE_SIZE = 50
+ASYNC_MAX_PAGE_SIZE = 500
+
+
+def unauthorized() -> JsonResponse:
+    return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+
+class CSRFCheck(CsrfViewMiddleware):
+    def _reject(self, request: HttpRequest, reason: str) -> str:
+        return reason
+
+
+async def csrf_failure(request: HttpRequest, user: AbstractBaseUser) -> str | None:
+    """
+    Why a write by ``user`` fails CSRF validation, or None if it passes.
+
+    Only users logged in through the session cookie, which browsers send
+    cross-site, are checked. Bearer tokens are never sent automatically.
+    """
+    # aget() also loads the session, so CSRF_USE_SESSIONS needs no sync query below
+    if await request.session.aget(SESSION_KEY) != user._meta.pk.value_to_string(user):
+        return None
+    check = CSRFCheck(lambda request: None)
+    check.process_request(request)
+    return check.process_view(request, None, (), {})
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class ExampleModelAsyncView(View):
+    """
+    List (newest first, ``?limit=`` at a time) and create the user's examples.
+    """
+
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        user = await request.auser()
+        if not user.is_authenticated:
+            return unauthorized()
+        try:
+            limit = min(int(request.GET.get('limit', ASYNC_PAGE_SIZE)), ASYNC_MAX_PAGE_SIZE)
+        except ValueError:
+            return JsonResponse({'limit': ['A valid integer is required.']}, status=400)
+
+        examples = (
+            ExampleModel.objects
+            .filter(user=user)
+            .only(*ExampleModelSerializer.Meta.fields)[:max(limit, 0)]
+        )
+        serializer = ExampleModelSerializer()
+        results = [serializer.to_representation(example) async for example in examples]
+        return JsonResponse({'results': results})
+
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        user = await request.auser()
+        if not user.is_authenticated:
+            return unauthorized()
+        reason = await csrf_failure(request, user)
+        if reason:
+            return JsonResponse({'detail': f'CSRF Failed: {reason}'}, status=403)
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({'detail': 'Expected a JSON object.'}, status=400)
+
+        serializer = ExampleModelSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+        example = await ExampleModel.objects.acreate(user=user, **serializer.validated_data)
+        return JsonResponse(ExampleModelSerializer(example).data, status=201)
+
+
+@require_GET
+async def example_count_view(request: HttpRequest) -> JsonResponse:
+    """The number of examples the user owns, from one COUNT query."""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return unauthorized()
+    return JsonResponse({'count': await ExampleModel.objects.filter(user=user).acount()})
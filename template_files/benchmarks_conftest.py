@@ -0,0 +1,42 @@
+"""
+Fixtures for ${app_name}'s benchmarks.
+
+The test database is seeded once per session with ``--bench-users`` users
+owning ``--bench-rows`` examples each.
+"""
+import pytest
+from django.core.cache import cache
+
+from .seed import seed
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('${app_name} benchmarks')
+    group.addoption('--bench-users', type=int, default=3, help='Users to seed (default: 3)')
+    group.addoption(
+        '--bench-rows', type=int, default=1000, help='Examples seeded per user (default: 1000)'
+    )
+
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker, request):
+    """Seed the test database once, right after it is created."""
+    with django_db_blocker.unblock():
+        seed(request.config.getoption('bench_users'), request.config.getoption('bench_rows'))
+
+
+@pytest.fixture
+def bench_user(db):
+    """The first seeded user."""
+    return seed(1, 0)[0]
+
+
+@pytest.fixture
+def bench_client(bench_user):
+    """An API client logged in as ``bench_user``, with an empty cache."""
+    from rest_framework.test import APIClient
+
+    cache.clear()
+    client = APIClient()
+    client.force_authenticate(user=bench_user)
+    return client
@@ -0,0 +1,196 @@
+"""
+Load test ${app_name}'s API with a plain asyncio HTTP/1.1 client.
+
+Start the project (``gunicorn``, ``uvicorn`` or ``runserver``), seed it with
+``python -m benchmarks.seed``, then pass the URL the app's urls.py is
+included under, and the printed session cookies (or OAuth2 tokens):
+
+    python benchmarks/loadtest.py http://localhost:8000/${module_name}/ \\
+        --cookie sessionid=... --concurrency 20 --duration 30
+
+Each worker keeps one connection open and requests the endpoints in turn.
+Throughput, errors and p50/p95/p99 latency are reported per endpoint.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import ssl
+import statistics
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlsplit
+
+
+# Endpoints from urls.py, relative to the base URL; {id} is one of the user's examples
+ENDPOINTS = {
+    'list': 'api/examples/',
+    'detail': 'api/examples/{id}/',
+    'custom': 'api/custom-example/',
+}
+
+
+@dataclass
+class Stats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, base_url: str, headers: dict[str, str]):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == 'https'
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.https else 80)
+        self.headers = {'Host': parts.netloc, 'Accept': 'application/json', **headers}
+        self.reader = self.writer = None
+
+    async def request(self, path: str) -> tuple[int, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host,
+                self.port,
+                ssl=ssl.create_default_context() if self.https else None,
+            )
+        lines = [f'GET {path} HTTP/1.1']
+        lines.extend(f'{name}: {value}' for name, value in self.headers.items())
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        try:
+            status, headers, body = await self.read_response()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            await self.close()
+            raise
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, body
+
+    async def read_response(self) -> tuple[int, dict[str, str], bytes]:
+        status = int((await self.reader.readuntil(b'\r\n')).split()[1])
+        headers = {}
+        while (line := await self.reader.readuntil(b'\r\n')) != b'\r\n':
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while size := int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16):
+                chunks.append(await self.reader.readexactly(size + 2))
+            await self.reader.readuntil(b'\r\n')
+            body = b''.join(chunk[:-2] for chunk in chunks)
+        elif 'content-length' in headers:
+            body = await self.reader.readexactly(int(headers['content-length']))
+        else:
+            body = await self.reader.read()
+            headers['connection'] = 'close'
+        return status, headers, body
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+async def example_ids(base_url: str, headers: dict[str, str]) -> list[int]:
+    """Ids of the user's first page of examples, for the detail endpoint."""
+    connection = Connection(base_url, headers)
+    status, body = await connection.request(urlsplit(urljoin(base_url, ENDPOINTS['list'])).path)
+    await connection.close()
+    if status != 200:
+        raise SystemExit(
+            f'Listing examples returned HTTP {status}; check the base URL and credentials'
+        )
+    return [example['id'] for example in json.loads(body)['results']]
+
+
+async def worker(
+    base_url: str,
+    headers: dict[str, str],
+    ids: list[int],
+    endpoints: list[str],
+    deadline: float,
+    stats: dict[str, Stats],
+) -> None:
+    connection = Connection(base_url, headers)
+    paths = {name: urlsplit(urljoin(base_url, ENDPOINTS[name])).path for name in endpoints}
+    id_cycle = itertools.cycle(ids or [0])
+    for name in itertools.cycle(endpoints):
+        if time.monotonic() >= deadline:
+            break
+        started = time.perf_counter()
+        try:
+            status, _ = await connection.request(paths[name].format(id=next(id_cycle)))
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            status = 0
+        if status == 200:
+            stats[name].latencies.append(time.perf_counter() - started)
+        else:
+            stats[name].errors += 1
+    await connection.close()
+
+
+def percentile(values: list[float], percent: int) -> float:
+    if len(values) < 2:
+        return (values or [0])[0]
+    return statistics.quantiles(values, n=100)[percent - 1]
+
+
+def report(stats: dict[str, Stats], elapsed: float) -> None:
+    print(
+        f"{'endpoint':<10} {'requests':>9} {'errors':>7} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for name, endpoint in stats.items():
+        values = endpoint.latencies
+        print(
+            f'{name:<10} {len(values):>9} {endpoint.errors:>7} {len(values) / elapsed:>8.1f} '
+            + ' '.join(f'{percentile(values, percent) * 1000:>8.1f}' for percent in (50, 95, 99))
+        )
+    total = sum(len(endpoint.latencies) for endpoint in stats.values())
+    print(f'{total} requests in {elapsed:.1f}s: {total / elapsed:.1f} req/s')
+
+
+async def run(options: argparse.Namespace) -> None:
+    base_url = options.base_url.rstrip('/') + '/'
+    credentials = [{'Cookie': cookie} for cookie in options.cookie]
+    credentials += [{'Authorization': f'Bearer {token}'} for token in options.token]
+    if not credentials:
+        raise SystemExit(
+            'Pass at least one --cookie or --token; the API only serves logged-in users'
+        )
+
+    ids = await asyncio.gather(*(example_ids(base_url, headers) for headers in credentials))
+    stats = {name: Stats() for name in options.endpoint}
+    started = time.monotonic()
+    deadline = started + options.duration
+    await asyncio.gather(*(
+        worker(base_url, credentials[index % len(credentials)], ids[index % len(credentials)],
+               options.endpoint, deadline, stats)
+        for index in range(options.concurrency)
+    ))
+    report(stats, time.monotonic() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('base_url', help="URL the app's urls.py is included under")
+    parser.add_argument('--cookie', action='append', default=[],
+                        help='Session cookie, e.g. sessionid=... (repeatable)')
+    parser.add_argument('--token', action='append', default=[],
+                        help='OAuth2 access token (repeatable)')
+    parser.add_argument('--concurrency', type=int, default=10,
+                        help='Concurrent connections (default: 10)')
+    parser.add_argument('--duration', type=float, default=10,
+                        help='Seconds to run (default: 10)')
+    parser.add_argument('--endpoint', action='append', choices=ENDPOINTS,
+                        help='Endpoint to request (repeatable; '
+                             f'default: all of {", ".join(ENDPOINTS)})')
+    options = parser.parse_args()
+    options.endpoint = options.endpoint or list(ENDPOINTS)
+    asyncio.run(run(options))
+
+
+if __name__ == '__main__':
+    main()
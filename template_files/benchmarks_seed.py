@@ -0,0 +1,79 @@
+"""
+Seed ${app_name}'s ExampleModel with rows for benchmarks and load tests.
+
+Creates ``bench-user-<n>`` users, each owning ``--rows`` examples, and
+prints a session cookie per user for ``benchmarks/loadtest.py``. Run it
+against the database of the project you'll load-test:
+
+    DJANGO_SETTINGS_MODULE=myproject.settings python -m benchmarks.seed --users 10 --rows 1000
+"""
+from __future__ import annotations
+
+import argparse
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractBaseUser
+
+
+def seed(users: int, rows_per_user: int, batch_size: int = 1000) -> list[AbstractBaseUser]:
+    """
+    Make sure ``users`` benchmark users exist, each with ``rows_per_user`` examples.
+
+    Returns:
+        The benchmark users
+    """
+    # Imported here: the CLI calls django.setup() after importing this module
+    from ${app_name}.models import ExampleModel
+
+    User = get_user_model()
+    seeded = []
+    for index in range(users):
+        user, created = User.objects.get_or_create(username=f'bench-user-{index}')
+        if created:
+            user.set_unusable_password()
+            user.save(update_fields=['password'])
+        missing = rows_per_user - ExampleModel.objects.filter(user=user).count()
+        if missing > 0:
+            ExampleModel.objects.bulk_create(
+                (
+                    ExampleModel(
+                        user=user, name=f'Example {number}', description='Seeded for benchmarks'
+                    )
+                    for number in range(missing)
+                ),
+                batch_size=batch_size,
+            )
+        seeded.append(user)
+    return seeded
+
+
+def session_cookie(user: AbstractBaseUser) -> str:
+    """A ``sessionid=...`` cookie logged in as ``user``, like Client.force_login()."""
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return f'{settings.SESSION_COOKIE_NAME}={session.session_key}'
+
+
+def main() -> None:
+    import django
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, default=10, help='Benchmark users (default: 10)')
+    parser.add_argument('--rows', type=int, default=1000, help='Examples per user (default: 1000)')
+    options = parser.parse_args()
+
+    django.setup()
+    for user in seed(options.users, options.rows):
+        print(session_cookie(user))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Queryset construction and list-page latency for ${app_name}'s ExampleModel API.
+"""
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+
+from ${app_name}.api_views import ExampleModelViewSet
+
+
+def viewset_for(user):
+    view = ExampleModelViewSet()
+    view.request = SimpleNamespace(user=user)
+    return view
+
+
+def test_build_queryset(benchmark, bench_user):
+    """Build the ViewSet's queryset and compile its SQL, without running it."""
+    view = viewset_for(bench_user)
+
+    def build():
+        query = view.get_queryset().order_by('-created_at')[:50].query
+        return query.get_compiler(connection=connection).as_sql()
+
+    sql, params = benchmark(build)
+    benchmark.extra_info['sql'] = sql
+
+
+def test_fetch_page(benchmark, bench_user):
+    """Run the queryset for one page of rows."""
+    view = viewset_for(bench_user)
+    page = benchmark(lambda: list(view.get_queryset().order_by('-created_at')[:50]))
+    benchmark.extra_info['rows'] = len(page)
+
+
+def test_list_endpoint(benchmark, bench_client):
+    """GET one page of the list endpoint, through middleware, view and renderer."""
+    url = reverse('example-list')
+    # Clear the cache between rounds, so each one measures the uncached page
+    response = benchmark.pedantic(bench_client.get, args=(url,), setup=cache.clear, rounds=50)
+    assert response.status_code == 200
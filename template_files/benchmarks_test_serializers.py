@@ -0,0 +1,36 @@
+"""
+Serializer throughput for ${app_name}'s ExampleModelSerializer.
+"""
+import pytest
+
+from ${app_name}.models import ExampleModel
+from ${app_name}.serializers import ExampleModelSerializer
+
+
+@pytest.fixture
+def examples(bench_user):
+    return list(ExampleModel.objects.filter(user=bench_user))
+
+
+def test_serialize_many(benchmark, examples):
+    """Turn every example of one user into primitive data."""
+    data = benchmark(lambda: ExampleModelSerializer(examples, many=True).data)
+    benchmark.extra_info['rows'] = len(data)
+
+
+def test_serialize_one(benchmark, examples):
+    """Turn a single example into primitive data, as retrieve does."""
+    benchmark(lambda: ExampleModelSerializer(examples[0]).data)
+
+
+def test_validate_many(benchmark, db):
+    """Validate a page of incoming examples, as create would."""
+    payload = [{'name': f'Example {i}', 'description': 'Benchmark'} for i in range(100)]
+
+    def validate():
+        serializer = ExampleModelSerializer(data=payload, many=True)
+        assert serializer.is_valid(), serializer.errors
+        return serializer.validated_data
+
+    benchmark(validate)
+    benchmark.extra_info['rows'] = len(payload)
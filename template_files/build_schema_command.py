@@ -0,0 +1,46 @@
+"""
+Prebuild the ${app_name} OpenAPI schema at deploy time.
+
+Usage:
+    python manage.py build_${module_name}_schema [--api-version VERSION] [--language LANG]
+
+Saves the schema to the API_SCHEMA_CACHE_DIR setting, where every process
+of the deploy loads it instead of generating it on the first request.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import translation
+
+from ${module_name}.api_views import FilteredSchemaGenerator, save_schema, schema_file
+
+
+class Command(BaseCommand):
+    """Build the ${app_name} OpenAPI schema and save it for this deploy."""
+
+    help = 'Build the ${app_name} OpenAPI schema and save it to API_SCHEMA_CACHE_DIR'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--api-version',
+            default=None,
+            help='API version to build the schema for (default: unversioned)',
+        )
+        parser.add_argument(
+            '--language',
+            default=settings.LANGUAGE_CODE,
+            help='Language to build the schema in (default: LANGUAGE_CODE)',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if schema_file() is None:
+            raise CommandError('Set API_SCHEMA_CACHE_DIR to a directory for this deploy first.')
+        version = options['api_version']
+        with translation.override(options['language']):
+            language = translation.get_language()
+            schema = FilteredSchemaGenerator(api_version=version).build_schema(public=True)
+        path = save_schema(schema, version, language)
+        self.stdout.write(self.style.SUCCESS(f'Saved {len(schema["paths"])} path(s) to {path}'))
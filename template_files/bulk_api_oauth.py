@@ -0,0 +1,147 @@
+"""
+Bulk create/update/delete for ${app_name}'s user-scoped ExampleModel.
+
+Each bulk request costs the same number of queries whatever its size:
+one INSERT (bulk_create), one SELECT plus one UPDATE (bulk_update), or one
+DELETE. Batches over BULK_BATCH_SIZE rows (or the database's limit on query
+parameters, like SQLite's) are split into a few statements, all in one
+transaction: a failed statement rolls back the whole request.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .models import ExampleModel
+from .serializers import ExampleModelSerializer
+
+
+# Most items accepted by one bulk request
+BULK_MAX_ITEMS = 1000
+# Most rows written by one INSERT or UPDATE statement
+BULK_BATCH_SIZE = 500
+
+
+class ExampleModelListSerializer(serializers.ListSerializer):
+    """
+    Saves a list of ExampleModels with bulk queries instead of one query per item.
+
+    For updates, ``instance`` is the ``{pk: ExampleModel}`` mapping that
+    ``in_bulk()`` returns, and every item in ``data`` carries its ``id``.
+    """
+
+    def run_child_validation(self, data: Any) -> Any:
+        if self.instance is not None:
+            self.child.instance = self.instance.get(data.get('id'))
+            self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def create(self, validated_data: list[dict[str, Any]]) -> list[ExampleModel]:
+        return ExampleModel.objects.bulk_create(
+            [ExampleModel(**attrs) for attrs in validated_data], batch_size=BULK_BATCH_SIZE
+        )
+
+    def update(
+        self, instance: dict[int, ExampleModel], validated_data: list[dict[str, Any]]
+    ) -> list[ExampleModel]:
+        # validated_data is in the same order as the request's items
+        now = timezone.now()
+        examples = []
+        fields = {'updated_at'}
+        for item, attrs in zip(self.initial_data, validated_data):
+            example = instance[item['id']]
+            for field, value in attrs.items():
+                setattr(example, field, value)
+            # bulk_update() doesn't apply auto_now
+            example.updated_at = now
+            fields.update(attrs)
+            examples.append(example)
+        ExampleModel.objects.bulk_update(examples, sorted(fields), batch_size=BULK_BATCH_SIZE)
+        return examples
+
+
+class ExampleModelBulkSerializer(ExampleModelSerializer):
+    """ExampleModelSerializer that saves ``many=True`` data in bulk."""
+
+    class Meta(ExampleModelSerializer.Meta):
+        list_serializer_class = ExampleModelListSerializer
+
+
+class BulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=BULK_MAX_ITEMS,
+    )
+
+
+class ExampleModelBulkMixin:
+    """
+    Adds ``<prefix>/bulk/`` to a user-scoped ExampleModel ViewSet.
+
+    - POST a list of objects to create them all for the requesting user
+    - PATCH a list of objects, each with its ``id``, to update them
+    - DELETE ``{"ids": [...]}`` to delete those of the user's objects
+    """
+
+    def get_bulk_serializer(self, *args: Any, **kwargs: Any) -> ExampleModelListSerializer:
+        kwargs.setdefault('context', self.get_serializer_context())
+        return ExampleModelBulkSerializer(
+            *args, many=True, allow_empty=False, max_length=BULK_MAX_ITEMS, **kwargs
+        )
+
+    def bulk_saved(self, user: Any) -> None:
+        """Called after bulk_create/bulk_update, which don't send post_save signals."""
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request: Request) -> Response:
+        """Create every object in the request body with one INSERT."""
+        serializer = self.get_bulk_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save(user=request.user)
+            self.bulk_saved(request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @bulk.mapping.patch
+    def bulk_update(self, request: Request) -> Response:
+        """Update the user's objects listed in the request body with one UPDATE."""
+        items = request.data
+        has_ids = isinstance(items, list) and all(
+            isinstance(item, dict) and 'id' in item for item in items
+        )
+        if not has_ids:
+            raise ValidationError('Expected a list of objects, each with an "id".')
+        try:
+            ids = [int(item['id']) for item in items]
+        except (TypeError, ValueError):
+            raise ValidationError('Every "id" must be an integer.')
+        instances = self.get_queryset().in_bulk(ids)
+        missing = sorted(set(ids) - set(instances))
+        if missing:
+            raise NotFound(f'No such examples: {", ".join(map(str, missing))}')
+        for item, pk in zip(items, ids):
+            item['id'] = pk
+        serializer = self.get_bulk_serializer(instances, data=items, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+            self.bulk_saved(request.user)
+        return Response(serializer.data)
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request: Request) -> Response:
+        """Delete the user's objects whose ids are listed, with one DELETE."""
+        serializer = BulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        examples = self.get_queryset().filter(pk__in=serializer.validated_data['ids'])
+        with transaction.atomic():
+            deleted, _ = examples.delete()
+        return Response({'deleted': deleted})
@@ -0,0 +1,145 @@
+"""
+Per-user caching and conditional GETs for ${app_name}'s ExampleModel API.
+
+Each user's examples have a *version*: the time they last changed. It is
+kept in the cache, moves forward whenever a model signal says the user's
+examples changed (once the change is committed), and never moves back, even
+when the newest example is deleted. ETags and Last-Modified headers are
+both derived from it, so an unchanged list answers
+``If-None-Match``/``If-Modified-Since`` with a 304 without touching the
+database, and list pages are cached per user and keyed by their ETag.
+
+``QuerySet.update()``, ``bulk_create()`` and ``bulk_update()`` don't send
+signals: call ``invalidate_examples()`` after using them.
+"""
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .models import ExampleModel
+
+
+# Seconds a cached page lives without any change
+CACHE_TIMEOUT = 300
+
+
+def version_key(user_id: int) -> str:
+    return f'${module_name}:examples:{user_id}:version'
+
+
+def page_key(user_id: int, etag: str) -> str:
+    return f'${module_name}:examples:{user_id}:page:{etag}'
+
+
+def examples_version(user_id: int) -> datetime:
+    """When the user's examples last changed, from the cache (no query)."""
+    version = cache.get(version_key(user_id))
+    if version is None:
+        # Never recorded, or evicted: whatever was served before is stale
+        version = bump_examples_version(user_id)
+    return version
+
+
+def bump_examples_version(user_id: int) -> datetime:
+    """
+    Move the user's version forward, by at least a second.
+
+    Last-Modified and If-Modified-Since only have one-second resolution, so
+    two changes within a second must still get different Last-Modified
+    values.
+    """
+    previous = cache.get(version_key(user_id))
+    version = timezone.now().replace(microsecond=0)
+    if previous is not None and version <= previous:
+        version = previous + timedelta(seconds=1)
+    cache.set(version_key(user_id), version, None)
+    return version
+
+
+def examples_etag(user_id: int, version: datetime, *parts: str) -> str:
+    """A strong ETag for a response that depends on ``version`` and ``parts`` (e.g. the URL)."""
+    key = '|'.join([str(user_id), version.isoformat(), *parts])
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def invalidate_examples(user_id: int) -> None:
+    """
+    Move the user's version forward once the current transaction commits.
+
+    Not before: a concurrent request could otherwise cache the rows it still
+    sees under the new version, and serve them until CACHE_TIMEOUT.
+    """
+    transaction.on_commit(lambda: bump_examples_version(user_id))
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=ExampleModel,
+    dispatch_uid='${module_name}_invalidate_examples',
+)
+def examples_changed(sender: type[ExampleModel], instance: ExampleModel, **kwargs: Any) -> None:
+    invalidate_examples(instance.user_id)
+
+
+class ExampleModelCacheMixin:
+    """
+    Conditional GETs and a per-user page cache for a user-scoped ExampleModel ViewSet.
+
+    ``list`` and ``retrieve`` send ETag and Last-Modified headers and answer
+    matching conditional requests with 304. List pages are cached per
+    user under their ETag, so a repeated request costs no queries.
+    """
+
+    def conditional_response(self, request: Request) -> tuple[Response | None, str, datetime]:
+        # Read before any rows, so rows older than the version are never cached under it
+        version = examples_version(request.user.pk)
+        etag = examples_etag(request.user.pk, version, request.build_absolute_uri())
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=int(version.timestamp()),
+        )
+        return not_modified, etag, version
+
+    def finalize_cached(self, response: Any, etag: str, last_modified: datetime) -> Any:
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+        # Per user: shared caches must not store it, clients must revalidate
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization', 'Cookie'])
+        return response
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        not_modified, etag, last_modified = self.conditional_response(request)
+        if not_modified is not None:
+            return self.finalize_cached(not_modified, etag, last_modified)
+        key = page_key(request.user.pk, etag)
+        data = cache.get(key)
+        if data is None:
+            response = super().list(request, *args, **kwargs)
+            cache.set(key, response.data, CACHE_TIMEOUT)
+        else:
+            response = Response(data)
+        return self.finalize_cached(response, etag, last_modified)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        not_modified, etag, last_modified = self.conditional_response(request)
+        if not_modified is not None:
+            return self.finalize_cached(not_modified, etag, last_modified)
+        return self.finalize_cached(super().retrieve(request, *args, **kwargs), etag, last_modified)
+
+    def bulk_saved(self, user: Any) -> None:
+        """Bulk endpoints don't send post_save, so they call this after saving."""
+        invalidate_examples(user.pk)
+        super().bulk_saved(user)
@@ -8,35 +8,58 @@ from django.contrib.auth import get_user_model
 User = get_user_model()
 
 
-@pytest.fixture
-def user(db):
-    """Create a test user."""
-    return User.objects.create_user(
-        username='testuser',
-        email='test@example.com',
-        password='testpass123'
-    )
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty (local-memory) cache."""
+    from django.core.cache import cache
+    cache.clear()
+    yield
+    cache.clear()
+
+
+# Users created once per test session, see django_db_setup
+SESSION_USERS = {
+    'user': {'username': 'testuser', 'email': 'test@example.com', 'password': 'testpass123'},
+    'other_user': {
+        'username': 'otheruser', 'email': 'other@example.com', 'password': 'otherpass123',
+    },
+    'admin_user': {
+        'username': 'admin', 'email': 'admin@example.com', 'password': 'adminpass123',
+        'is_staff': True, 'is_superuser': True,
+    },
+}
+
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Create the users every test shares once, right after the test database."""
+    with django_db_blocker.unblock():
+        for fields in SESSION_USERS.values():
+            User.objects.create_user(**fields)
+
+
+def session_user(name):
+    fields = SESSION_USERS[name]
+    try:
+        return User.objects.get(username=fields['username'])
+    except User.DoesNotExist:
+        # A django_db(transaction=True) test flushed the database
+        return User.objects.create_user(**fields)
 
 
 @pytest.fixture
-def admin_user(db):
-    """Create a test admin user."""
-    return User.objects.create_superuser(
-        username='admin',
-        email='admin@example.com',
-        password='adminpass123'
-    )
+def user(db):
+    """The test user."""
+    return session_user('user')
 
 
 @pytest.fixture
-def api_client():
-    """Create an API client for testing."""
-    from rest_framework.test import APIClient
-    return APIClient()
+def other_user(db):
+    """A second user, whose data the test user must not see."""
+    return session_user('other_user')
 
 
 @pytest.fixture
-def authenticated_client(api_client, user):
-    """Create an authenticated API client."""
-    api_client.force_authenticate(user=user)
-    return api_client
+def admin_user(db):
+    """The test admin user."""
+    return session_user('admin_user')
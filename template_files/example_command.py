@@ -1,20 +1,107 @@
 """
-Example management command for ${app_name}.
+Example management command for ${app_name}: process a table in batches.
+
+Rows are read in primary-key order, ``--batch-size`` at a time, with keyset
+pagination (``pk > last_pk``) instead of OFFSET or ``Model.objects.all()``,
+so memory stays flat and every batch is an indexed range scan. Each batch
+is committed in its own transaction, and the last committed id is
+reported, so an interrupted run continues with ``--resume-from``.
+``--workers`` splits the id space into disjoint ranges and processes them
+in a process pool.
+
+Put your logic in ``process_batch()``. It may see a batch again after a
+resume, so keep it idempotent.
 
 Usage:
-    python manage.py example_command [options]
+    python manage.py example_command [--model LABEL] [--batch-size N] \\
+        [--resume-from ID] [--workers N]
+
+``--model`` is required until DEFAULT_MODEL names one of your models.
 """
 from __future__ import annotations
 
-from typing import Any
-
-from django.core.management.base import BaseCommand, CommandParser
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections, models, transaction
+from django.db.models import Max, Min
+
+
+# The model processed when --model isn't given (None: --model is required)
+DEFAULT_MODEL: str | None = ${batch_model}
+
+# Ranges handed to each worker, so progress is reported as they finish
+RANGES_PER_WORKER = 4
+
+
+def process_batch(rows: list[models.Model]) -> None:
+    """
+    Process one batch of rows, inside the batch's transaction.
+
+    Args:
+        rows: Up to --batch-size rows, in primary-key order
+    """
+    # Add your processing logic here, e.g. set fields on the rows and
+    # save them with one bulk_update(rows, [...])
+
+
+def process_range(
+    model_label: str,
+    after: int,
+    last: int,
+    batch_size: int,
+    on_batch: Callable[[int, int], None] | None = None,
+) -> tuple[int, int]:
+    """
+    Process the rows with ``after < pk <= last``, one committed batch at a time.
+
+    Args:
+        model_label: The model, as "app_label.ModelName"
+        after: Process rows after this id
+        last: Process rows up to and including this id
+        batch_size: Rows per batch and transaction
+        on_batch: Called with (rows in the batch, last id) after each commit
+
+    Returns:
+        The number of rows processed and the last id processed
+    """
+    queryset = apps.get_model(model_label)._default_manager.order_by('pk')
+    processed = 0
+    while True:
+        with transaction.atomic():
+            batch = queryset.filter(pk__gt=after, pk__lte=last)[:batch_size]
+            rows = list(batch.iterator(chunk_size=batch_size))
+            if not rows:
+                return processed, after
+            process_batch(rows)
+        processed += len(rows)
+        after = rows[-1].pk
+        if on_batch:
+            on_batch(len(rows), after)
+
+
+def split_range(after: int, last: int, count: int) -> list[tuple[int, int]]:
+    """
+    Split the ids ``after < pk <= last`` into at most ``count`` disjoint ``(after, last)`` ranges.
+    """
+    step = max(-(-(last - after) // count), 1)
+    return [(start, min(start + step, last)) for start in range(after, last, step)]
+
+
+def init_worker() -> None:
+    # Spawned workers (the default on macOS and Windows) start without Django set up
+    if not apps.ready:
+        django.setup()
 
 
 class Command(BaseCommand):
-    """Example management command with modern patterns."""
+    """Process every row of a model in resumable, committed batches."""
 
-    help = 'Example management command for ${app_name}'
+    help = 'Process a table of ${app_name} in primary-key batches'
 
     def add_arguments(self, parser: CommandParser) -> None:
         """
@@ -24,14 +111,30 @@ class Command(BaseCommand):
             parser: The argument parser
         """
         parser.add_argument(
-            '--example-arg',
-            type=str,
-            help='Example string argument',
+            '--model',
+            default=DEFAULT_MODEL,
+            required=DEFAULT_MODEL is None,
+            help='Model to process, as app_label.ModelName'
+                 + (' (default: %(default)s)' if DEFAULT_MODEL else ''),
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows read and committed per batch (default: 1000)',
+        )
+        parser.add_argument(
+            '--resume-from',
+            type=int,
+            default=None,
+            help='Only process rows with a greater id, '
+                 'e.g. the last id an interrupted run reported',
         )
         parser.add_argument(
-            '--verbose',
-            action='store_true',
-            help='Enable verbose output',
+            '--workers',
+            type=int,
+            default=1,
+            help='Processes working on disjoint id ranges (default: 1)',
         )
 
     def handle(self, *args: Any, **options: Any) -> None:
@@ -42,33 +145,91 @@ class Command(BaseCommand):
             *args: Positional arguments
             **options: Command options
         """
-        verbose = options.get('verbose', False)
-        example_arg = options.get('example_arg')
-
-        if verbose:
-            self.stdout.write(
-                self.style.SUCCESS('Starting ${app_name} example command...')
+        if options['batch_size'] < 1 or options['workers'] < 1:
+            raise CommandError('--batch-size and --workers must be at least 1')
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError) as exc:
+            raise CommandError(f'Unknown model {options["model"]!r}') from exc
+
+        queryset = model._default_manager.all()
+        if options['resume_from'] is not None:
+            queryset = queryset.filter(pk__gt=options['resume_from'])
+        bounds = queryset.aggregate(first=Min('pk'), last=Max('pk'))
+        if bounds['first'] is None:
+            self.stdout.write('Nothing to process.')
+            return
+        if not isinstance(bounds['first'], int):
+            raise CommandError(
+                f'{model._meta.label} needs an integer primary key to be processed in id ranges'
             )
 
-        # Your command logic here
-        if example_arg:
-            self.stdout.write(f'Received argument: {example_arg}')
-
-        # Example: Process some data
-        self.process_data(verbose=verbose)
-
-        if verbose:
-            self.stdout.write(
-                self.style.SUCCESS('Command completed successfully!')
+        self.model_label = model._meta.label
+        self.verbosity = options['verbosity']
+        self.started = time.monotonic()
+        self.processed = 0
+        after = bounds['first'] - 1
+        if options['workers'] == 1:
+            processed, last_id = self.run_serial(after, bounds['last'], options['batch_size'])
+        else:
+            processed, last_id = self.run_parallel(
+                after, bounds['last'], options['batch_size'], options['workers']
             )
 
-    def process_data(self, verbose: bool = False) -> None:
-        """
-        Example method to process data.
+        elapsed = time.monotonic() - self.started
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {processed} {model._meta.verbose_name_plural} up to id {last_id} '
+            f'in {elapsed:.1f}s ({processed / max(elapsed, 1e-9):.0f} rows/s).'
+        ))
+
+    def report(self, rows: int, progress: str) -> None:
+        self.processed += rows
+        if self.verbosity >= 1:
+            elapsed = time.monotonic() - self.started
+            rate = self.processed / max(elapsed, 1e-9)
+            self.stdout.write(f'{self.processed} rows, {progress}, {rate:.0f} rows/s')
+
+    def failed(self, resume_from: int) -> CommandError:
+        return CommandError(
+            f'Stopped after {self.processed} rows; '
+            f'rerun with --resume-from {resume_from} to continue'
+        )
 
-        Args:
-            verbose: Whether to print verbose output
-        """
-        # Add your processing logic here
-        if verbose:
-            self.stdout.write('Processing data...')
+    def run_serial(self, after: int, last: int, batch_size: int) -> tuple[int, int]:
+        committed = after
+
+        def on_batch(rows: int, last_id: int) -> None:
+            nonlocal committed
+            committed = last_id
+            self.report(rows, f'up to id {last_id}')
+
+        try:
+            processed, _ = process_range(self.model_label, after, last, batch_size, on_batch)
+        except Exception as exc:
+            raise self.failed(committed) from exc
+        return processed, committed
+
+    def run_parallel(self, after: int, last: int, batch_size: int, workers: int) -> tuple[int, int]:
+        ranges = split_range(after, last, workers * RANGES_PER_WORKER)
+        done = set()
+        processed = 0
+        # Forked workers must not share the parent's database connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            futures = {
+                executor.submit(process_range, self.model_label, start, stop, batch_size): index
+                for index, (start, stop) in enumerate(ranges)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    rows, _ = future.result()
+                except Exception as exc:
+                    executor.shutdown(cancel_futures=True)
+                    # Everything before the first unfinished range is committed
+                    resume_from = ranges[min(set(range(len(ranges))) - done)][0]
+                    raise self.failed(resume_from) from exc
+                done.add(index)
+                processed += rows
+                self.report(rows, f'ids {ranges[index][0] + 1}-{ranges[index][1]} done')
+        return processed, last
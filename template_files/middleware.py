@@ -0,0 +1,128 @@
+"""
+Per-request SQL and latency instrumentation for ${app_name}.
+
+Add the middleware near the top of the project's MIDDLEWARE, so its timing
+covers the middleware below it:
+
+    MIDDLEWARE = [
+        '${module_name}.middleware.QueryInstrumentationMiddleware',
+        ...
+    ]
+
+Every response gets a ``Server-Timing`` header (shown in the browser's
+network panel) with the SQL time, query count and total time, and a log
+record on the ``${module_name}.requests`` logger whose ``extra`` fields are
+ready for a JSON log formatter. Requests running more queries than the
+``QUERY_BUDGET`` setting are logged as warnings.
+
+Queries run while a streaming response is being sent happen after the
+middleware returns, so they aren't counted.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import ExitStack
+from typing import Any, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+
+logger = logging.getLogger('${module_name}.requests')
+
+
+class QueryStats:
+    """Counts and times the SQL queries it wraps (a ``connection.execute_wrapper``)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]
+    ) -> Any:
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Records the SQL count, SQL time and total time of every request.
+
+    The stats are also kept on ``response.query_stats``, so tests can check
+    them. In front of async views it runs as async middleware, so they stay
+    on the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if self.async_mode:
+            return self.__acall__(request)
+        stats = QueryStats()
+        started = time.perf_counter()
+        with self.instrumented(stats):
+            response = self.get_response(request)
+        return self.record(request, response, stats, time.perf_counter() - started)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        stats = QueryStats()
+        started = time.perf_counter()
+        # Connections are per thread: wrap the ones of the thread the async
+        # ORM runs the request's queries in
+        instrumented = await sync_to_async(self.instrumented)(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(instrumented.close)()
+        return self.record(request, response, stats, time.perf_counter() - started)
+
+    @staticmethod
+    def instrumented(stats: QueryStats) -> ExitStack:
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        return stack
+
+    def record(
+        self, request: HttpRequest, response: HttpResponse, stats: QueryStats, total: float
+    ) -> HttpResponse:
+        response.query_stats = stats
+        response['Server-Timing'] = (
+            f'sql;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+            f'total;dur={total * 1000:.1f}'
+        )
+
+        budget = getattr(settings, 'QUERY_BUDGET', None)
+        over_budget = budget is not None and stats.count > budget
+        logger.log(
+            logging.WARNING if over_budget else logging.INFO,
+            '%s %s %s: %d queries (budget %s), %.1f ms SQL, %.1f ms total',
+            request.method, request.path, response.status_code, stats.count, budget,
+            stats.duration * 1000, total * 1000,
+            extra={
+                'http_method': request.method,
+                'path': request.path,
+                'status_code': response.status_code,
+                'sql_count': stats.count,
+                'sql_ms': round(stats.duration * 1000, 3),
+                'total_ms': round(total * 1000, 3),
+                'query_budget': budget,
+                'over_budget': over_budget,
+            },
+        )
+        return response
@@ -38,4 +38,5 @@ class ExampleModel(models.Model):
         ]
 
     def __str__(self) -> str:
-        return f"{self.name} ({self.user.username})"
+        # user_id, not user.username: rendering a list must not query per row
+        return f"{self.name} (user {self.user_id})"
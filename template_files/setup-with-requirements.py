@@ -33,5 +33,5 @@ setup(
     ],
     install_requires=[
 $install_requires
-    ]
+    ],
 )
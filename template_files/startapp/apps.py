@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ${camel_case_app_name}Config(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = '${module_name}'
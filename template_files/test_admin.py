@@ -0,0 +1,78 @@
+"""
+Tests for ${app_name}'s admin.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ${app_name}.admin import EstimatedCountPaginator
+from ${app_name}.models import ExampleModel
+
+
+pytestmark = [pytest.mark.django_db, pytest.mark.urls('tests.urls')]
+
+CHANGELIST = 'admin:${app_name}_examplemodel_changelist'
+CHANGE_FORM = 'admin:${app_name}_examplemodel_change'
+
+
+def add_examples(user, count):
+    ExampleModel.objects.bulk_create(
+        ExampleModel(user=user, name=f'Example {i}') for i in range(count)
+    )
+
+
+def changelist_queries(client, **params):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse(CHANGELIST), params)
+    assert response.status_code == 200
+    return [query['sql'] for query in queries]
+
+
+class TestExampleModelAdmin:
+    """Tests for ExampleModelAdmin."""
+
+    def test_changelist_query_count(self, admin_client, user, admin_user):
+        """Test that the changelist's query count doesn't grow with its rows."""
+        add_examples(user, 5)
+        few = changelist_queries(admin_client)
+
+        add_examples(admin_user, 50)
+        many = changelist_queries(admin_client)
+
+        assert len(many) == len(few)
+
+    @pytest.mark.parametrize('params', [{}, {'q': 'Example 1'}])
+    def test_changelist_counts_once(self, admin_client, user, params):
+        """Test that only the changelist's own rows are counted, not the whole table too."""
+        add_examples(user, 5)
+
+        queries = changelist_queries(admin_client, **params)
+
+        assert sum('COUNT(' in sql.upper() for sql in queries) == 1
+
+    def test_change_form_has_no_user_select(self, admin_client, user):
+        """Test that the user field doesn't list every user."""
+        example = ExampleModel.objects.create(user=user, name='Example')
+
+        response = admin_client.get(reverse(CHANGE_FORM, args=[example.pk]))
+
+        assert response.status_code == 200
+        assert 'vForeignKeyRawIdAdminField' in response.content.decode()
+
+
+class TestEstimatedCountPaginator:
+    """Tests for EstimatedCountPaginator."""
+
+    def test_counts_exactly_without_postgresql_statistics(self, user):
+        """Test that other databases (and small tables) get an exact count."""
+        add_examples(user, 3)
+
+        assert EstimatedCountPaginator(ExampleModel.objects.all(), 2).count == 3
+
+    def test_counts_filtered_querysets_exactly(self, user, admin_user):
+        """Test that a filtered queryset is never estimated."""
+        add_examples(user, 3)
+        add_examples(admin_user, 2)
+
+        assert EstimatedCountPaginator(ExampleModel.objects.filter(user=user), 2).count == 3
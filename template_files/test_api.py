@@ -1,6 +1,8 @@
 """
 Tests for ${app_name} API views.
 """
+import json
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
@@ -16,7 +18,9 @@ class TestExampleModelViewSet:
         """Test that listing examples requires authentication."""
         url = reverse('example-list')
         response = api_client.get(url)
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        # SessionAuthentication, the tests' only authenticator, sends no
+        # WWW-Authenticate challenge, so DRF answers 403 rather than 401
+        assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_list_examples(self, authenticated_client, user):
         """Test listing examples for authenticated user."""
@@ -28,7 +32,7 @@ class TestExampleModelViewSet:
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
 
     def test_create_example(self, authenticated_client, user):
         """Test creating an example via API."""
@@ -46,17 +50,8 @@ class TestExampleModelViewSet:
         # Verify it was created in the database
         assert ExampleModel.objects.filter(name='New Example').exists()
 
-    def test_user_scoping(self, api_client, user):
+    def test_user_scoping(self, api_client, user, other_user):
         """Test that users can only see their own examples."""
-        # Create another user
-        from django.contrib.auth import get_user_model
-        User = get_user_model()
-        other_user = User.objects.create_user(
-            username='otheruser',
-            email='other@example.com',
-            password='otherpass123'
-        )
-
         # Create examples for both users
         ExampleModel.objects.create(user=user, name='User 1 Example')
         ExampleModel.objects.create(user=other_user, name='User 2 Example')
@@ -68,8 +63,8 @@ class TestExampleModelViewSet:
 
         # Should only see own example
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]['name'] == 'User 1 Example'
+        assert len(response.data['results']) == 1
+        assert response.data['results'][0]['name'] == 'User 1 Example'
 
     def test_update_example(self, authenticated_client, user):
         """Test updating an example."""
@@ -100,3 +95,127 @@ class TestExampleModelViewSet:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not ExampleModel.objects.filter(pk=example.pk).exists()
+
+    def test_list_is_cursor_paginated(self, authenticated_client, user):
+        """Test that pages follow each other without gaps or repeats."""
+        ExampleModel.objects.bulk_create(
+            ExampleModel(user=user, name=f'Example {i}') for i in range(7)
+        )
+
+        url = reverse('example-list')
+        response = authenticated_client.get(url, {'page_size': 5})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 5
+        assert 'count' not in response.data
+        assert response.data['next'] is not None
+
+        next_page = authenticated_client.get(response.data['next'])
+        names = [item['name'] for item in response.data['results'] + next_page.data['results']]
+        assert sorted(names) == sorted(f'Example {i}' for i in range(7))
+        assert next_page.data['next'] is None
+
+    @pytest.mark.parametrize('rows', [1, 50])
+    def test_list_query_count_is_constant(
+        self, authenticated_client, user, django_assert_num_queries, rows
+    ):
+        """Test that listing takes one query however many rows there are (no N+1)."""
+        ExampleModel.objects.bulk_create(
+            ExampleModel(user=user, name=f'Example {i}') for i in range(rows)
+        )
+
+        url = reverse('example-list')
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(url)
+
+        assert len(response.data['results']) == rows
+
+    def test_retrieve_query_count(self, authenticated_client, user, django_assert_num_queries):
+        """Test that retrieving an example takes a single query."""
+        example = ExampleModel.objects.create(user=user, name='Example')
+
+        url = reverse('example-detail', kwargs={'pk': example.pk})
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(url)
+
+        assert response.data['user'] == user.id
+
+
+@pytest.mark.django_db
+class TestExampleApiView:
+    """Tests for the function-based example API view."""
+
+    def test_count_and_results_in_one_query(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Test that the count doesn't cost a second query."""
+        ExampleModel.objects.bulk_create(
+            ExampleModel(user=user, name=f'Example {i}') for i in range(3)
+        )
+
+        url = reverse('custom-example')
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        assert len(response.data['results']) == 3
+
+
+@pytest.mark.django_db
+class TestExampleStreamView:
+    """Tests for the streaming example API view."""
+
+    rows = 5000
+
+    @pytest.fixture
+    def many_examples(self, user):
+        ExampleModel.objects.bulk_create(
+            (ExampleModel(user=user, name=f'Example {i}') for i in range(self.rows)),
+            batch_size=1000,
+        )
+
+    def test_stream_requires_authentication(self, api_client):
+        """Test that streaming requires authentication."""
+        response = api_client.get(reverse('custom-example-stream'))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_stream_json(self, authenticated_client, many_examples, django_assert_num_queries):
+        """Test that a large result set streams as one JSON array, from one query."""
+        response = authenticated_client.get(reverse('custom-example-stream'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'] == 'application/json'
+
+        with django_assert_num_queries(1):
+            chunks = list(response.streaming_content)
+
+        # Written chunk by chunk, never as one body
+        assert len(chunks) > 2
+        examples = json.loads(b''.join(chunks))
+        assert len(examples) == self.rows
+        names = {example['name'] for example in examples}
+        assert names == {f'Example {i}' for i in range(self.rows)}
+
+    def test_stream_ndjson(self, authenticated_client, many_examples):
+        """Test that ?format=ndjson streams one JSON object per line."""
+        response = authenticated_client.get(reverse('custom-example-stream'), {'format': 'ndjson'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        assert len(lines) == self.rows
+        assert all(json.loads(line)['name'].startswith('Example ') for line in lines)
+
+    def test_stream_empty(self, authenticated_client):
+        """Test that a user without examples gets an empty array."""
+        response = authenticated_client.get(reverse('custom-example-stream'))
+        assert json.loads(b''.join(response.streaming_content)) == []
+
+    def test_stream_user_scoping(self, api_client, other_user, many_examples):
+        """Test that other users' examples aren't streamed."""
+        ExampleModel.objects.create(user=other_user, name='Other Example')
+
+        api_client.force_authenticate(user=other_user)
+        response = api_client.get(reverse('custom-example-stream'), {'format': 'ndjson'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line)['name'] for line in lines] == ['Other Example']
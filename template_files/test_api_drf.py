@@ -0,0 +1,87 @@
+"""
+Tests for ${app_name}'s cached OpenAPI schema and its build_${module_name}_schema command.
+"""
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from ${module_name} import api_views
+from ${module_name}.api_views import FilteredSchemaGenerator
+from ${module_name}.serializers import ${app_name_capitalized}Serializer
+
+# What build_${module_name}_schema saves for the default API version and language
+SCHEMA_FILE = '${module_name}-default-en-us.json'
+APP_PATHS = ['/api/${app_name_lowercase}/']
+
+
+@pytest.fixture(autouse=True)
+def serializer_model(monkeypatch):
+    """Stand in a model for the scaffold serializer's, until it has one."""
+    if ${app_name_capitalized}Serializer.Meta.model is None:
+        monkeypatch.setattr(${app_name_capitalized}Serializer.Meta, 'model', get_user_model())
+
+
+@pytest.fixture(autouse=True)
+def schema_cache_dir(settings, tmp_path):
+    """Persist schemas to a fresh directory, and start with an empty per-process cache."""
+    settings.API_SCHEMA_CACHE_DIR = str(tmp_path)
+    api_views._schemas.clear()
+    yield tmp_path
+    api_views._schemas.clear()
+
+
+def get_schema(api_client):
+    response = api_client.get(reverse('api-schema'), {'format': 'json'})
+    assert response.status_code == 200
+    return json.loads(response.content)
+
+
+def not_built(*args, **kwargs):
+    raise AssertionError('The schema should not have been built')
+
+
+class TestBuildSchemaCommand:
+    """Tests for the build_${module_name}_schema management command."""
+
+    def test_writes_schema_file(self, schema_cache_dir):
+        """Test that the command saves just this app's schema for the default language."""
+        call_command('build_${module_name}_schema')
+
+        schema = json.loads((schema_cache_dir / SCHEMA_FILE).read_text())
+        assert list(schema['paths']) == APP_PATHS
+
+    def test_requires_cache_dir(self, settings):
+        """Test that the command refuses to run without API_SCHEMA_CACHE_DIR."""
+        settings.API_SCHEMA_CACHE_DIR = None
+
+        with pytest.raises(CommandError):
+            call_command('build_${module_name}_schema')
+
+
+class TestCachedSchemaView:
+    """Tests for CustomSpectacularAPIView serving the cached schema."""
+
+    def test_miss_serves_prebuilt_schema(self, api_client, schema_cache_dir, monkeypatch):
+        """Test that a cache miss loads the file the command saved instead of building."""
+        call_command('build_${module_name}_schema')
+        prebuilt = json.loads((schema_cache_dir / SCHEMA_FILE).read_text())
+        prebuilt['info']['title'] = 'Prebuilt'
+        (schema_cache_dir / SCHEMA_FILE).write_text(json.dumps(prebuilt))
+        monkeypatch.setattr(FilteredSchemaGenerator, 'build_schema', not_built)
+
+        assert get_schema(api_client) == prebuilt
+
+    def test_miss_without_file_builds_schema(self, api_client):
+        """Test that a cache miss with no prebuilt file builds just this app's schema."""
+        assert list(get_schema(api_client)['paths']) == APP_PATHS
+
+    def test_hit_serves_cached_schema(self, api_client, schema_cache_dir, monkeypatch):
+        """Test that a cache hit neither builds the schema nor reads the file again."""
+        first = get_schema(api_client)
+        (schema_cache_dir / SCHEMA_FILE).write_text('{}')
+        monkeypatch.setattr(FilteredSchemaGenerator, 'build_schema', not_built)
+
+        assert get_schema(api_client) == first
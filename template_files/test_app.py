@@ -0,0 +1,17 @@
+"""
+Smoke tests for ${app_name}: it loads, and its migrations match its models.
+"""
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+
+
+def test_app_is_installed():
+    """Test that the test settings install the app."""
+    assert apps.is_installed('${app_name}')
+
+
+@pytest.mark.django_db
+def test_migrations_are_up_to_date():
+    """Test that no model change is missing a migration."""
+    call_command('makemigrations', '${app_name}', '--check', '--dry-run', verbosity=0)
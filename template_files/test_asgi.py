@@ -0,0 +1,10 @@
+"""
+ASGI application for ${app_name}'s tests.
+"""
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings_asgi')
+
+application = get_asgi_application()
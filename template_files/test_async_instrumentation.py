@@ -0,0 +1,58 @@
+"""
+Tests for QueryInstrumentationMiddleware in front of ${app_name}'s async views.
+"""
+import asyncio
+
+import pytest
+from asgiref.sync import ThreadSensitiveContext, iscoroutinefunction
+from django.urls import reverse
+
+from ${app_name}.middleware import QueryInstrumentationMiddleware
+from ${app_name}.models import ExampleModel
+
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+async def async_view(request):
+    pass
+
+
+def sync_view(request):
+    pass
+
+
+def test_runs_in_the_handlers_mode():
+    """Test that the middleware is async in front of async handlers, and sync otherwise."""
+    assert iscoroutinefunction(QueryInstrumentationMiddleware(async_view))
+    assert not iscoroutinefunction(QueryInstrumentationMiddleware(sync_view))
+
+
+@pytest.mark.asyncio
+async def test_async_view_queries_are_counted(async_client, user):
+    """Test that an async view's queries are counted and reported."""
+    await ExampleModel.objects.acreate(user=user, name='Example')
+    await async_client.aforce_login(user)
+
+    response = await async_client.get(reverse('async-examples-count'))
+
+    assert response.json() == {'count': 1}
+    # The session, the user and the COUNT
+    assert response.query_stats.count == 3
+    assert 'desc="3 queries"' in response['Server-Timing']
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_counted_apart(async_client, user):
+    """Test that requests in flight at the same time don't share their stats."""
+    await async_client.aforce_login(user)
+
+    async def get(url):
+        # Each request gets its own thread for database work, as under ASGIHandler
+        async with ThreadSensitiveContext():
+            return await async_client.get(url)
+
+    url = reverse('async-examples-count')
+    responses = await asyncio.gather(*(get(url) for _ in range(10)))
+
+    assert [response.query_stats.count for response in responses] == [3] * 10
@@ -0,0 +1,178 @@
+"""
+Tests for ${app_name}'s async views.
+"""
+import asyncio
+import json
+
+import pytest
+from asgiref.testing import ApplicationCommunicator
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils.decorators import async_only_middleware
+
+from ${app_name}.async_views import ExampleModelAsyncView, example_count_view
+from ${app_name}.models import ExampleModel
+
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@async_only_middleware
+def bearer_token_middleware(get_response):
+    """Log in ``Authorization: Bearer <username>``, as a token middleware would."""
+    async def middleware(request):
+        scheme, _, username = request.headers.get('Authorization', '').partition(' ')
+        if scheme == 'Bearer':
+            user = await get_user_model().objects.aget(username=username)
+
+            async def auser():
+                return user
+
+            request.user, request.auser = user, auser
+        return await get_response(request)
+    return middleware
+
+
+@pytest.fixture
+def csrf_client():
+    """An async client that, like a browser, gets no CSRF exemption."""
+    return AsyncClient(enforce_csrf_checks=True)
+
+
+def test_views_are_async():
+    """Test that ASGI servers can run the views on the event loop."""
+    assert ExampleModelAsyncView.view_is_async
+    assert asyncio.iscoroutinefunction(example_count_view)
+
+
+@pytest.mark.asyncio
+async def test_list_requires_authentication(async_client):
+    """Test that listing examples requires authentication."""
+    response = await async_client.get(reverse('async-examples'))
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_list_examples(async_client, user):
+    """Test listing the user's examples, newest first."""
+    for i in range(3):
+        await ExampleModel.objects.acreate(user=user, name=f'Example {i}')
+    await async_client.aforce_login(user)
+
+    response = await async_client.get(reverse('async-examples'), {'limit': 2})
+
+    assert response.status_code == 200
+    assert [item['name'] for item in response.json()['results']] == ['Example 2', 'Example 1']
+
+
+@pytest.mark.asyncio
+async def test_create_example(async_client, user):
+    """Test creating an example for the requesting user."""
+    await async_client.aforce_login(user)
+
+    response = await async_client.post(
+        reverse('async-examples'),
+        json.dumps({'name': 'Async Example'}),
+        content_type='application/json',
+    )
+
+    assert response.status_code == 201
+    assert response.json()['user'] == user.pk
+    assert await ExampleModel.objects.filter(user=user, name='Async Example').aexists()
+
+
+@pytest.mark.asyncio
+async def test_create_with_token_needs_no_csrf_token(csrf_client, user, settings):
+    """Test that a client authenticated only by its Authorization header can create."""
+    settings.MIDDLEWARE = [*settings.MIDDLEWARE, f'{__name__}.bearer_token_middleware']
+
+    response = await csrf_client.post(
+        reverse('async-examples'),
+        json.dumps({'name': 'Token Example'}),
+        content_type='application/json',
+        headers={'Authorization': f'Bearer {user.username}'},
+    )
+
+    assert response.status_code == 201
+    assert response.json()['user'] == user.pk
+
+
+@pytest.mark.asyncio
+async def test_create_with_session_needs_csrf_token(csrf_client, user):
+    """Test that a session-authenticated create without a CSRF token is rejected."""
+    await csrf_client.aforce_login(user)
+
+    response = await csrf_client.post(
+        reverse('async-examples'),
+        json.dumps({'name': 'Forged Example'}),
+        content_type='application/json',
+    )
+
+    assert response.status_code == 403
+    assert response.json()['detail'].startswith('CSRF Failed')
+    assert not await ExampleModel.objects.filter(name='Forged Example').aexists()
+
+
+@pytest.mark.asyncio
+async def test_create_invalid_example(async_client, user):
+    """Test that invalid data is rejected."""
+    await async_client.aforce_login(user)
+
+    response = await async_client.post(
+        reverse('async-examples'),
+        json.dumps({'description': 'No name'}),
+        content_type='application/json',
+    )
+
+    assert response.status_code == 400
+    assert 'name' in response.json()
+
+
+@pytest.mark.asyncio
+async def test_count_and_user_scoping(async_client, user, admin_user):
+    """Test that the count only includes the user's own examples."""
+    await ExampleModel.objects.acreate(user=user, name='Mine')
+    await ExampleModel.objects.acreate(user=admin_user, name='Theirs')
+    await async_client.aforce_login(user)
+
+    response = await async_client.get(reverse('async-examples-count'))
+
+    assert response.json() == {'count': 1}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests(async_client, user):
+    """Test that many requests can be in flight at once."""
+    await ExampleModel.objects.acreate(user=user, name='Example')
+    await async_client.aforce_login(user)
+
+    url = reverse('async-examples-count')
+    responses = await asyncio.gather(*(async_client.get(url) for _ in range(20)))
+
+    assert [response.json()['count'] for response in responses] == [1] * 20
+
+
+@pytest.mark.asyncio
+async def test_asgi_application():
+    """Test a request through the project's ASGI application, as an ASGI server sends it."""
+    from tests.asgi import application
+
+    communicator = ApplicationCommunicator(application, {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': reverse('async-examples-count'),
+        'query_string': b'',
+        'headers': [(b'host', b'testserver')],
+        'server': ('testserver', 80),
+    })
+    await communicator.send_input({'type': 'http.request', 'body': b''})
+    start = await communicator.receive_output(timeout=5)
+    body = await communicator.receive_output(timeout=5)
+    await communicator.wait()
+
+    assert start['status'] == 401
+    assert json.loads(body['body'])['detail']
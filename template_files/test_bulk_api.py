@@ -0,0 +1,192 @@
+"""
+Tests for ${app_name}'s bulk API endpoints.
+"""
+import pytest
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from ${app_name} import bulk_api
+from ${app_name}.bulk_api import BULK_MAX_ITEMS
+from ${app_name}.models import ExampleModel
+
+
+def count_queries(request):
+    """Run ``request()`` and return (number of queries, response)."""
+    with CaptureQueriesContext(connection) as queries:
+        response = request()
+    return len(queries), response
+
+
+def fail_second(statement):
+    """A connection.execute_wrapper() that fails the second SQL ``statement`` (e.g. 'INSERT')."""
+    seen = []
+
+    def wrapper(execute, sql, params, many, context):
+        if sql.startswith(statement):
+            seen.append(sql)
+            if len(seen) == 2:
+                raise DatabaseError(f'Second {statement} failed')
+        return execute(sql, params, many, context)
+
+    return wrapper
+
+
+@pytest.mark.django_db
+class TestBulkCreate:
+    """Tests for POST examples/bulk/."""
+
+    def test_bulk_create(self, authenticated_client, user):
+        """Test creating several examples for the requesting user."""
+        data = [{'name': f'Example {i}', 'description': 'Bulk'} for i in range(3)]
+        response = authenticated_client.post(reverse('example-bulk'), data, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [item['name'] for item in response.data] == ['Example 0', 'Example 1', 'Example 2']
+        assert all(item['user'] == user.id for item in response.data)
+        assert ExampleModel.objects.filter(user=user).count() == 3
+
+    def test_bulk_create_ignores_user_in_payload(self, authenticated_client, user, other_user):
+        """Test that objects can't be created for another user."""
+        data = [{'name': 'Sneaky', 'user': other_user.id}]
+        response = authenticated_client.post(reverse('example-bulk'), data, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert ExampleModel.objects.get(name='Sneaky').user == user
+
+    def test_bulk_create_is_all_or_nothing(self, authenticated_client):
+        """Test that one invalid item rejects the whole batch."""
+        data = [{'name': 'Valid'}, {'description': 'No name'}]
+        response = authenticated_client.post(reverse('example-bulk'), data, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not ExampleModel.objects.exists()
+
+    def test_bulk_create_rolls_back_failed_batch(self, authenticated_client, user, monkeypatch):
+        """Test that when a later INSERT fails, the earlier batches are rolled back too."""
+        monkeypatch.setattr(bulk_api, 'BULK_BATCH_SIZE', 2)
+        data = [{'name': f'Example {i}'} for i in range(4)]
+
+        with connection.execute_wrapper(fail_second('INSERT')), pytest.raises(DatabaseError):
+            authenticated_client.post(reverse('example-bulk'), data, format='json')
+
+        assert not ExampleModel.objects.filter(user=user).exists()
+
+    def test_bulk_create_limit(self, authenticated_client):
+        """Test that batches over BULK_MAX_ITEMS are rejected."""
+        data = [{'name': 'Example'}] * (BULK_MAX_ITEMS + 1)
+        response = authenticated_client.post(reverse('example-bulk'), data, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_create_query_count_is_constant(self, authenticated_client, user):
+        """Test that creating 100 examples takes as many queries as creating 1."""
+        url = reverse('example-bulk')
+        one, _ = count_queries(
+            lambda: authenticated_client.post(url, [{'name': 'One'}], format='json')
+        )
+        many, response = count_queries(lambda: authenticated_client.post(
+            url, [{'name': f'Example {i}'} for i in range(100)], format='json'))
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert many == one
+        assert ExampleModel.objects.filter(user=user).count() == 101
+
+
+@pytest.mark.django_db
+class TestBulkUpdate:
+    """Tests for PATCH examples/bulk/."""
+
+    def make_examples(self, user, count):
+        return ExampleModel.objects.bulk_create(
+            ExampleModel(user=user, name=f'Example {i}') for i in range(count)
+        )
+
+    def test_bulk_update(self, authenticated_client, user):
+        """Test updating several examples at once."""
+        examples = self.make_examples(user, 3)
+        data = [{'id': example.id, 'name': f'Renamed {example.id}'} for example in examples]
+        response = authenticated_client.patch(reverse('example-bulk'), data, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        for example in examples:
+            example.refresh_from_db()
+            assert example.name == f'Renamed {example.id}'
+            assert example.updated_at > example.created_at
+
+    def test_bulk_update_other_users_examples(self, authenticated_client, other_user):
+        """Test that another user's examples can't be updated."""
+        example, = self.make_examples(other_user, 1)
+        data = [{'id': example.id, 'name': 'Hijacked'}]
+        response = authenticated_client.patch(reverse('example-bulk'), data, format='json')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        example.refresh_from_db()
+        assert example.name == 'Example 0'
+
+    def test_bulk_update_rolls_back_failed_batch(self, authenticated_client, user, monkeypatch):
+        """Test that when a later UPDATE fails, the earlier batches are rolled back too."""
+        examples = self.make_examples(user, 4)
+        monkeypatch.setattr(bulk_api, 'BULK_BATCH_SIZE', 2)
+        data = [{'id': example.id, 'name': 'Renamed'} for example in examples]
+
+        with connection.execute_wrapper(fail_second('UPDATE')), pytest.raises(DatabaseError):
+            authenticated_client.patch(reverse('example-bulk'), data, format='json')
+
+        assert not ExampleModel.objects.filter(name='Renamed').exists()
+
+    def test_bulk_update_requires_ids(self, authenticated_client, user):
+        """Test that every item must say which example it updates."""
+        response = authenticated_client.patch(
+            reverse('example-bulk'), [{'name': 'No id'}], format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_update_query_count_is_constant(self, authenticated_client, user):
+        """Test that updating 100 examples takes as many queries as updating 1."""
+        examples = self.make_examples(user, 101)
+        url = reverse('example-bulk')
+        one, _ = count_queries(lambda: authenticated_client.patch(
+            url, [{'id': examples[0].id, 'name': 'One'}], format='json'))
+        many, response = count_queries(lambda: authenticated_client.patch(
+            url, [{'id': example.id, 'name': 'Many'} for example in examples[1:]], format='json'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert many == one
+        assert ExampleModel.objects.filter(name='Many').count() == 100
+
+
+@pytest.mark.django_db
+class TestBulkDelete:
+    """Tests for DELETE examples/bulk/."""
+
+    def test_bulk_delete(self, authenticated_client, user, other_user):
+        """Test deleting several of the user's examples, and none of anyone else's."""
+        mine = ExampleModel.objects.bulk_create(
+            ExampleModel(user=user, name=f'Mine {i}') for i in range(3)
+        )
+        theirs = ExampleModel.objects.create(user=other_user, name='Theirs')
+        ids = [example.id for example in mine[:2]] + [theirs.id]
+        response = authenticated_client.delete(reverse('example-bulk'), {'ids': ids}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'deleted': 2}
+        names = ExampleModel.objects.values_list('name', flat=True).order_by('name')
+        assert list(names) == ['Mine 2', 'Theirs']
+
+    def test_bulk_delete_query_count_is_constant(self, authenticated_client, user):
+        """Test that deleting 100 examples takes as many queries as deleting 1."""
+        examples = ExampleModel.objects.bulk_create(
+            ExampleModel(user=user, name=f'Example {i}') for i in range(101)
+        )
+        url = reverse('example-bulk')
+        one, _ = count_queries(
+            lambda: authenticated_client.delete(url, {'ids': [examples[0].id]}, format='json')
+        )
+        many, response = count_queries(lambda: authenticated_client.delete(
+            url, {'ids': [example.id for example in examples[1:]]}, format='json'))
+
+        assert response.data == {'deleted': 100}
+        assert many == one
@@ -0,0 +1,153 @@
+"""
+Tests for ${app_name}'s per-user cache and conditional GETs.
+"""
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+from ${app_name}.caching import examples_version, version_key
+from ${app_name}.models import ExampleModel
+
+
+@pytest.fixture
+def examples(user):
+    return [ExampleModel.objects.create(user=user, name=f'Example {i}') for i in range(3)]
+
+
+@pytest.fixture
+def committed(django_capture_on_commit_callbacks):
+    """Run the on-commit callbacks of what happens inside ``with committed():``."""
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+@pytest.mark.django_db
+class TestExamplesVersion:
+    """Tests for the cached per-user version."""
+
+    def test_costs_no_queries(self, user, examples, django_assert_num_queries):
+        """Test that the version is recorded on first use and never queried."""
+        assert cache.get(version_key(user.pk)) is None
+        with django_assert_num_queries(0):
+            version = examples_version(user.pk)
+            assert examples_version(user.pk) == version
+
+    def test_save_moves_forward(self, user, examples, committed):
+        """Test that saving an example moves its owner's version forward, once committed."""
+        version = examples_version(user.pk)
+        with committed():
+            examples[0].name = 'Renamed'
+            examples[0].save()
+            assert examples_version(user.pk) == version
+
+        assert examples_version(user.pk) > version
+
+    def test_delete_moves_forward(self, user, examples, committed):
+        """Test that deleting the newest example still moves the version forward."""
+        version = examples_version(user.pk)
+        with committed():
+            examples[-1].delete()
+
+        assert examples_version(user.pk) > version
+
+    def test_other_users_version_is_kept(self, user, admin_user, examples, committed):
+        """Test that changes only move the owner's version."""
+        version = examples_version(admin_user.pk)
+        with committed():
+            ExampleModel.objects.create(user=user, name='New')
+
+        assert examples_version(admin_user.pk) == version
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """Tests for ETag/Last-Modified on the ExampleModel API."""
+
+    def test_list_sends_validators(self, authenticated_client, examples):
+        """Test that lists carry ETag, Last-Modified and private caching headers."""
+        response = authenticated_client.get(reverse('example-list'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag']
+        assert response['Last-Modified']
+        assert 'private' in response['Cache-Control']
+
+    def test_unchanged_list_is_not_modified(
+        self, authenticated_client, examples, django_assert_num_queries
+    ):
+        """Test that a matching If-None-Match gets a 304 without any query."""
+        url = reverse('example-list')
+        etag = authenticated_client.get(url)['ETag']
+
+        with django_assert_num_queries(0):
+            response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_modified_since(self, authenticated_client, examples):
+        """Test that a current If-Modified-Since gets a 304."""
+        url = reverse('example-list')
+        last_modified = authenticated_client.get(url)['Last-Modified']
+
+        response = authenticated_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_deleting_newest_is_modified(self, authenticated_client, examples, committed):
+        """Test that deleting the newest example makes an old If-Modified-Since stale."""
+        url = reverse('example-list')
+        last_modified = authenticated_client.get(url)['Last-Modified']
+        with committed():
+            examples[-1].delete()
+
+        response = authenticated_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 2
+
+    def test_cached_page_costs_no_queries(
+        self, authenticated_client, examples, django_assert_num_queries
+    ):
+        """Test that repeating a list request is served from the page cache."""
+        url = reverse('example-list')
+        first = authenticated_client.get(url)
+
+        with django_assert_num_queries(0):
+            second = authenticated_client.get(url)
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+
+    def test_change_gives_new_etag(self, authenticated_client, user, examples, committed):
+        """Test that a change makes the old ETag stale and the list current."""
+        url = reverse('example-list')
+        etag = authenticated_client.get(url)['ETag']
+        with committed():
+            ExampleModel.objects.create(user=user, name='Newer')
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+        assert len(response.data['results']) == 4
+
+    def test_etag_is_per_user(self, api_client, user, admin_user, examples):
+        """Test that one user's ETag never matches another user's list."""
+        url = reverse('example-list')
+        api_client.force_authenticate(user=user)
+        etag = api_client.get(url)['ETag']
+
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'] == []
+
+    def test_retrieve_is_not_modified(self, authenticated_client, examples):
+        """Test conditional GETs of a single example."""
+        url = reverse('example-detail', kwargs={'pk': examples[0].pk})
+        etag = authenticated_client.get(url)['ETag']
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
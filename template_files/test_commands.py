@@ -0,0 +1,102 @@
+"""
+Tests for ${app_name}'s batch-processing management command.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from ${app_name}.management.commands import example_command
+from ${app_name}.models import ExampleModel
+
+
+@pytest.fixture
+def examples(user):
+    ExampleModel.objects.bulk_create(
+        ExampleModel(user=user, name=f'Example {i}') for i in range(25)
+    )
+    return list(ExampleModel.objects.order_by('pk'))
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Record the ids of every batch the command processes."""
+    seen = []
+    monkeypatch.setattr(
+        example_command, 'process_batch', lambda rows: seen.append([row.pk for row in rows])
+    )
+    return seen
+
+
+def run(*args):
+    stdout = StringIO()
+    call_command('example_command', *args, stdout=stdout)
+    return stdout.getvalue()
+
+
+@pytest.mark.parametrize('after, last, count', [(0, 25, 4), (10, 11, 4), (0, 100, 1), (0, 3, 8)])
+def test_split_range(after, last, count):
+    """Test that ranges are disjoint, ordered and cover every id."""
+    ranges = example_command.split_range(after, last, count)
+
+    assert len(ranges) <= count
+    assert ranges[0][0] == after
+    assert ranges[-1][1] == last
+    assert all(previous[1] == current[0] for previous, current in zip(ranges, ranges[1:]))
+
+
+@pytest.mark.django_db
+class TestExampleCommand:
+    """Tests for the example_command management command."""
+
+    def test_processes_every_row_in_batches(self, examples, batches):
+        """Test that rows are processed once each, in id order, batch by batch."""
+        output = run('--batch-size', '10')
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert sum(batches, []) == [example.pk for example in examples]
+        assert f'Processed 25 example models up to id {examples[-1].pk}' in output
+        assert 'rows/s' in output
+
+    def test_resume_from(self, examples, batches):
+        """Test that only rows after --resume-from are processed."""
+        run('--resume-from', str(examples[19].pk))
+
+        assert sum(batches, []) == [example.pk for example in examples[20:]]
+
+    def test_nothing_to_process(self, batches):
+        """Test an empty table."""
+        assert 'Nothing to process.' in run()
+        assert batches == []
+
+    def test_failure_reports_where_to_resume(self, examples, monkeypatch):
+        """Test that a failing batch is rolled back and the last committed id is reported."""
+        def process_batch(rows):
+            ExampleModel.objects.filter(pk__in=[row.pk for row in rows]).update(name='Processed')
+            if rows[0].pk > examples[9].pk:
+                raise RuntimeError('boom')
+        monkeypatch.setattr(example_command, 'process_batch', process_batch)
+
+        with pytest.raises(CommandError, match=f'--resume-from {examples[9].pk} '):
+            run('--batch-size', '10')
+
+        assert ExampleModel.objects.filter(name='Processed').count() == 10
+
+    def test_invalid_options(self, examples):
+        """Test that bad options are rejected before any work."""
+        with pytest.raises(CommandError):
+            run('--batch-size', '0')
+        with pytest.raises(CommandError):
+            run('--model', 'nope.Missing')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_workers_process_disjoint_ranges(examples, batches, monkeypatch):
+    """Test fanning out over id ranges (with threads, which share the in-memory test database)."""
+    monkeypatch.setattr(example_command, 'ProcessPoolExecutor', ThreadPoolExecutor)
+
+    output = run('--workers', '3', '--batch-size', '4')
+
+    assert sorted(sum(batches, [])) == [example.pk for example in examples]
+    assert 'Processed 25 example models' in output
@@ -0,0 +1,77 @@
+"""
+Tests for ${app_name}'s query instrumentation and the API's query budget.
+
+tests/settings.py installs QueryInstrumentationMiddleware and sets
+QUERY_BUDGET, so every response carries its query count.
+"""
+import logging
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from ${app_name}.models import ExampleModel
+
+
+@pytest.fixture
+def examples(user):
+    return [ExampleModel.objects.create(user=user, name=f'Example {i}') for i in range(20)]
+
+
+def detail_url(examples):
+    return reverse('example-detail', kwargs={'pk': examples[0].pk})
+
+
+@pytest.mark.django_db
+class TestQueryBudget:
+    """Every ExampleModelViewSet endpoint stays within QUERY_BUDGET."""
+
+    @pytest.mark.parametrize('method, url, data', [
+        ('get', lambda examples: reverse('example-list'), None),
+        ('get', detail_url, None),
+        ('post', lambda examples: reverse('example-list'), {'name': 'New'}),
+        ('patch', detail_url, {'name': 'Renamed'}),
+        ('delete', detail_url, None),
+    ])
+    def test_endpoint_within_budget(
+        self, authenticated_client, examples, settings, method, url, data
+    ):
+        response = getattr(authenticated_client, method)(url(examples), data, format='json')
+
+        assert status.is_success(response.status_code)
+        assert response.query_stats.count <= settings.QUERY_BUDGET
+
+
+@pytest.mark.django_db
+class TestQueryInstrumentationMiddleware:
+    """Tests for the Server-Timing header and request logs."""
+
+    def test_server_timing_header(self, authenticated_client, examples):
+        """Test that responses report their SQL and total time."""
+        response = authenticated_client.get(reverse('example-list'))
+
+        metrics = dict(metric.split(';', 1) for metric in response['Server-Timing'].split(', '))
+        assert set(metrics) == {'sql', 'total'}
+        assert f'desc="{response.query_stats.count} queries"' in metrics['sql']
+
+    def test_request_log(self, authenticated_client, examples, caplog):
+        """Test that each request is logged with structured fields."""
+        with caplog.at_level(logging.INFO, logger='${module_name}.requests'):
+            response = authenticated_client.get(reverse('example-list'))
+
+        record = caplog.records[-1]
+        assert record.levelno == logging.INFO
+        assert record.path == reverse('example-list')
+        assert record.sql_count == response.query_stats.count
+        assert record.over_budget is False
+
+    def test_over_budget_is_a_warning(self, authenticated_client, examples, caplog, settings):
+        """Test that a request over QUERY_BUDGET is flagged."""
+        settings.QUERY_BUDGET = 0
+
+        with caplog.at_level(logging.INFO, logger='${module_name}.requests'):
+            authenticated_client.get(reverse('example-list'))
+
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert record.over_budget is True
@@ -24,7 +24,7 @@ class TestExampleModel:
         assert example.id is not None
         assert example.name == 'Test Example'
         assert example.user == user
-        assert str(example) == f'Test Example ({user.username})'
+        assert str(example) == f'Test Example (user {user.id})'
 
     def test_example_ordering(self, user):
         """Test that examples are ordered by created_at (newest first)."""
@@ -11,7 +11,6 @@ INSTALLED_APPS = [
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
-    'rest_framework',
     '${app_name}',
 ]
 
@@ -26,6 +25,7 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = '${app_name}.urls'
 
+# In memory, so each pytest-xdist worker (pytest -n auto) has its own database
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -33,13 +33,17 @@ DATABASES = {
     }
 }
 
-REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.SessionAuthentication',
-    ],
-    'DEFAULT_PERMISSION_CLASSES': [
-        'rest_framework.permissions.IsAuthenticated',
-    ],
+# Password hashing is deliberately slow; tests only need it to work
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Local-memory cache, so caching behavior can be tested offline
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': '${app_name}-tests',
+    }
 }
 
 USE_TZ = True
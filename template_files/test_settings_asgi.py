@@ -0,0 +1,24 @@
+"""
+Django settings for testing ${app_name} the way an ASGI server runs it.
+
+    pytest --ds=tests.settings_asgi
+"""
+from pathlib import Path
+
+from .settings import *  # noqa: F401,F403
+
+# The app's root directory, wherever the server or pytest is started from
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+ASGI_APPLICATION = 'tests.asgi.application'
+
+# An ASGI server started with ``uvicorn tests.asgi:application`` needs a
+# database that outlives a connection (run ``django-admin migrate
+# --settings=tests.settings_asgi`` first); pytest still creates an
+# in-memory test database
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+    }
+}
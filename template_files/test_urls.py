@@ -0,0 +1,10 @@
+"""
+URLs for testing ${app_name}'s admin (see test_admin.py).
+"""
+from django.contrib import admin
+from django.urls import path
+
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+]
@@ -4,7 +4,7 @@ URL configuration for ${app_name} with OAuth2 and DRF support.
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .api_views import ExampleModelViewSet, example_api_view
+from .api_views import ExampleModelViewSet, example_api_view, example_stream_view
 
 
 # Create a router and register viewsets
@@ -17,4 +17,5 @@ urlpatterns = [
 
     # Custom API endpoints
     path('api/custom-example/', example_api_view, name='custom-example'),
+    path('api/custom-example/stream/', example_stream_view, name='custom-example-stream'),
 ]
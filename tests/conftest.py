@@ -0,0 +1,55 @@
+"""
+Fixtures for testing startreusableapp.py itself.
+
+Everything runs offline, with the stubs the benchmarks use: ``pip`` is
+replaced by benchmarks/stubs/pip, and the startapp path uses the stub
+project in benchmarks/stubs/project.
+"""
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(TESTS_DIR)
+STUBS_DIR = os.path.join(REPO_DIR, 'benchmarks', 'stubs')
+
+sys.path.insert(0, REPO_DIR)
+
+
+@pytest.fixture(autouse=True)
+def offline_env(monkeypatch):
+    """Run the stub pip, and git as a test user, from in-process runs."""
+    monkeypatch.setenv('PYTHONPATH', os.pathsep.join(filter(None, [STUBS_DIR, os.environ.get('PYTHONPATH')])))
+    for name in ('GIT_AUTHOR_NAME', 'GIT_COMMITTER_NAME'):
+        monkeypatch.setenv(name, 'Test')
+    for name in ('GIT_AUTHOR_EMAIL', 'GIT_COMMITTER_EMAIL'):
+        monkeypatch.setenv(name, 'test@example.com')
+
+
+@pytest.fixture
+def pip_runs(monkeypatch, tmp_path):
+    """A function returning the arguments of every pip run so far, one string per run."""
+    log = tmp_path / 'pip.log'
+    monkeypatch.setenv('PIP_STUB_LOG', str(log))
+    return lambda: log.read_text().splitlines() if log.exists() else []
+
+
+@pytest.fixture
+def stub_project_dir():
+    """A project whose manage.py only knows `startapp`, writing Django's stock files."""
+    return os.path.join(STUBS_DIR, 'project')
+
+
+@pytest.fixture
+def generate(tmp_path):
+    """generate() an app called ``plain`` in ``parent_dir`` (default: tmp_path), asserting it succeeds."""
+    import startreusableapp
+
+    def generate(parent_dir=tmp_path, **options):
+        options.setdefault('quiet', True)
+        result = startreusableapp.generate(startreusableapp.Config('plain', str(parent_dir), **options))
+        assert result.succeeded, result.error
+        return parent_dir / 'plain'
+
+    return generate
@@ -0,0 +1,87 @@
+"""
+Tests for the content-addressed Bootstrap asset cache.
+"""
+import zipfile
+
+import pytest
+
+import startreusableapp
+
+VERSION = '5.3.3'
+CSS = 'css/bootstrap.css'
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """A stand-in for Bootstrap's release zip."""
+    path = tmp_path / 'bootstrap-dist.zip'
+    with zipfile.ZipFile(path, 'w') as bundle:
+        for name in ('css/bootstrap.css', 'css/bootstrap.min.css',
+                     'js/bootstrap.bundle.js', 'js/bootstrap.bundle.min.js'):
+            bundle.writestr(f'bootstrap-dist/{name}', f'/* {name} */\n')
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """An empty asset cache that fails the test if it downloads anything."""
+    def download(url):
+        raise AssertionError(f'Downloaded {url}')
+
+    monkeypatch.setattr(startreusableapp, 'download', download)
+    return startreusableapp.AssetCache(str(tmp_path / 'cache'))
+
+
+def test_miss_loads_archive(cache, archive):
+    """A miss fills the cache from the archive with every dist file in it."""
+    assert not cache.has_bootstrap_file(VERSION, CSS)
+
+    assert cache.bootstrap_file(VERSION, CSS, archive) == b'/* css/bootstrap.css */\n'
+    assert cache.has_bootstrap_file(VERSION, 'js/bootstrap.bundle.min.js')
+
+
+def test_hit_needs_no_archive(cache, archive):
+    """A hit is served from the cache, without an archive or a download."""
+    cache.bootstrap_file(VERSION, CSS, archive)
+
+    assert cache.bootstrap_file(VERSION, CSS) == b'/* css/bootstrap.css */\n'
+
+
+def test_miss_downloads_without_archive(cache, monkeypatch):
+    """A miss without an archive downloads just the missing file, once."""
+    urls = []
+    monkeypatch.setattr(startreusableapp, 'download', lambda url: urls.append(url) or b'downloaded')
+
+    assert cache.bootstrap_file(VERSION, CSS) == b'downloaded'
+    assert cache.bootstrap_file(VERSION, CSS) == b'downloaded'
+    assert urls == [startreusableapp.BOOTSTRAP_URL.format(version=VERSION, name=CSS)]
+
+
+def test_corrupt_object_is_fetched_again(cache, archive):
+    """A cached file whose bytes no longer match its hash counts as a miss."""
+    cache.bootstrap_file(VERSION, CSS, archive)
+    digest = cache.read_index(VERSION)[CSS]
+    with open(cache.object_path(digest), 'wb') as file:
+        file.write(b'corrupt')
+
+    assert cache.load(digest) is None
+    assert cache.bootstrap_file(VERSION, CSS, archive) == b'/* css/bootstrap.css */\n'
+
+
+def test_corrupt_archive_is_rejected(cache, tmp_path):
+    """An archive that isn't a zip or tarball fails with a ScaffoldError."""
+    archive = tmp_path / 'bootstrap.zip'
+    archive.write_bytes(b'not an archive')
+
+    with pytest.raises(startreusableapp.ScaffoldError, match="Couldn't read Bootstrap archive"):
+        cache.bootstrap_file(VERSION, CSS, str(archive))
+
+
+def test_archive_without_file_is_rejected(cache, tmp_path):
+    """An archive without the requested dist file fails with a ScaffoldError."""
+    archive = tmp_path / 'empty.zip'
+    with zipfile.ZipFile(archive, 'w') as bundle:
+        bundle.writestr('README.md', 'Not Bootstrap')
+
+    with pytest.raises(startreusableapp.ScaffoldError, match="doesn't contain dist/css/bootstrap.css"):
+        cache.bootstrap_file(VERSION, CSS, str(archive))
@@ -0,0 +1,83 @@
+"""
+Tests for the generate() library API and batch runs.
+"""
+import json
+import sys
+
+import pytest
+
+import startreusableapp
+
+# Features that need no network or Django project
+OFFLINE = dict(builtin_skeleton=True, with_views=False, with_bootstrap=False, quiet=True)
+
+
+def test_generate_does_not_install_by_default(pip_runs, tmp_path):
+    """A Config that doesn't mention install_now never runs pip."""
+    result = startreusableapp.generate(startreusableapp.Config('plain', str(tmp_path), **OFFLINE))
+
+    assert result.succeeded, result.error
+    assert result.install is None
+    assert pip_runs() == []
+
+
+def test_generate_installs_when_asked(pip_runs, tmp_path):
+    """install_now=True installs the app with one pip run."""
+    result = startreusableapp.generate(startreusableapp.Config('plain', str(tmp_path), install_now=True, **OFFLINE))
+
+    assert result.succeeded, result.error
+    assert result.install['returncode'] == 0
+    assert len(pip_runs()) == 1
+
+
+def test_manifest_installs_every_app_with_one_pip_run(pip_runs, tmp_path):
+    """A manifest that doesn't mention install_now installs its apps together, once."""
+    manifest = tmp_path / 'apps.json'
+    manifest.write_text(json.dumps({
+        'defaults': dict(OFFLINE, parent_dir=str(tmp_path / 'apps')),
+        'apps': [{'app_name': name} for name in ('blog', 'shop', 'wiki')],
+    }))
+
+    startreusableapp.main(['--manifest', str(manifest), '--no-color'])
+
+    runs = pip_runs()
+    assert len(runs) == 1
+    assert all(name in runs[0] for name in ('blog', 'shop', 'wiki'))
+
+
+def test_dry_run_writes_nothing(pip_runs, tmp_path):
+    """--dry-run plans the app without writing a file or running pip."""
+    config = startreusableapp.Config('plain', str(tmp_path / 'apps'), dry_run=True, install_now=True, **OFFLINE)
+    result = startreusableapp.generate(config)
+
+    assert result.succeeded, result.error
+    assert not (tmp_path / 'apps').exists()
+    assert pip_runs() == []
+
+
+def test_failed_flush_leaves_no_app(tmp_path):
+    """When startapp fails halfway through the flush, no app (or staging directory) is left behind."""
+    project = tmp_path / 'project'
+    project.mkdir()
+    (project / 'manage.py').write_text('import sys\nsys.exit("startapp is broken")\n')
+    parent_dir = tmp_path / 'apps'
+
+    config = startreusableapp.Config('plain', str(parent_dir), project_dir=str(project), builtin_skeleton=False,
+                                     with_views=False, with_bootstrap=False, quiet=True)
+    result = startreusableapp.generate(config)
+
+    assert not result.succeeded
+    assert isinstance(result.error, startreusableapp.CommandError)
+    assert 'startapp' in str(result.error)
+    assert list(parent_dir.iterdir()) == []
+
+
+def test_failing_command_raises_command_error():
+    """CommandRunner reports a failing command's exit status, and keeps its result."""
+    runner = startreusableapp.CommandRunner(startreusableapp.Timings('test'), quiet=True)
+    command = [sys.executable, '-c', 'raise SystemExit(3)']
+
+    with pytest.raises(startreusableapp.CommandError, match='exit status 3'):
+        runner.run(command)
+
+    assert runner.results[-1][:2] == (command, 3)
@@ -0,0 +1,39 @@
+"""
+Tests for the git history both --git-backend choices write.
+"""
+import subprocess
+
+import pytest
+
+# Features that need no network, with files left to commit after the history
+OFFLINE = dict(with_views=True, with_bootstrap=False, with_drf=True, with_oauth=True, with_tests=True)
+
+
+def git(app, *args):
+    result = subprocess.run(['git', *args], cwd=app, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def history(app):
+    """What a backend must get right: branches, HEAD, commit trees and messages, and status."""
+    branches = git(app, 'for-each-ref', '--format=%(refname)', 'refs/heads').split()
+    return {
+        'HEAD': git(app, 'symbolic-ref', 'HEAD'),
+        'commits': {branch: git(app, 'log', '--format=%T %B', branch) for branch in branches},
+        'status': git(app, 'status', '--porcelain', '--untracked-files=all'),
+    }
+
+
+@pytest.mark.parametrize('skeleton', ['builtin', 'startapp'])
+def test_backends_write_the_same_history(generate, stub_project_dir, tmp_path, skeleton):
+    """fast-import writes the same commits, index and HEAD as separate git commands, in a sound repository."""
+    options = dict(OFFLINE, builtin_skeleton=skeleton == 'builtin', project_dir=stub_project_dir)
+    porcelain = generate(tmp_path / 'porcelain', git_backend='porcelain', **options)
+    fast_import = generate(tmp_path / 'fast-import', git_backend='fast-import', **options)
+
+    assert history(fast_import) == history(porcelain)
+    assert len(git(fast_import, 'rev-list', '--all').split()) == 2
+    assert git(fast_import, 'fsck', '--strict', '--no-progress') == ''
+    # The index's stat data is current, so nothing needs rehashing
+    assert git(fast_import, 'diff-files', '--name-only') == git(porcelain, 'diff-files', '--name-only')
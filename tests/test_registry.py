@@ -0,0 +1,48 @@
+"""
+Tests for loading, checking and rendering templates.
+"""
+import pytest
+
+import startreusableapp
+from startreusableapp import ScaffoldError, TemplateRegistry
+
+
+def test_shipped_templates_load():
+    """Every template in template_files/ compiles with known placeholders."""
+    registry = startreusableapp.template_registry()
+
+    assert 'setup.py' in registry.templates
+
+
+def test_unknown_placeholder_is_rejected():
+    """A placeholder that isn't a substitution key fails when the registry loads."""
+    with pytest.raises(ScaffoldError, match='Unknown placeholder.*app_nmae'):
+        TemplateRegistry(None, {'views.py': 'from ${app_nmae} import models\n'})
+
+
+def test_unescaped_dollar_is_rejected():
+    """A literal $ that isn't escaped as $$ fails when the registry loads."""
+    with pytest.raises(ScaffoldError, match=r'escape a literal \$ as \$\$'):
+        TemplateRegistry(None, {'price.py': "PRICE = '$5'\n"})
+
+
+def test_missing_substitution_is_rejected():
+    """Rendering without a value for one of the template's placeholders fails."""
+    registry = TemplateRegistry(None, {'example_command.py': 'MODEL = $batch_model\n'})
+
+    with pytest.raises(ScaffoldError, match="No value for placeholder 'batch_model'"):
+        registry.render('example_command.py', {})
+
+
+def test_render_substitutes_placeholders():
+    registry = TemplateRegistry(None, {'apps.py': "name = '${module_name}'  # costs $$0\n"})
+
+    assert registry.render('apps.py', {'module_name': 'blog'}) == "name = 'blog'  # costs $0\n"
+
+
+def test_replace_anchor_requires_the_anchor():
+    """An update_* helper whose anchor is gone from the template fails loudly."""
+    assert startreusableapp.replace_anchor('setup.py', 'setup(\n)', 'setup(', 'setup(name=1,') == 'setup(name=1,\n)'
+
+    with pytest.raises(ScaffoldError, match="Can't update pytest.ini"):
+        startreusableapp.replace_anchor('pytest.ini', '[pytest]\n', 'DJANGO_SETTINGS_MODULE', 'x')
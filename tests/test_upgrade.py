@@ -0,0 +1,71 @@
+"""
+Tests for upgrading an existing app in place.
+"""
+import json
+import subprocess
+
+import pytest
+
+import startreusableapp
+
+# A plain app with nothing but its app skeleton
+PLAIN = dict(
+    with_views=False, with_drf=False, with_benchmarks=False, with_instrumentation=False,
+    with_tests=False, with_mgmt_commands=False, with_precommit=False, with_ci=False,
+)
+OAUTH_AND_CACHING = PLAIN | dict(
+    with_drf=True, with_oauth=True, with_bulk_api=False, with_caching=True, with_async=False,
+)
+# The startapp files the OAuth and caching features replace
+REPLACED = ['plain/models.py', 'plain/admin.py', 'plain/apps.py']
+
+
+@pytest.fixture
+def plain(stub_project_dir):
+    """Options for a plain app from `manage.py startapp` (the stub project's)."""
+    return dict(PLAIN, project_dir=stub_project_dir)
+
+
+def test_upgrade_replaces_startapp_files(generate, plain, tmp_path):
+    """Adding features to a startapp-based app replaces its untouched startapp files."""
+    generate(tmp_path / 'upgraded', **plain)
+    upgraded = generate(tmp_path / 'upgraded', **plain | OAUTH_AND_CACHING)
+    fresh = generate(tmp_path / 'fresh', **plain | OAUTH_AND_CACHING)
+
+    for path in REPLACED:
+        assert (upgraded / path).read_text() == (fresh / path).read_text(), path
+
+
+def test_upgrade_keeps_edited_startapp_files(generate, plain):
+    """A startapp file changed by hand is left alone."""
+    app = generate(**plain)
+    (app / 'plain/models.py').write_text('# Mine\n')
+
+    generate(**plain | OAUTH_AND_CACHING)
+
+    assert (app / 'plain/models.py').read_text() == '# Mine\n'
+
+
+def test_upgrade_keeps_edited_generated_files(generate):
+    """A generated file changed by hand is left alone, while the rest of the upgrade goes ahead."""
+    app = generate(builtin_skeleton=True, **PLAIN)
+    (app / 'setup.py').write_text((app / 'setup.py').read_text() + '# Mine\n')
+
+    generate(builtin_skeleton=True, **OAUTH_AND_CACHING)
+
+    assert (app / 'setup.py').read_text().endswith('# Mine\n')
+    assert 'djangorestframework' not in (app / 'setup.py').read_text()
+    assert (app / 'plain/api_views.py').exists()
+    lock = json.loads((app / startreusableapp.LOCK_FILE).read_text())
+    assert lock['features']['with_oauth']
+
+
+def test_upgrade_twice_changes_nothing(generate):
+    """Running the same upgrade again commits nothing."""
+    app = generate(builtin_skeleton=True, **PLAIN)
+    generate(builtin_skeleton=True, **OAUTH_AND_CACHING)
+    head = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=app, capture_output=True, text=True).stdout
+
+    generate(builtin_skeleton=True, **OAUTH_AND_CACHING)
+
+    assert subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=app, capture_output=True, text=True).stdout == head